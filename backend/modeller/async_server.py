@@ -0,0 +1,246 @@
+"""asyncio tabanlı sunucu – eşzamanlı istekler tek bir vektörel çıkarımda toplanır.
+
+Kullanım:
+    pip install aiohttp
+    python async_server.py
+
+Gelen her ``/predict`` isteği kuyruğa girer. Toplayıcı ilk istekten sonra
+birkaç milisaniye (ya da toplu boyut dolana kadar) bekler, biriken metinleri
+tek ``transform`` + tek ``predict_proba`` ile skorlar ve sonuçları bekleyen
+isteklere dağıtır. Bekleme süresi ve toplu boyut, ölçülen çıkarım süresine
+göre gecikme bütçesini aşmayacak şekilde her turda yeniden hesaplanır.
+
+Cevaplar Flask API'si (pythonapi.py) ile aynıdır; önbellek, metrikler ve
+model paketi de oradan paylaşılır.
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import config
+
+try:
+    from aiohttp import web
+except ImportError:  # opsiyonel bağımlılık
+    web = None
+
+# Toplu boyut histogramı için kovalar
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+# Çıkarım süresi tahmini (üssel hareketli ortalama) için yumuşatma katsayısı
+EWMA_ALPHA = 0.2
+
+
+class MicroBatcher:
+    """İstekleri kuyrukta toplayıp ``score`` fonksiyonunu toplu çağırır.
+
+    Aynı anda tek toplu çıkarım çalışır; o sürerken gelen istekler bir
+    sonraki topluda birikir. Bir isteğin gecikmesi kabaca (çalışan toplu)
+    + bekleme + (kendi toplusu) olduğu için bekleme süresi
+    ``bütçe - 2 x tahmini toplu süresi`` ile sınırlanır. Toplu boyutu da
+    tahmini metin başı maliyete göre bütçeye sığacak kadar tutulur.
+    """
+
+    def __init__(self, score, max_batch_size: int, max_wait_ms: float, latency_budget_ms: float,
+                 batch_sizes=None) -> None:
+        self.score = score
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self.latency_budget = latency_budget_ms / 1000.0
+        self.batch_seconds = 0.0
+        self.item_seconds = 0.0
+        self.queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        # Model kodu GIL'i çoğunlukla NumPy içinde bırakır; tek thread event loop'u serbest tutar
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+        self.batch_sizes = batch_sizes
+
+    def current_limits(self) -> Tuple[float, int]:
+        """Ölçülen sürelere göre (bekleme saniyesi, en büyük toplu boyut)."""
+        wait = min(self.max_wait, max(0.0, self.latency_budget - 2 * self.batch_seconds))
+        size = self.max_batch_size
+        if self.item_seconds > 0:
+            size = min(size, max(1, int((self.latency_budget - wait) / 2 / self.item_seconds)))
+        return wait, size
+
+    async def submit(self, text):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        batch = [await self.queue.get()]
+        wait, size = self.current_limits()
+        deadline = time.monotonic() + wait
+        while len(batch) < size:
+            # Kuyrukta zaten bekleyenler beklemeden alınır
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            texts = [text for text, _ in batch]
+            started = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(self.executor, self.score, texts)
+            except Exception as e:
+                # Tek bir sorunlu metin tüm toplunun isteklerini düşürmesin
+                print(f"⚠️ Toplu çıkarım başarısız, metinler tek tek skorlanıyor: {str(e)}")
+                await self._score_individually(batch)
+                continue
+
+            elapsed = time.perf_counter() - started
+            self.batch_seconds += EWMA_ALPHA * (elapsed - self.batch_seconds)
+            self.item_seconds += EWMA_ALPHA * (elapsed / len(batch) - self.item_seconds)
+            if self.batch_sizes is not None:
+                self.batch_sizes.observe(len(batch))
+
+            for (_, future), result in zip(batch, results):
+                # İstemci bağlantıyı kestiyse future iptal edilmiş olabilir
+                if not future.done():
+                    future.set_result(result)
+
+    async def _score_individually(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Her metni ayrı skorlar; sadece hata veren metnin isteği hata alır."""
+        loop = asyncio.get_running_loop()
+        for text, future in batch:
+            if future.done():
+                continue
+            try:
+                result = (await loop.run_in_executor(self.executor, self.score, [text]))[0]
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result(result)
+
+
+async def read_json(request):
+    """İstek gövdesi JSON ise çözülmüş hali, değilse (boş / bozuk gövde) None."""
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+def create_app():
+    # Model paketi, önbellek ve metrikler Flask API'siyle ortak
+    import pythonapi
+
+    batcher_key = web.AppKey("batcher", MicroBatcher)
+    batch_sizes = pythonapi.metrics.histogram(
+        "humanorai_micro_batch_size", "Tek çıkarımda toplanan /predict isteği sayısı", buckets=BATCH_SIZE_BUCKETS)
+    app = web.Application()
+
+    async def start_batcher(app) -> None:
+        if config.LAZY_LOAD:
+            pythonapi.load_in_background()
+        batcher = MicroBatcher(pythonapi.score_texts, config.MICRO_BATCH_SIZE,
+                               config.MICRO_BATCH_WAIT_MS, config.LATENCY_BUDGET_MS, batch_sizes)
+        app[batcher_key] = batcher
+        task = asyncio.create_task(batcher.run())
+        yield
+        task.cancel()
+        batcher.executor.shutdown(wait=False)
+
+    async def predict(request):
+        started = time.perf_counter()
+        try:
+            data = await request.json()
+            response = await request.app[batcher_key].submit(data.get('text', ''))
+            pythonapi.request_seconds.observe(time.perf_counter() - started, "/predict")
+            return web.json_response(response)
+        except Exception as e:
+            print(f" SUNUCU HATASI: {str(e)}")
+            return web.json_response(pythonapi.empty_response())
+
+    async def predict_batch(request):
+        started = time.perf_counter()
+        try:
+            data = await read_json(request)
+            error = pythonapi.batch_request_error(data)
+            if error is not None:
+                return web.json_response(error, status=400)
+
+            # Zaten toplu: doğrudan çıkarım thread'inde skorlanır
+            batcher = request.app[batcher_key]
+            results = await asyncio.get_running_loop().run_in_executor(
+                batcher.executor, pythonapi.score_texts_isolated, data['texts'])
+            pythonapi.request_seconds.observe(time.perf_counter() - started, "/predict/batch")
+            return web.json_response({"results": results})
+        except Exception as e:
+            print(f" SUNUCU HATASI: {str(e)}")
+            return web.json_response({"results": []}, status=500)
+
+    async def predict_segments(request):
+        started = time.perf_counter()
+        try:
+            data = await read_json(request)
+            error = pythonapi.segments_request_error(data)
+            if error is not None:
+                return web.json_response(error, status=400)
+
+            # Parçalar tek transform ile skorlanır: mikro-toplamaya girmez, çıkarım thread'inde çalışır
+            batcher = request.app[batcher_key]
+            response = await asyncio.get_running_loop().run_in_executor(
+                batcher.executor, pythonapi.score_segments, data.get('text', ''), data.get('mode', 'sentence'))
+            pythonapi.request_seconds.observe(time.perf_counter() - started, "/predict/segments")
+            return web.json_response(response)
+        except Exception as e:
+            print(f" SUNUCU HATASI: {str(e)}")
+            return web.json_response(dict(pythonapi.empty_response(), segments=[]), status=500)
+
+    async def reload(request):
+        # Yükleme kendi thread'inde çalışır; istekler eski paketle cevaplanmaya devam eder
+        body, status = pythonapi.start_reload(request.headers.get('X-Reload-Token', ''),
+                                              request.query.get('force') == '1')
+        return web.json_response(body, status=status)
+
+    async def version(request):
+        return web.json_response(pythonapi.version_info())
+
+    async def ready(request):
+        is_ready, body = pythonapi.readiness()
+        return web.json_response(body, status=200 if is_ready else 503)
+
+    async def metrics(request):
+        return web.Response(text=pythonapi.metrics.render(), content_type="text/plain")
+
+    app.cleanup_ctx.append(start_batcher)
+    app.router.add_post('/predict', predict)
+    app.router.add_post('/predict/batch', predict_batch)
+    app.router.add_post('/predict/segments', predict_segments)
+    app.router.add_post('/reload', reload)
+    app.router.add_get('/version', version)
+    app.router.add_get('/ready', ready)
+    app.router.add_get('/metrics', metrics)
+    return app
+
+
+def main() -> None:
+    if web is None:
+        print("❌ Async sunucu için aiohttp kurulmalı:  pip install aiohttp")
+        sys.exit(1)
+
+    host, _, port = config.BIND.rpartition(":")
+    print(f"🚀 aiohttp: {config.BIND} | toplu en fazla {config.MICRO_BATCH_SIZE}, "
+          f"bekleme {config.MICRO_BATCH_WAIT_MS} ms, bütçe {config.LATENCY_BUDGET_MS} ms")
+    web.run_app(create_app(), host=host or "127.0.0.1", port=int(port), print=None)
+
+
+if __name__ == "__main__":
+    main()
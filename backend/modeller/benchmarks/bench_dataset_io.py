@@ -0,0 +1,95 @@
+"""Eğitim verisini CSV ve Parquet'ten okuma süresi, dosya boyutu ve eşdeğerlik kontrolü.
+
+Kullanım (backend/modeller dizininde):
+    python benchmarks/bench_dataset_io.py
+    python benchmarks/bench_dataset_io.py --scale 20 --output dataset_io.json
+
+Veri seti geçici dizinde ``--scale`` kez çoğaltılıp iki formatta yazılır.
+model.py'nin okuduğu sütunlar (cleaned_text, label) iki formattan da aynı
+gelmelidir (fark varsa çıkış kodu 1). Ardından tüm tablo, eğitim sütunları
+ve akış modundaki gibi parça parça okuma süreleri raporlanır.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Dict, List
+
+import pandas as pd
+
+from common import (DEFAULT_DATASET, compare_results, environment, exit_on_regression, load_texts, save_results,
+                    time_call)
+from dataset_io import iter_frames, read_frame, write_frame
+
+TRAINING_COLUMNS = ["cleaned_text", "label"]
+
+
+def build_frame(dataset_path: str, scale: int) -> pd.DataFrame:
+    """Gerçek veri (yoksa sentetik metinler) ``scale`` kez çoğaltılır."""
+    if os.path.exists(dataset_path):
+        frame = read_frame(dataset_path)
+    else:
+        texts = load_texts(dataset_path, 3000, 1500, seed=0)
+        frame = pd.DataFrame({"abstract_text": texts, "source_url": "https://arxiv.org/abs/0000.00000",
+                              "license_info": "arXiv", "label": ["Human", "AI"] * (len(texts) // 2),
+                              "cleaned_text": texts})
+    return pd.concat([frame] * scale, ignore_index=True)
+
+
+def check_equivalence(csv_path: str, parquet_path: str) -> bool:
+    from_csv = read_frame(csv_path, TRAINING_COLUMNS)
+    from_parquet = read_frame(parquet_path, TRAINING_COLUMNS)
+    for column in TRAINING_COLUMNS:
+        if from_csv[column].astype(object).tolist() != from_parquet[column].astype(object).tolist():
+            print(f"❌ {column} sütunu CSV ve Parquet'te aynı değil!")
+            return False
+    print(f"✅ Eşdeğerlik: {len(from_csv)} satır, eğitim sütunları birebir aynı")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CSV / Parquet okuma benchmark'ı")
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--scale", type=int, default=10, help="Veri seti kaç kez çoğaltılsın")
+    parser.add_argument("--chunksize", type=int, default=20000, help="Parça parça okumada satır sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrar sayısı")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen kötüleşme oranı")
+    args = parser.parse_args()
+
+    frame = build_frame(args.dataset, args.scale)
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = {fmt: os.path.join(workdir, f"dataset.{fmt}") for fmt in ("csv", "parquet")}
+        write_seconds = {fmt: time_call(lambda: write_frame(frame, path), 1) for fmt, path in paths.items()}
+        if not check_equivalence(paths["csv"], paths["parquet"]):
+            sys.exit(1)
+
+        rows: List[Dict] = []
+        print(f"\n{len(frame)} satır")
+        print(f"{'format':>8} {'boyut MB':>9} {'yazma sn':>9} {'tümü sn':>8} {'eğitim sütunları sn':>20} {'parçalı sn':>11}")
+        for fmt, path in paths.items():
+            full_s = time_call(lambda: read_frame(path), args.repeat)
+            training_s = time_call(lambda: read_frame(path, TRAINING_COLUMNS), args.repeat)
+            chunked_s = time_call(lambda: sum(len(chunk) for chunk in iter_frames(path, args.chunksize,
+                                                                                   TRAINING_COLUMNS)), args.repeat)
+            size_mb = os.path.getsize(path) / 1e6
+            rows.append({"format": fmt, "rows": len(frame), "size_mb": size_mb, "write_s": write_seconds[fmt],
+                         "read_all_s": full_s, "read_training_s": training_s, "read_chunked_s": chunked_s})
+            print(f"{fmt:>8} {size_mb:>9.1f} {write_seconds[fmt]:>9.2f} {full_s:>8.3f} {training_s:>20.3f} "
+                  f"{chunked_s:>11.3f}")
+
+    speedup = rows[0]["read_training_s"] / rows[1]["read_training_s"]
+    print(f"\n⚡ Eğitim sütunlarını okuma: Parquet {speedup:.1f}x hızlı, "
+          f"{rows[0]['size_mb'] / rows[1]['size_mb']:.1f}x küçük")
+
+    results = {"benchmark": "bench_dataset_io", "environment": environment(), "results": rows}
+    if args.output:
+        save_results(args.output, results)
+    if args.compare:
+        exit_on_regression(compare_results(args.compare, rows, ["format", "rows"], "read_training_s", args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
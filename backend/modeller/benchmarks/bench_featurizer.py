@@ -0,0 +1,66 @@
+"""Hızlı featurizer'ın vectorizer.pkl ile eşdeğerlik kontrolü ve mikro-benchmark'ı.
+
+Kullanım (backend/modeller dizininde):
+    python benchmarks/bench_featurizer.py
+    python benchmarks/bench_featurizer.py --vectorizer vectorizer.pkl --repeat 20
+
+Önce üç yolun (sklearn, kompakt string yolu, hızlı uint64 yolu) aynı CSR
+matrisini ürettiği doğrulanır; fark varsa çıkış kodu 1 olur.
+"""
+
+import argparse
+import os
+import sys
+from typing import List
+
+import joblib
+
+from common import BATCH_SIZES, DEFAULT_DATASET, MODELLER_DIR, TEXT_LENGTHS, load_texts, time_call
+
+sys.path.insert(0, MODELLER_DIR)
+
+from featurizer import CompactTfidfVectorizer  # noqa: E402
+
+
+def check_equivalence(vectorizer, compact: CompactTfidfVectorizer, texts: List[str]) -> bool:
+    expected = vectorizer.transform(texts)
+    for name, actual in (
+        ("kompakt", compact._apply_tfidf(compact._counts(texts))),
+        ("hızlı", compact.transform(texts)),
+    ):
+        if expected.shape != actual.shape or (expected != actual).nnz != 0:
+            print(f"❌ {name} yol vectorizer.pkl ile aynı değil!")
+            return False
+    print(f"✅ Eşdeğerlik: {len(texts)} metin, {expected.nnz} sıfır olmayan değer birebir aynı")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Featurizer eşdeğerlik + mikro-benchmark")
+    parser.add_argument("--vectorizer", default=os.path.join(MODELLER_DIR, "vectorizer.pkl"))
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--repeat", type=int, default=10, help="Ölçüm tekrar sayısı")
+    args = parser.parse_args()
+
+    vectorizer = joblib.load(args.vectorizer)
+    compact = CompactTfidfVectorizer.from_vectorizer(vectorizer)
+    if compact.term_keys is None:
+        print("⚠️ Alfabe 64 bit anahtara sığmıyor; hızlı yol kapalı")
+
+    edge_cases = ["", "a", "  Çok   BOŞLUKLU\tmetin\n\n", "İstanbul ß ǅ", "x" * 100]
+    if not check_equivalence(vectorizer, compact, load_texts(args.dataset, 500, 1500, 0) + edge_cases):
+        sys.exit(1)
+
+    print(f"\n{'uzunluk':>8} {'batch':>6} {'sklearn ms':>11} {'kompakt ms':>11} {'hızlı ms':>9} {'hızlanma':>9}")
+    for length in TEXT_LENGTHS:
+        for batch_size in BATCH_SIZES:
+            texts = load_texts(args.dataset, batch_size, length, seed=length + batch_size)
+            sklearn_s = time_call(lambda: vectorizer.transform(texts), args.repeat)
+            compact_s = time_call(lambda: compact._apply_tfidf(compact._counts(texts)), args.repeat)
+            fast_s = time_call(lambda: compact.transform(texts), args.repeat)
+            print(f"{length:>8} {batch_size:>6} {sklearn_s * 1000:>11.2f} {compact_s * 1000:>11.2f} "
+                  f"{fast_s * 1000:>9.2f} {sklearn_s / fast_s:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
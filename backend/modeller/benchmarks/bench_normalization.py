@@ -0,0 +1,95 @@
+"""Normalizasyonun doğruluk kontrolü ve /predict'e eklediği gecikmenin ölçümü.
+
+Kullanım (backend/modeller dizininde):
+    python benchmarks/bench_normalization.py
+    python benchmarks/bench_normalization.py --output normalization.json
+
+``normalize`` notebook'taki regex tabanlı ``general_cleaning`` ile aynı
+sonucu vermelidir (fark varsa çıkış kodu 1). Ardından her uzunluk ve batch
+boyutu için normalizasyon süresi, transform süresine oranla raporlanır.
+"""
+
+import argparse
+import os
+import re
+import sys
+from typing import Dict, List
+
+import joblib
+
+from common import (BATCH_SIZES, DEFAULT_DATASET, MODELLER_DIR, TEXT_LENGTHS, compare_results, environment,
+                    exit_on_regression, load_texts, save_results, time_call)
+
+sys.path.insert(0, MODELLER_DIR)
+
+from bundles import resolve_model_dir  # noqa: E402
+from normalization import normalize, normalize_batch  # noqa: E402
+
+
+def general_cleaning(text):
+    """notebooks/data_cleaning.ipynb'deki orijinal fonksiyon (referans)."""
+    if not isinstance(text, str):
+        return ""
+    text = text.lower()
+    text = re.sub(r'http\S+', '', text)
+    text = re.sub(r'\n', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def check_equivalence(texts: List[str]) -> bool:
+    edge_cases = ["", "   ", None, 3.5, "A B C\x1cD\x0bE", "SEE HTTP://X.ORG/Y AND https://a.b",
+                  "İSTANBUL  ǅ\n\n\tx", "http", "xhttp://a b", "line\r\nbreak end"]
+    for text in texts + edge_cases:
+        if normalize(text) != general_cleaning(text):
+            print(f"❌ normalize farklı sonuç verdi: {text!r}")
+            return False
+    print(f"✅ Eşdeğerlik: {len(texts) + len(edge_cases)} metin general_cleaning ile aynı")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Normalizasyon doğruluk + gecikme benchmark'ı")
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--repeat", type=int, default=20, help="Ölçüm tekrar sayısı")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen kötüleşme oranı")
+    args = parser.parse_args()
+
+    if not check_equivalence(load_texts(args.dataset, 500, 1500, 0)):
+        sys.exit(1)
+
+    model_dir = resolve_model_dir(MODELLER_DIR)
+    vectorizer_path = os.path.join(model_dir, "vectorizer_compact.pkl")
+    if not os.path.exists(vectorizer_path):
+        vectorizer_path = os.path.join(model_dir, "vectorizer.pkl")
+    vectorizer = joblib.load(vectorizer_path) if os.path.exists(vectorizer_path) else None
+
+    rows: List[Dict] = []
+    print(f"\n{'uzunluk':>8} {'batch':>6} {'regex ms':>9} {'normalize ms':>13} {'transform ms':>13} {'ek yük':>7}")
+    for length in TEXT_LENGTHS:
+        for batch_size in BATCH_SIZES:
+            texts = load_texts(args.dataset, batch_size, length, seed=length + batch_size)
+            # Gerçek kullanıcı metni gibi: büyük harf, satır sonu, URL
+            texts = [f"Abstract\n{text.upper()[:20]}{text[20:]} https://arxiv.org/abs/1234" for text in texts]
+            regex_s = time_call(lambda: [general_cleaning(text) for text in texts], args.repeat)
+            normalize_s = time_call(lambda: normalize_batch(texts), args.repeat)
+            normalized = normalize_batch(texts)
+            transform_s = time_call(lambda: vectorizer.transform(normalized), args.repeat) if vectorizer else 0.0
+            overhead = normalize_s / transform_s if transform_s else 0.0
+            rows.append({"length": length, "batch": batch_size, "regex_ms": regex_s * 1000,
+                         "normalize_ms": normalize_s * 1000, "transform_ms": transform_s * 1000,
+                         "overhead": overhead})
+            print(f"{length:>8} {batch_size:>6} {regex_s * 1000:>9.3f} {normalize_s * 1000:>13.3f} "
+                  f"{transform_s * 1000:>13.3f} {overhead:>6.1%}")
+
+    results = {"benchmark": "bench_normalization", "environment": environment(), "results": rows}
+    if args.output:
+        save_results(args.output, results)
+    if args.compare:
+        exit_on_regression(compare_results(args.compare, rows, ["length", "batch"], "normalize_ms", args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Tahmin yolunun mikro-benchmark'ı: transform, model başına predict, Flask uçtan uca.
+
+Kullanım (backend/modeller dizininde):
+    python benchmarks/bench_predict.py --output bench_predict.json
+    python benchmarks/bench_predict.py --compare bench_predict.json
+
+Her metin uzunluğu ve batch boyutu için medyan süreler ölçülür. Modeller,
+API'nin kullandığı paket (ve aynı HUMANORAI_* ayarları) ile yüklenir; tahmin
+önbelleği ölçümü bozmasın diye kapatılır. ``--compare`` verilirse sonuçlar
+kayıtlı temel ölçümle karşılaştırılır, gerileme varsa çıkış kodu 1 olur.
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, List
+
+from common import (BATCH_SIZES, DEFAULT_DATASET, MODELLER_DIR, TEXT_LENGTHS, compare_results, environment,
+                    exit_on_regression, load_texts, save_results, time_call)
+
+# Aynı metin tekrar tekrar gönderildiği için önbellek açıkken sadece ilk çağrı ölçülürdü
+os.environ["HUMANORAI_CACHE_SIZE"] = "0"
+sys.path.insert(0, MODELLER_DIR)
+
+import pythonapi  # noqa: E402
+
+
+def measure(length: int, batch_size: int, texts: List[str], repeat: int, client) -> List[Dict]:
+    bundle = pythonapi.bundle
+    vectors = bundle.vectorizer.transform(texts)
+    stages = [("transform", lambda: bundle.vectorizer.transform(texts))]
+    for member in bundle.ensemble.members:
+        stages.append((" + ".join(member.names), lambda member=member: member.predict_ai_human(vectors)))
+
+    if batch_size == 1:
+        stages.append(("flask /predict", lambda: client.post("/predict", json={"text": texts[0]})))
+    else:
+        stages.append(("flask /predict/batch", lambda: client.post("/predict/batch", json={"texts": texts})))
+
+    rows = []
+    for stage, function in stages:
+        seconds = time_call(function, repeat)
+        rows.append({
+            "stage": stage,
+            "length": length,
+            "batch": batch_size,
+            "median_ms": seconds * 1000,
+            "per_text_ms": seconds * 1000 / batch_size,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tahmin yolu mikro-benchmark'ı")
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--repeat", type=int, default=10, help="Ölçüm tekrar sayısı")
+    parser.add_argument("--lengths", type=int, nargs="+", default=TEXT_LENGTHS, help="Metin uzunlukları")
+    parser.add_argument("--batches", type=int, nargs="+", default=BATCH_SIZES, help="Batch boyutları")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen kötüleşme oranı")
+    args = parser.parse_args()
+
+    if not pythonapi.bundle.vectorizer:
+        print("❌ Vektörleştirici yüklenemedi; önce model.py çalıştırılmalı")
+        sys.exit(1)
+
+    client = pythonapi.app.test_client()
+    rows: List[Dict] = []
+    print(f"\n{'aşama':<38} {'uzunluk':>8} {'batch':>6} {'medyan ms':>10} {'metin başı ms':>14}")
+    for length in args.lengths:
+        for batch_size in args.batches:
+            texts = load_texts(args.dataset, batch_size, length, seed=length + batch_size)
+            for row in measure(length, batch_size, texts, args.repeat, client):
+                rows.append(row)
+                print(f"{row['stage']:<38} {length:>8} {batch_size:>6} "
+                      f"{row['median_ms']:>10.2f} {row['per_text_ms']:>14.3f}")
+
+    results = {
+        "benchmark": "bench_predict",
+        "environment": environment(),
+        "model_version": pythonapi.bundle.version,
+        "results": rows,
+    }
+    if args.output:
+        save_results(args.output, results)
+    if args.compare:
+        exit_on_regression(compare_results(args.compare, rows, ["stage", "length", "batch"],
+                                           "median_ms", args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Soğuk açılış benchmark'ı: süreç başlangıcından porta, /ready'ye ve ilk tahmine kadar geçen süre.
+
+Kullanım (backend/modeller dizininde):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --server async_server.py --repeat 5 --output startup.json
+
+Sunucu her ölçümde yeni bir süreç olarak başlatılır; hem normal (eager) hem
+tembel (HUMANORAI_LAZY_LOAD=1) açılış ölçülür. Model dosyaları işletim
+sisteminin sayfa önbelleğinde olabilir; ölçülen, süreç açılışının maliyetidir.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional
+
+from common import MODELLER_DIR, compare_results, environment, exit_on_regression, save_results
+
+POLL_SECONDS = 0.01
+TEXT = "we propose a novel method for learning sparse graph representations with theoretical guarantees"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request_status(url: str, payload: Optional[bytes] = None) -> Optional[int]:
+    """HTTP durum kodu; bağlantı kurulamazsa None."""
+    request = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            if payload is not None and not json.loads(response.read())["predictions"]:
+                return 503
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, OSError):
+        return None
+
+
+def measure_once(server: str, lazy: bool, workers: int, timeout: float) -> Dict[str, float]:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, HUMANORAI_BIND=f"127.0.0.1:{port}", HUMANORAI_WORKERS=str(workers),
+               HUMANORAI_LAZY_LOAD="1" if lazy else "0", HUMANORAI_CACHE_SIZE="0")
+
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(MODELLER_DIR, server)], cwd=MODELLER_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    timings: Dict[str, float] = {}
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"{server} beklenmedik şekilde kapandı (kod {process.returncode})")
+            if "listen_s" not in timings:
+                if request_status(base + "/ready") is not None:
+                    timings["listen_s"] = time.perf_counter() - started
+            elif "ready_s" not in timings:
+                if request_status(base + "/ready") == 200:
+                    timings["ready_s"] = time.perf_counter() - started
+            else:
+                if request_status(base + "/predict", json.dumps({"text": TEXT}).encode("utf-8")) == 200:
+                    timings["first_prediction_s"] = time.perf_counter() - started
+                    return timings
+            time.sleep(POLL_SECONDS)
+        raise RuntimeError(f"{timeout} sn içinde hazır olmadı")
+    finally:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Soğuk açılış benchmark'ı")
+    parser.add_argument("--server", default="serve.py", choices=["serve.py", "async_server.py"])
+    parser.add_argument("--workers", type=int, default=1, help="serve.py worker sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Her mod için açılış sayısı")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen kötüleşme oranı")
+    args = parser.parse_args()
+
+    rows: List[Dict] = []
+    print(f"\n{'mod':<6} {'port açık s':>11} {'/ready s':>9} {'ilk tahmin s':>13}")
+    for mode in ("eager", "lazy"):
+        runs = [measure_once(args.server, mode == "lazy", args.workers, args.timeout) for _ in range(args.repeat)]
+        row = {"server": args.server, "mode": mode}
+        for metric in ("listen_s", "ready_s", "first_prediction_s"):
+            row[metric] = statistics.median(run[metric] for run in runs)
+        rows.append(row)
+        print(f"{mode:<6} {row['listen_s']:>11.2f} {row['ready_s']:>9.2f} {row['first_prediction_s']:>13.2f}")
+
+    results = {"benchmark": "bench_startup", "environment": environment(), "results": rows}
+    if args.output:
+        save_results(args.output, results)
+    if args.compare:
+        ok = compare_results(args.compare, rows, ["server", "mode"], "listen_s", args.tolerance)
+        ok = compare_results(args.compare, rows, ["server", "mode"], "ready_s", args.tolerance) and ok
+        exit_on_regression(ok)
+
+
+if __name__ == "__main__":
+    main()
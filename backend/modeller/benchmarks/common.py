@@ -0,0 +1,107 @@
+"""Benchmark script'lerinin ortak yardımcıları: test metinleri, zamanlama, JSON sonuçlar."""
+
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+MODELLER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if MODELLER_DIR not in sys.path:
+    sys.path.insert(0, MODELLER_DIR)
+
+from dataset_io import find_dataset, read_frame  # noqa: E402
+
+# Benchmark'ların varsayılan metin kaynağı (clean_dataset.parquet, yoksa eski .csv)
+DEFAULT_DATASET = find_dataset(os.path.join(MODELLER_DIR, "clean_dataset"))
+
+# Gerçekçi abstract uzunlukları (karakter): kısa, ortalama, uzun
+TEXT_LENGTHS = [600, 1500, 2500]
+BATCH_SIZES = [1, 32, 256]
+
+WORDS = (
+    "we propose a novel framework for learning sparse representations of graphs "
+    "our results demonstrate that the proposed method significantly outperforms "
+    "existing approaches on benchmark datasets furthermore we provide theoretical "
+    "guarantees for convergence under mild assumptions experiments on real-world "
+    "data show robust performance across domains including vision and language"
+).split()
+
+
+def load_texts(dataset_path: str, count: int, length: int, seed: int) -> List[str]:
+    """Temiz veri seti varsa gerçek metinleri, yoksa sentetik abstract'ları döner."""
+    rng = random.Random(seed)
+    if os.path.exists(dataset_path):
+        column = read_frame(dataset_path, ["cleaned_text"])["cleaned_text"].dropna()
+        pool = [text for text in column.tolist() if len(text) >= length // 2]
+        if pool:
+            return [(rng.choice(pool) * 3)[:length] for _ in range(count)]
+
+    texts = []
+    for _ in range(count):
+        words: List[str] = []
+        while sum(len(word) + 1 for word in words) < length:
+            words.append(rng.choice(WORDS))
+        texts.append(" ".join(words)[:length])
+    return texts
+
+
+def time_call(function: Callable[[], object], repeat: int) -> float:
+    """En az bir ısınmadan sonra medyan süreyi (saniye) döner."""
+    function()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def environment() -> Dict[str, object]:
+    """Sonuçların hangi makinede alındığı (karşılaştırmada farklı makine uyarısı için)."""
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def save_results(path: str, results: Dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"💾 Sonuçlar kaydedildi: {path}")
+
+
+def compare_results(baseline_path: str, rows: List[Dict], key_fields: List[str], metric: str,
+                    tolerance: float, higher_is_better: bool = False) -> bool:
+    """Aynı anahtarlı satırları temel sonuçla karşılaştırır; gerileme yoksa True döner.
+
+    ``tolerance`` 0.2 ise %20'ye kadar kötüleşme gürültü sayılır.
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {tuple(row[field] for field in key_fields): row for row in baseline["results"]}
+
+    ok = True
+    print(f"\n{'/'.join(key_fields)} | {metric}: temel -> şimdi")
+    for row in rows:
+        key = tuple(row[field] for field in key_fields)
+        before: Optional[Dict] = previous.get(key)
+        if before is None or not before[metric]:
+            continue
+        ratio = row[metric] / before[metric]
+        regressed = ratio < 1 - tolerance if higher_is_better else ratio > 1 + tolerance
+        ok = ok and not regressed
+        mark = "❌" if regressed else "✅"
+        print(f"{mark} {' / '.join(str(part) for part in key)}: {before[metric]:.3f} -> {row[metric]:.3f} ({ratio:.2f}x)")
+    return ok
+
+
+def exit_on_regression(ok: bool) -> None:
+    if not ok:
+        print("❌ Performans gerilemesi var")
+        sys.exit(1)
@@ -0,0 +1,125 @@
+"""Çalışan API'ye yük üreten istemci: throughput ve p50/p95/p99 gecikme.
+
+Kullanım (önce sunucu başlatılır: python serve.py veya python async_server.py):
+    python benchmarks/loadgen.py --concurrency 32 --requests 2000 --output load.json
+    python benchmarks/loadgen.py --url http://127.0.0.1:5001 --compare load.json
+
+Sadece standart kütüphane kullanılır (thread başına bir bağlantı). Her metne
+çalıştırmaya özgü bir önek eklenir; aynı metin tekrarlanmadığı için sonuçlar
+önbelleği değil modelleri ölçer (``--repeat-texts`` ile önbellek de ölçülebilir).
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from common import (DEFAULT_DATASET, compare_results, environment, exit_on_regression, load_texts,
+                    save_results)
+
+
+def send(url: str, payload: bytes, timeout: float) -> bool:
+    request = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def run_load(url: str, payloads: List[bytes], concurrency: int, timeout: float) -> Dict:
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(payload: bytes) -> None:
+        nonlocal errors
+        started = time.perf_counter()
+        ok = send(url, payload, timeout)
+        elapsed = time.perf_counter() - started
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, payloads))
+    duration = time.perf_counter() - started
+
+    percentiles = np.percentile(latencies, [50, 95, 99]) * 1000 if latencies else [0.0, 0.0, 0.0]
+    return {
+        "requests": len(payloads),
+        "errors": errors,
+        "duration_s": duration,
+        "throughput_rps": len(latencies) / duration,
+        "p50_ms": float(percentiles[0]),
+        "p95_ms": float(percentiles[1]),
+        "p99_ms": float(percentiles[2]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API yük testi")
+    parser.add_argument("--url", default="http://127.0.0.1:5001", help="API kök adresi")
+    parser.add_argument("--endpoint", default="/predict", choices=["/predict", "/predict/batch"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Eşzamanlı istemci sayıları")
+    parser.add_argument("--requests", type=int, default=500, help="Her eşzamanlılık düzeyinde istek sayısı")
+    parser.add_argument("--batch", type=int, default=16, help="/predict/batch için istek başına metin")
+    parser.add_argument("--length", type=int, default=1500, help="Metin uzunluğu (karakter)")
+    parser.add_argument("--repeat-texts", action="store_true", help="Aynı metinleri tekrar gönder (önbellek ölçümü)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen kötüleşme oranı")
+    args = parser.parse_args()
+
+    url = args.url.rstrip("/") + args.endpoint
+    per_request = args.batch if args.endpoint == "/predict/batch" else 1
+
+    run_id = time.time_ns()
+    rows: List[Dict] = []
+    print(f"\n{'eşzamanlı':>9} {'istek/sn':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'hata':>5}")
+    for seed, concurrency in enumerate(args.concurrency):
+        count = args.requests * per_request
+        pool_size = min(count, 64) if args.repeat_texts else count
+        texts = load_texts(args.dataset, pool_size, args.length, seed=seed)
+        texts = [texts[i % pool_size] for i in range(count)]
+        if not args.repeat_texts:
+            # Aynı sunucuya art arda çalıştırmalarda da önbelleğe düşmesin: her metin benzersiz
+            texts = [f"{run_id} {i} {text}" for i, text in enumerate(texts)]
+        if per_request == 1:
+            payloads = [json.dumps({"text": text}).encode("utf-8") for text in texts]
+        else:
+            payloads = [json.dumps({"texts": texts[i:i + per_request]}).encode("utf-8")
+                        for i in range(0, count, per_request)]
+
+        # Isınma: bağlantılar ve ilk istek gecikmesi ölçüme girmez
+        run_load(url, payloads[:concurrency], concurrency, args.timeout)
+        row = dict(run_load(url, payloads, concurrency, args.timeout),
+                   endpoint=args.endpoint, concurrency=concurrency, length=args.length, batch=per_request)
+        rows.append(row)
+        print(f"{concurrency:>9} {row['throughput_rps']:>9.1f} {row['p50_ms']:>8.1f} "
+              f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['errors']:>5}")
+
+    results = {"benchmark": "loadgen", "url": args.url, "environment": environment(), "results": rows}
+    if args.output:
+        save_results(args.output, results)
+    if args.compare:
+        keys = ["endpoint", "concurrency", "length", "batch"]
+        ok = compare_results(args.compare, rows, keys, "p99_ms", args.tolerance)
+        ok = compare_results(args.compare, rows, keys, "throughput_rps", args.tolerance, higher_is_better=True) and ok
+        exit_on_regression(ok)
+
+
+if __name__ == "__main__":
+    main()
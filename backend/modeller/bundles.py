@@ -0,0 +1,162 @@
+"""Sürümlü model paketleri.
+
+Her eğitim (tam veya artımlı) ``versions/<sürüm>/`` altında eksiksiz bir
+dosya seti yazar ve ``versions/CURRENT`` dosyası etkin sürümü gösterir.
+CURRENT geçici dosyaya yazılıp ``os.replace`` ile değiştirildiği için
+okuyucular hiçbir zaman yarım bir sürüm görmez. Yayınlanmış bir sürümün
+dosyaları sonradan değişmez: model dosyaları da geçici ada yazılıp
+``os.replace`` ile yerine konur, sürümlere hard link değil kopya girer.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+import joblib
+
+VERSIONS_DIR = "versions"
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+
+# Bir paketi oluşturan dosyalar (olmayanlar atlanır)
+BUNDLE_FILES = (
+    "vectorizer.pkl",
+    "vectorizer_compact.pkl",
+    "model_logistic.pkl",
+    "model_naive_bayes.pkl",
+    "model_random_forest.pkl",
+    "model_random_forest_flat.pkl",
+    "model_fused.pkl",
+)
+
+
+class ModelBundle(NamedTuple):
+    """API'nin tek seferde değiştirdiği, birlikte yüklenmiş model seti."""
+
+    version: Optional[str]
+    model_dir: str
+    vectorizer: Any
+    ensemble: Any
+    # Tahmin önbelleği anahtarlarının öneki; paketteki dosyalar değişince değişir
+    cache_namespace: str = ""
+
+
+def versions_root(model_dir: str) -> str:
+    return os.path.join(model_dir, VERSIONS_DIR)
+
+
+def current_version(model_dir: str) -> Optional[str]:
+    """Etkin sürüm adını döner; hiç sürüm yayınlanmadıysa None."""
+    path = os.path.join(versions_root(model_dir), CURRENT_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return version or None
+
+
+def resolve_model_dir(model_dir: str) -> str:
+    """Etkin sürümün dizini; sürüm yoksa düz ``model_dir`` (eski düzen)."""
+    version = current_version(model_dir)
+    if version is None:
+        return model_dir
+    return os.path.join(versions_root(model_dir), version)
+
+
+def bundle_fingerprint(bundle_dir: str) -> str:
+    """Paket dosyalarının (ad, boyut, mtime, inode) özeti.
+
+    Sürümü olmayan (düz dizin) paketlerde önbellek ad alanı olarak kullanılır:
+    dosyalar ``os.replace`` ile yeniden yazılınca inode ve mtime değişir,
+    eski modelin önbellekteki tahminleri yeni modele dönmez. İçerik okunmaz.
+    """
+    digest = hashlib.sha256()
+    for filename in BUNDLE_FILES:
+        try:
+            stat = os.stat(os.path.join(bundle_dir, filename))
+        except FileNotFoundError:
+            continue
+        digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def read_manifest(bundle_dir: str) -> Dict:
+    path = os.path.join(bundle_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def new_version_name(model_dir: str) -> str:
+    """Zaman damgalı, var olanlarla çakışmayan sürüm adı."""
+    base = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+    name = base
+    suffix = 1
+    while os.path.exists(os.path.join(versions_root(model_dir), name)):
+        suffix += 1
+        name = f"{base}-{suffix}"
+    return name
+
+
+def stage_bundle(model_dir: str) -> str:
+    """Yayınlanacak dosyaların yazılacağı geçici dizini (aynı dosya sisteminde) açar."""
+    root = versions_root(model_dir)
+    os.makedirs(root, exist_ok=True)
+    return tempfile.mkdtemp(prefix=".staging-", dir=root)
+
+
+def dump_artifact(obj: Any, path: str) -> None:
+    """``joblib.dump`` ile aynı, ama dosyayı yerinde değiştirmez.
+
+    Nesne aynı dizinde geçici bir dosyaya yazılır ve ``os.replace`` ile
+    yerine konur. Eski dosyayı açmış (mmap'lemiş) okuyucular eski içeriği
+    görmeye devam eder; yarım yazılmış bir dosyayı kimse görmez.
+    """
+    directory, filename = os.path.split(path)
+    tmp = os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+    try:
+        joblib.dump(obj, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def copy_files(source_dir: str, target_dir: str, filenames: Iterable[str]) -> None:
+    """Değişmeyen dosyaları yeni pakete kopyalar.
+
+    Hard link kullanılmaz: kaynak dosya sonradan değişirse yayınlanmış
+    sürüm de değişirdi. Kopya geçici ada yazılıp ``os.replace`` ile konur.
+    """
+    for filename in filenames:
+        source = os.path.join(source_dir, filename)
+        target = os.path.join(target_dir, filename)
+        if not os.path.exists(source) or os.path.exists(target):
+            continue
+        tmp = os.path.join(target_dir, f".{filename}.tmp")
+        shutil.copy2(source, tmp)
+        os.replace(tmp, target)
+
+
+def publish(model_dir: str, staging_dir: str, manifest: Dict) -> str:
+    """Hazırlanan dizini yeni sürüm olarak yerleştirir ve CURRENT'i ona çevirir."""
+    version = new_version_name(model_dir)
+    manifest = dict(manifest, version=version, created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+    with open(os.path.join(staging_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    root = versions_root(model_dir)
+    os.replace(staging_dir, os.path.join(root, version))
+
+    pointer = os.path.join(root, f".{CURRENT_FILE}.tmp")
+    with open(pointer, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(root, CURRENT_FILE))
+    return version
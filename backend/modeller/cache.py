@@ -0,0 +1,215 @@
+"""Tahmin önbelleği – normalize edilmiş metnin hash'i ile anahtarlanır.
+
+Arka uçlar aynı ``CacheBackend`` arayüzünü uygular:
+
+* ``memory``: süreç içi LRU (varsayılan)
+* ``sqlite``: aynı makinedeki tüm worker süreçlerinin paylaştığı dosya tabanlı önbellek
+
+Ağ üzerinden bir depo (ör. Redis) eklemek için yeni bir ``CacheBackend``
+yazıp ``create_cache`` içine kaydetmek yeterlidir.
+"""
+
+import abc
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def cache_key(text: str, namespace: str = "") -> str:
+    """``text`` normalize edilmiş metin olmalıdır (bkz. ``normalization.normalize``).
+
+    ``namespace`` (ör. model sürümü) farklıysa aynı metin farklı anahtar alır.
+    Eşi olmayan surrogate'ler (ör. "\\ud800") de anahtar alır.
+    """
+    return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class CacheBackend(abc.ABC):
+    """Önbellek arka ucu arayüzü. Değerler JSON'a çevrilebilir olmalıdır.
+
+    ``max_entries`` 0 ise önbellek kapalıdır; çağıran taraf ``enabled``
+    False iken anahtar hesaplamaz.
+    """
+
+    max_entries: int
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Kayıt yoksa ya da süresi dolduysa None."""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Değeri ``key`` altında saklar; önbellek kapalıysa hiçbir şey yapmaz."""
+
+    @abc.abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """hits / misses bu sürece, entries arka ucun tamamına aittir."""
+
+
+class LRUCache(CacheBackend):
+    """En fazla ``max_entries`` kayıt tutan, ``ttl_seconds`` sonra kaydı düşüren LRU.
+
+    ``max_entries`` 0 ise önbellek kapalıdır; ``ttl_seconds`` 0 ise kayıtlar süresizdir.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.max_entries <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+class SQLiteCache(CacheBackend):
+    """Birden fazla süreç arasında paylaşılan SQLite (WAL) önbelleği.
+
+    Her süreç / thread kendi bağlantısını açar; bir worker'ın hesapladığı
+    tahmin diğer worker'lar tarafından okunabilir. Kayıt sayısı
+    ``max_entries`` değerini aşınca en uzun süredir okunmayan kayıtlar silinir.
+    """
+
+    # Eviction kontrolü her yazmada değil, bu kadar yazmada bir yapılır
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int, ttl_seconds: float) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        # Bağlantılar thread başına; sayaçlar (hits / misses / writes) ortak ve kilitli
+        self._counter_lock = threading.Lock()
+        self._local = threading.local()
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork sonrası ebeveynin bağlantısı kullanılmaz
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS predictions ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS predictions_accessed ON predictions (accessed_at)")
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.max_entries <= 0:
+            return None
+
+        now = time.time()
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, expires_at FROM predictions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and (row[1] is None or row[1] > now):
+                connection.execute("UPDATE predictions SET accessed_at = ? WHERE key = ?", (now, key))
+                with self._counter_lock:
+                    self.hits += 1
+                return json.loads(row[0])
+            if row is not None:
+                connection.execute("DELETE FROM predictions WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            print(f"⚠️ Önbellek okunamadı: {str(e)}")
+        with self._counter_lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds > 0 else None
+        try:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO predictions (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now),
+            )
+            with self._counter_lock:
+                self._writes += 1
+                evict = self._writes % self.EVICT_EVERY == 0
+            if evict:
+                self._evict(connection, now)
+        except sqlite3.Error as e:
+            print(f"⚠️ Önbelleğe yazılamadı: {str(e)}")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM predictions WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        connection.execute(
+            "DELETE FROM predictions WHERE key IN ("
+            "SELECT key FROM predictions ORDER BY accessed_at "
+            "LIMIT MAX((SELECT COUNT(*) FROM predictions) - ?, 0))",
+            (self.max_entries,),
+        )
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            entries = self._connect().execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+        except sqlite3.Error:
+            entries = -1
+        with self._counter_lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+
+def create_cache(backend: str, max_entries: int, ttl_seconds: float, path: str) -> CacheBackend:
+    """Ayardaki isme göre önbellek arka ucunu kurar."""
+    if backend == "memory":
+        return LRUCache(max_entries, ttl_seconds)
+    if backend == "sqlite":
+        return SQLiteCache(path, max_entries, ttl_seconds)
+    raise ValueError(f"Bilinmeyen önbellek arka ucu: {backend}")
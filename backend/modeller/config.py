@@ -0,0 +1,91 @@
+"""Python API ayarları – hepsi HUMANORAI_* ortam değişkenlerinden okunur."""
+
+import os
+import tempfile
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """'1', 'true', 'yes', 'on' değerlerini True kabul eder."""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return float(value)
+
+
+# Model dosyalarının okunacağı dizin (ör. akış modunda eğitilmiş modeller için)
+MODEL_DIR = os.getenv("HUMANORAI_MODEL_DIR", os.path.dirname(os.path.abspath(__file__)))
+
+# vectorizer_compact.pkl (sözlük yerine sıralı terim dizisi) varsa onu kullan
+USE_COMPACT_VECTORIZER = env_flag("HUMANORAI_USE_COMPACT_VECTORIZER", True)
+
+# Birleşik lineer model (model_fused.pkl) varsa LR + NB tek çarpımla skorlanır
+USE_FUSED = env_flag("HUMANORAI_USE_FUSED", True)
+
+# Random Forest en yavaş model; kapatılırsa sadece lineer modeller çalışır
+USE_RANDOM_FOREST = env_flag("HUMANORAI_USE_RANDOM_FOREST", True)
+
+# "flat": düzleştirilmiş dizi tabanlı orman (model_random_forest_flat.pkl), "sklearn": orijinal .pkl
+FOREST_ENGINE = os.getenv("HUMANORAI_FOREST_ENGINE", "flat")
+
+# Tahmin önbelleği: en fazla kayıt sayısı (0 = kapalı) ve kayıt ömrü (saniye, 0 = süresiz)
+CACHE_MAX_ENTRIES = env_int("HUMANORAI_CACHE_SIZE", 10000)
+CACHE_TTL_SECONDS = env_float("HUMANORAI_CACHE_TTL", 3600)
+
+# Önbellek arka ucu: "memory" (süreç içi) veya "sqlite" (worker'lar arası paylaşılan dosya)
+CACHE_BACKEND = os.getenv("HUMANORAI_CACHE_BACKEND", "memory")
+CACHE_PATH = os.getenv("HUMANORAI_CACHE_PATH", os.path.join(tempfile.gettempdir(), "humanorai_cache.sqlite3"))
+
+# Üretim sunucusu (serve.py): dinlenecek adres, worker süreç ve thread sayısı
+BIND = os.getenv("HUMANORAI_BIND", "127.0.0.1:5001")
+WORKERS = env_int("HUMANORAI_WORKERS", os.cpu_count() or 1)
+THREADS = env_int("HUMANORAI_THREADS", 4)
+WORKER_TIMEOUT = env_int("HUMANORAI_WORKER_TIMEOUT", 60)
+
+# Model dosyaları joblib.load(mmap_mode=...) ile açılır; büyük NumPy dizileri
+# worker'lar arasında paylaşılan sayfalar olur. Eğitim betikleri dosyaları
+# yerinde değiştirmez (bundles.dump_artifact: yeni dosya + os.replace), bu
+# yüzden açık mmap'ler yeniden eğitimde bozulmaz. Kapatmak için "none" verin.
+MMAP_MODE = os.getenv("HUMANORAI_MMAP_MODE", "r").strip() or None
+if MMAP_MODE is not None and MMAP_MODE.lower() == "none":
+    MMAP_MODE = None
+
+# versions/CURRENT bu aralıkla (saniye) kontrol edilir, değişince yeni sürüm
+# arka planda yüklenip devreye alınır. 0 = izleme kapalı (sadece POST /reload)
+WATCH_INTERVAL = env_float("HUMANORAI_WATCH_INTERVAL", 0)
+
+# POST /reload için yönetici anahtarı (X-Reload-Token başlığı). Verilirse
+# anahtarsız istekler 401 alır; ?force=1 (aynı dizini yeniden yükleme) sadece
+# anahtar tanımlıyken kabul edilir.
+RELOAD_TOKEN = os.getenv("HUMANORAI_RELOAD_TOKEN", "")
+
+# /predict/segments: en fazla işlenecek karakter (fazlası kesilir, gecikme sınırlı kalır)
+# ve parça boyu (karakter) sınırları
+MAX_CHARS = env_int("HUMANORAI_MAX_CHARS", 20000)
+SEGMENT_MIN_CHARS = env_int("HUMANORAI_SEGMENT_MIN_CHARS", 200)
+SEGMENT_MAX_CHARS = env_int("HUMANORAI_SEGMENT_MAX_CHARS", 1000)
+
+# async_server.py mikro-toplama: en büyük toplu boyut, ilk istekten sonra en fazla
+# bekleme (ms) ve istek başına hedeflenen uçtan uca gecikme bütçesi (ms)
+MICRO_BATCH_SIZE = env_int("HUMANORAI_MICRO_BATCH_SIZE", 64)
+MICRO_BATCH_WAIT_MS = env_float("HUMANORAI_MICRO_BATCH_WAIT_MS", 5)
+LATENCY_BUDGET_MS = env_float("HUMANORAI_LATENCY_BUDGET_MS", 100)
+
+# Tembel açılış: modeller import sırasında değil, arka planda yüklenir; port hemen
+# açılır ve /ready yükleme bitene kadar 503 döner. Yüklenmeden gelen tahmin
+# istekleri en fazla HUMANORAI_LOAD_WAIT saniye bekler.
+LAZY_LOAD = env_flag("HUMANORAI_LAZY_LOAD", False)
+LOAD_WAIT_SECONDS = env_float("HUMANORAI_LOAD_WAIT", 30)
@@ -0,0 +1,223 @@
+"""Ham abstract veri setlerini eğitim verisine (clean_dataset.parquet) çeviren temizleme hattı.
+
+notebooks/data_cleaning.ipynb'deki adımların modül / CLI hali. Kullanım
+(depo kök dizininde):
+    python backend/modeller/data_cleaning.py
+    python backend/modeller/data_cleaning.py --human data/raw/human_abstracts.parquet \\
+        --ai data/raw/ai_abstracts.parquet --workers 8 --chunksize 50000
+
+Girdiler (Parquet ya da CSV, bkz. dataset_io) parça parça okunur ve
+parçalar süreç havuzunda temizlenir; bellek kullanımı parça boyutuyla
+sınırlıdır. Düzenli ifadeler modül yüklenirken
+bir kez derlenir. Tekrarlayan metinler, parçalar yazılırken temizlenmiş
+metnin hash'iyle (ilk görülen tutulur) elenir. Karıştırma (varsayılan)
+tüm temiz veriyi bir kez belleğe alır; ``--no-shuffle`` ile kapatılabilir.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dataset_io import FrameWriter, iter_frames, read_columns, read_frame, write_frame
+from normalization import normalize_batch
+
+MODELLER_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(MODELLER_DIR))
+
+TEXT_COLUMN = "abstract_text"
+CLEAN_COLUMN = "cleaned_text"
+PAIR_COLUMN = "pair_id"
+RAW_COLUMNS = ["abstract_text", "source_url", "license_info", "label", PAIR_COLUMN]
+
+# Eğitimdeki etiketler (modeller ve streaming.CLASSES ile aynı)
+HUMAN_LABEL = "Human"
+AI_LABEL = "AI"
+
+MIN_LENGTH = 10
+SHUFFLE_SEED = 42
+DEFAULT_CHUNKSIZE = 50000
+
+# --- Human metinleri: LaTeX, [12] tarzı atıflar ve baştaki "Abstract:" ---
+_LATEX = re.compile(r"\$.*?\$")
+_CITATION = re.compile(r"\[\d+\]")
+_ABSTRACT_PREFIX = re.compile(r"^abstract\s*[:\.]?", re.IGNORECASE)
+
+# --- AI metinleri: model cevabındaki giriş / kapanış kalıpları (sırayla uygulanır) ---
+_REWRITE_PREFIX = re.compile(r"^\s*with different sentence structures\**\s*", re.IGNORECASE)
+_AI_PREFIXES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"^here is a summary.*?:",
+        r"^sure, i can (help|provide).*",
+        r"^certainly.*?",
+        r"^in this (study|paper),",
+        r"^summary:",
+        r"^abstract:",
+    )
+]
+# Metnin her yerinde aranan kalıplar ve küçük harfli metinde olması gereken parçaları.
+# Parçalarda "i" yok: IGNORECASE'te "i" ile eşleşen İ/ı, lower() ile "i" olmaz.
+_AI_PHRASES = [
+    (re.compile(r"generated by ai", re.IGNORECASE), "generated by a"),
+    (re.compile(r"ai-generated content", re.IGNORECASE), "-generated content"),
+]
+_TRAILING_JUNK = "-*"
+
+
+def clean_human(text) -> str:
+    if not isinstance(text, str):
+        return ""
+    if "$" in text:
+        text = _LATEX.sub("", text)
+    if "[" in text:
+        text = _CITATION.sub("", text)
+    return _ABSTRACT_PREFIX.sub("", text)
+
+
+def clean_ai(text) -> str:
+    if not isinstance(text, str):
+        return ""
+    text = _REWRITE_PREFIX.sub("", text)
+    for pattern in _AI_PREFIXES:
+        text = pattern.sub("", text)
+
+    # Tüm metni regex'le taramak pahalı: kalıp sadece parçası geçiyorsa uygulanır
+    lowered = text.lower()
+    for pattern, required in _AI_PHRASES:
+        if required in lowered:
+            text = pattern.sub("", text)
+            lowered = text.lower()
+
+    # re.sub(r"[\s\-*]+$", "", text) ile aynı: sondaki boşluk, - ve * atılır
+    end = len(text)
+    while end and (text[end - 1].isspace() or text[end - 1] in _TRAILING_JUNK):
+        end -= 1
+    return text[:end].strip()
+
+
+def clean_chunk(chunk: pd.DataFrame, kind: str) -> Tuple[pd.DataFrame, List[bytes]]:
+    """Bir parçayı temizler; satırlarla aynı sırada metin hash'lerini de döner.
+
+    Hash'ler worker'da hesaplanır, ana süreç sadece küme kontrolü yapar.
+    """
+    # Parquet'ten gelen kategorik sütunlar düz metne çevrilir (fillna yeni kategori ekleyemez)
+    chunk = chunk.reindex(columns=RAW_COLUMNS).astype(object)
+    if kind == "human":
+        chunk["label"] = chunk["label"].fillna(HUMAN_LABEL)
+        # Human satırın çifti kendi URL'si; AI yeniden yazımı aynı pair_id'yi taşır
+        chunk[PAIR_COLUMN] = chunk[PAIR_COLUMN].fillna(chunk["source_url"])
+        clean_source = clean_human
+    else:
+        # notebook'ta "Ai" yazılıyordu; modeller "AI" etiketini bekler
+        chunk["label"] = chunk["label"].fillna(AI_LABEL)
+        clean_source = clean_ai
+
+    texts = [clean_source(text) for text in chunk[TEXT_COLUMN].tolist()]
+    chunk[TEXT_COLUMN] = texts
+    cleaned = normalize_batch(texts)
+    chunk[CLEAN_COLUMN] = cleaned
+
+    keep = [len(text) > MIN_LENGTH for text in cleaned]
+    chunk = chunk[keep]
+    digests = [
+        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        for text, kept in zip(cleaned, keep) if kept
+    ]
+    return chunk, digests
+
+
+def _clean_job(job: Tuple[pd.DataFrame, str]) -> Tuple[pd.DataFrame, List[bytes]]:
+    return clean_chunk(*job)
+
+
+def iter_jobs(sources: List[Tuple[str, str]], chunksize: int) -> Iterator[Tuple[pd.DataFrame, str]]:
+    """(parça, tür) çiftleri; human dosyası önce okunur (notebook'taki concat sırası)."""
+    for path, kind in sources:
+        # Sadece ham sütunlar okunur (Parquet'te diğer sütunlar diskten hiç okunmaz)
+        columns = [column for column in read_columns(path) if column in RAW_COLUMNS]
+        for chunk in iter_frames(path, chunksize, columns, dtype=str):
+            yield chunk, kind
+
+
+def bounded_map(executor: Executor, function, items: Iterable, window: int) -> Iterator:
+    """Sırayı koruyan ``map``; en fazla ``window`` iş aynı anda bellekte bekler.
+
+    ``Executor.map`` tüm girdiyi baştan tüketir, bu da dosyanın tamamını okumak demektir.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(function, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def clean_files(sources: List[Tuple[str, str]], output_path: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                workers: Optional[int] = None, shuffle: bool = True) -> int:
+    """Kaynakları temizleyip ``output_path``'e yazar; yazılan satır sayısını döner."""
+    workers = workers or os.cpu_count() or 1
+    seen = set()
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        jobs = iter_jobs(sources, chunksize)
+        # sıra korunur; parçalar worker sayısının iki katı kadar önden okunur
+        results = bounded_map(executor, _clean_job, jobs, 2 * workers) if executor else map(_clean_job, jobs)
+        # Karıştırılacaksa parçalar önce ara dosyaya yazılır
+        staging_path = output_path + ".unshuffled" + os.path.splitext(output_path)[1] if shuffle else output_path
+        with FrameWriter(staging_path) as writer:
+            for chunk, digests in results:
+                unique = []
+                for digest in digests:
+                    unique.append(digest not in seen)
+                    seen.add(digest)
+                writer.write(chunk[unique])
+        written = writer.rows
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if shuffle:
+        # sklearn.utils.shuffle(df, random_state=42) ile aynı permütasyon
+        df = read_frame(staging_path, dtype=str, keep_default_na=False)
+        order = np.arange(len(df))
+        np.random.RandomState(SHUFFLE_SEED).shuffle(order)
+        write_frame(df.iloc[order], output_path)
+        os.remove(staging_path)
+
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ham abstract veri setlerini eğitim verisine çevirir")
+    parser.add_argument("--human", default=os.path.join(REPO_DIR, "data", "raw", "human_abstracts.parquet"),
+                        help="Human veri seti (.parquet ya da .csv)")
+    parser.add_argument("--ai", default=os.path.join(REPO_DIR, "data", "raw", "ai_abstracts.parquet"),
+                        help="AI veri seti (.parquet ya da .csv)")
+    parser.add_argument("--output", default=os.path.join(MODELLER_DIR, "clean_dataset.parquet"),
+                        help="Temiz veri seti (.parquet ya da .csv)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Parça başına satır")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--no-shuffle", action="store_true", help="Karıştırma (bellek parça boyutuyla sınırlı kalır)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    written = clean_files([(args.human, "human"), (args.ai, "ai")], args.output,
+                          chunksize=args.chunksize, workers=args.workers, shuffle=not args.no_shuffle)
+    print(f"✅ {written} temiz satır yazıldı: {args.output} ({time.perf_counter() - started:.1f} sn)")
+
+    dagilim = read_frame(args.output, ["label"])["label"].value_counts()
+    print(dagilim)
+
+
+if __name__ == "__main__":
+    main()
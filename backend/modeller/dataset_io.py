@@ -0,0 +1,321 @@
+"""Veri seti okuma / yazma: ``.parquet`` uzantılı yollar Parquet, diğerleri CSV.
+
+Hattın her aşaması (scraper'lar, birleştirme, temizlik, dedup, eğitim)
+veriyi bu modülle okur ve yazar. Parquet tarafında sütunlar tiplidir:
+metinler ``string``, az sayıda farklı değeri olan ``label`` ve
+``license_info`` kategorik (dictionary), ``dup_group`` tam sayı. Dosyalar
+zstd ile sıkıştırılır ve satır gruplarına bölünür; okurken sadece istenen
+sütunlar diskten okunur, CSV'deki gibi metin ayrıştırma olmaz. Eski CSV
+dosyaları aynı fonksiyonlarla okunmaya devam eder.
+
+Mevcut CSV'leri çevirmek için (backend/modeller dizininde):
+    python dataset_io.py ../../data/raw/human_abstracts.csv ../../data/raw/human_abstracts.parquet
+
+Scraper'lar kayıtları parça parça ekler. Parquet dosyasına ekleme
+yapılamadığı için eklenen bir Parquet veri seti ``part-*.parquet``
+dosyalarından oluşan bir dizindir; ``compact`` parçaları tek dosyada
+birleştirir. Okuma fonksiyonları tek dosyayı ve dizini aynı şekilde açar.
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import time
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+    import pyarrow.parquet as pq
+except ImportError:  # CSV yolları pyarrow olmadan da çalışır
+    pa = None
+
+PARQUET_SUFFIX = ".parquet"
+COMPRESSION = "zstd"
+ROW_GROUP_SIZE = 50_000
+CATEGORICAL_COLUMNS = ("label", "license_info")
+INTEGER_COLUMNS = ("dup_group",)
+
+
+def is_parquet(path: str) -> bool:
+    return path.lower().endswith(PARQUET_SUFFIX)
+
+
+def find_dataset(stem: str) -> str:
+    """``<stem>.parquet`` varsa onu, yoksa ``<stem>.csv``'yi döner (eski CSV'ler çalışmaya devam eder)."""
+    parquet_path = stem + PARQUET_SUFFIX
+    return parquet_path if os.path.exists(parquet_path) else stem + ".csv"
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet veri setleri için pyarrow gerekli: pip install pyarrow")
+
+
+def _column_type(name: str) -> "pa.DataType":
+    if name in CATEGORICAL_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    if name in INTEGER_COLUMNS:
+        return pa.int64()
+    return pa.string()
+
+
+def _schema(columns: Sequence[str]) -> "pa.Schema":
+    return pa.schema([(name, _column_type(name)) for name in columns])
+
+
+def _to_table(frame: pd.DataFrame) -> "pa.Table":
+    """DataFrame'i sabit sütun tipleriyle Arrow tablosuna çevirir (parçalar arası şema aynı kalır)."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    fields = []
+    for field in table.schema:
+        text = pa.types.is_string(field.type) or pa.types.is_large_string(field.type) or pa.types.is_null(field.type)
+        if text or field.name in CATEGORICAL_COLUMNS + INTEGER_COLUMNS:
+            field = pa.field(field.name, _column_type(field.name))
+        fields.append(field)
+    # pandas meta verisi atılır: okuyan taraf tipleri Arrow şemasından alır
+    return table.cast(pa.schema(fields))
+
+
+def _parquet_files(path: str) -> List[str]:
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, name) for name in os.listdir(path) if is_parquet(name))
+    return [path]
+
+
+def _dataset(path: str) -> "pads.Dataset":
+    """Tek dosya ya da parça dizini; parçaların şemaları birleştirilir (sonradan eklenen sütunlar boş gelir)."""
+    _require_pyarrow()
+    files = _parquet_files(path)
+    schema = pa.unify_schemas([pq.read_schema(name) for name in files]) if files else pa.schema([])
+    return pads.dataset(files, schema=schema, format="parquet")
+
+
+def read_columns(path: str) -> List[str]:
+    """Sütun adları (veri okunmaz)."""
+    if is_parquet(path):
+        return list(_dataset(path).schema.names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def read_frame(path: str, columns: Optional[Sequence[str]] = None, **csv_options) -> pd.DataFrame:
+    """Veri setini DataFrame olarak okur; ``columns`` verilirse sadece o sütunlar okunur.
+
+    ``csv_options`` sadece CSV dosyalarında ``pd.read_csv``'ye geçirilir.
+    """
+    if is_parquet(path):
+        return _dataset(path).to_table(columns=list(columns) if columns else None).to_pandas()
+    frame = pd.read_csv(path, usecols=list(columns) if columns else None, **csv_options)
+    # usecols dosyadaki sırayı korur; Parquet gibi istenen sırayla döner
+    return frame[list(columns)] if columns else frame
+
+
+def iter_frames(path: str, chunksize: int, columns: Optional[Sequence[str]] = None,
+                **csv_options) -> Iterator[pd.DataFrame]:
+    """Veri setini en fazla ``chunksize`` satırlık parçalar halinde okur."""
+    if is_parquet(path):
+        batches = _dataset(path).to_batches(columns=list(columns) if columns else None, batch_size=chunksize)
+        for batch in batches:
+            if batch.num_rows:
+                yield batch.to_pandas()
+        return
+    for frame in pd.read_csv(path, usecols=list(columns) if columns else None, chunksize=chunksize, **csv_options):
+        yield frame[list(columns)] if columns else frame
+
+
+class FrameWriter:
+    """Parça parça yazıp sonunda tek seferde yayınlayan yazıcı (yarım dosya bırakmaz).
+
+    Parquet'te her ``write`` en az bir satır grubu olur; şema ilk parçadan alınır.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.rows = 0
+        self._parquet = is_parquet(path)
+        self._writer = None
+        self._schema = None
+        self._file = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self._parquet:
+            _require_pyarrow()
+            table = _to_table(frame)
+            if self._writer is None:
+                self._schema = table.schema
+                self._writer = pq.ParquetWriter(self.tmp_path, self._schema, compression=COMPRESSION)
+            self._writer.write_table(table.cast(self._schema), row_group_size=ROW_GROUP_SIZE)
+        else:
+            if self._file is None:
+                self._file = open(self.tmp_path, "w", encoding="utf-8", newline="")
+                frame.to_csv(self._file, index=False)
+            else:
+                frame.to_csv(self._file, index=False, header=False)
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        """Dosyayı kapatır ve hedefin yerine koyar."""
+        if self._writer is None and self._file is None:
+            # Hiç parça yazılmadı: boş veri seti
+            self.write(pd.DataFrame())
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            self._file.close()
+        _replace(self.tmp_path, self.path)
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        if self._writer is not None:
+            self._writer.close()
+        elif self._file is not None:
+            self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def _replace(src: str, dst: str) -> None:
+    # Parça dizini tek dosyayla değiştirilirken önce dizin kaldırılır
+    if os.path.isdir(dst):
+        shutil.rmtree(dst)
+    os.replace(src, dst)
+
+
+def write_frame(frame: pd.DataFrame, path: str) -> None:
+    """DataFrame'i tek dosya olarak yazar (önce geçici dosyaya, sonra yerine koyar)."""
+    with FrameWriter(path) as writer:
+        writer.write(frame)
+
+
+def read_records(path: str, columns: Optional[Sequence[str]] = None) -> List[Dict[str, str]]:
+    """Satırları sözlük listesi olarak okur (scraper'lar için).
+
+    CSV'deki gibi boş değerler ``""`` döner; dosyada olmayan istenen sütunlar da ``""`` gelir.
+    """
+    if not is_parquet(path):
+        with open(path, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        if columns:
+            rows = [{name: row.get(name) or "" for name in columns} for row in rows]
+        return rows
+
+    available = read_columns(path)
+    wanted = [name for name in columns if name in available] if columns else available
+    table = _dataset(path).to_table(columns=wanted)
+    missing = [name for name in (columns or []) if name not in available]
+    rows = table.to_pylist()
+    for row in rows:
+        for name, value in row.items():
+            if value is None:
+                row[name] = ""
+        for name in missing:
+            row[name] = ""
+    return rows
+
+
+def write_records(path: str, records: List[Dict[str, str]]) -> None:
+    """Kayıtları (tüm kayıtlardaki sütunların birleşimiyle) tek dosya olarak yazar."""
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
+    if is_parquet(path):
+        write_frame(pd.DataFrame.from_records(records, columns=fieldnames), path)
+        return
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _upgrade_csv_header(path: str, fieldnames: Sequence[str]) -> None:
+    """Eksik sütunları (ör. pair_id) boş olarak ekler; ekleme yapılmadan önce bir kez."""
+    with open(path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None or all(name in reader.fieldnames for name in fieldnames):
+            return
+        rows = list(reader)
+
+    print(f"ℹ️  {path} dosyasına eksik sütunlar ekleniyor (eski kayıtlarda boş)")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def append_records(path: str, records: List[Dict[str, str]], fieldnames: Sequence[str]) -> None:
+    """Kayıtları veri setinin sonuna ekler.
+
+    CSV'de dosyaya satır eklenir. Parquet'te yeni bir parça dosyası yazılır;
+    hedef tek dosyaysa önce ilk parça olarak dizine taşınır.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if not is_parquet(path):
+        exists = os.path.exists(path)
+        if exists:
+            _upgrade_csv_header(path, fieldnames)
+        with open(path, "a" if exists else "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames)
+            if not exists:
+                writer.writeheader()
+            writer.writerows(records)
+        return
+
+    _require_pyarrow()
+    if os.path.isfile(path):
+        moved = path + ".tmp"
+        os.replace(path, moved)
+        os.makedirs(path)
+        os.replace(moved, os.path.join(path, f"part-{0:020d}{PARQUET_SUFFIX}"))
+    os.makedirs(path, exist_ok=True)
+
+    table = pa.Table.from_pylist([{name: record.get(name) for name in fieldnames} for record in records],
+                                 schema=_schema(fieldnames))
+    part = os.path.join(path, f"part-{time.time_ns():020d}{PARQUET_SUFFIX}")
+    pq.write_table(table, part + ".tmp", compression=COMPRESSION, row_group_size=ROW_GROUP_SIZE)
+    os.replace(part + ".tmp", part)
+
+
+def compact(path: str) -> None:
+    """Parça dizinini tek Parquet dosyasında birleştirir (CSV'de ve tek dosyada bir şey yapmaz)."""
+    if not (is_parquet(path) and os.path.isdir(path)):
+        return
+    tmp_path = path + ".tmp"
+    pq.write_table(_dataset(path).to_table(), tmp_path, compression=COMPRESSION, row_group_size=ROW_GROUP_SIZE)
+    _replace(tmp_path, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Veri setini CSV ile Parquet arasında çevirir")
+    parser.add_argument("source", help="Girdi (.csv / .parquet)")
+    parser.add_argument("target", help="Çıktı (.csv / .parquet)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    # Tüm CSV sütunları metin okunur (boş hücreler eksik değer olur, temizlik hattıyla aynı)
+    frame = read_frame(args.source, dtype=str)
+    write_frame(frame, args.target)
+    size_mb = os.path.getsize(args.target) / 1e6 if os.path.isfile(args.target) else 0.0
+    print(f"✅ {len(frame)} satır yazıldı: {args.target} ({size_mb:.1f} MB, {time.perf_counter() - started:.1f} sn)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Veri setindeki yakın kopyaları MinHash + LSH ile bulur.
+
+Kullanım (backend/modeller dizininde):
+    python dedup.py                                  # silmez, dup_group sütunu ekler
+    python dedup.py --mode drop --output dedup.parquet   # kopyalar silinir, kaynak değişmez
+    python dedup.py --threshold 0.7 --report dups.json
+
+Human ve AI satırları içeren (karışık etiketli) kümelerde hangi etiketin
+kalacağı keyfi seçilmez: kümeler raporlanır ve ``--mixed`` ile ya bütün
+olarak tutulur (varsayılan) ya da bütün olarak silinir.
+
+Aynı abstract'ın Gemini ile yeniden yazılmış hali ya da küçük farklarla
+tekrar çekilmiş makaleler ``drop_duplicates`` ile yakalanmaz ve train/test
+arasında sızar. Her metin karakter n-gram'larına (shingle) bölünür;
+n-gram'lar vektörleştiricinin hızlı yolundaki gibi UTF-32 kod noktalarından
+kayan pencereyle tek ``uint64`` değere çevrilir. MinHash imzaları tek
+permütasyonla (her shingle bir kez hash'lenir) bloklar halinde NumPy ile
+hesaplanır, imzalar bantlara bölünüp aynı kovaya düşen
+metinler aday olur. Adaylar imza benzerliğiyle doğrulanır ve bağlı
+bileşenler küme olarak döner. Süre metin sayısıyla doğrusal artar.
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from dataset_io import find_dataset, read_frame, write_frame
+
+MODELLER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+GROUP_COLUMN = "dup_group"
+DEFAULT_SHINGLE = 5
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+# Blok başına en fazla bu kadar karakterin shingle'ları aynı anda bellekte tutulur
+BLOCK_SHINGLES = 100_000
+
+# Kayan hash tabanı (tek sayı, mod 2^64)
+_ROLLING_BASE = np.uint64(0x100000001B3)
+_EMPTY = np.iinfo(np.uint32).max
+_LOW32 = np.uint64(0xFFFFFFFF)
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """splitmix64 son adımı: kayan hash'in yapısını dağıtır (yerinde değil, kopya döner)."""
+    with np.errstate(over="ignore"):
+        values = values ^ (values >> np.uint64(30))
+        values = values * np.uint64(0xBF58476D1CE4E5B9)
+        values ^= values >> np.uint64(27)
+        values *= np.uint64(0x94D049BB133111EB)
+        values ^= values >> np.uint64(31)
+    return values
+
+
+class MinHasher:
+    """Karakter n-gram kümeleri için tek permütasyonlu MinHash (one permutation hashing).
+
+    Klasik MinHash her shingle'ı ``num_perm`` kez hash'ler. Burada her shingle
+    bir kez hash'lenir; hash'in üst bitleri kutuyu (imza sütununu), alt 32
+    biti değeri seçer ve her kutuda en küçük değer tutulur. Eşleşen kutu
+    oranı yine Jaccard benzerliğini tahmin eder, maliyet ise shingle
+    sayısıyla doğrusaldır. Boş kalan kutular sağdaki ilk dolu kutudan
+    doldurulur (densification); kısa metinler de karşılaştırılabilir kalır.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle: int = DEFAULT_SHINGLE, seed: int = 42) -> None:
+        self.num_perm = num_perm
+        self.shingle = shingle
+        self.seed = np.uint64(np.random.default_rng(seed).integers(0, 2 ** 63))
+
+    def _shingles(self, texts: List[str]):
+        """(shingle hash'leri, her metnin shingle sayısı); metin sırasıyla art arda."""
+        k = self.shingle
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        codes = np.frombuffer("".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32).astype(np.uint64)
+        if len(codes) < k:
+            return np.zeros(0, dtype=np.uint64), np.zeros(len(texts), dtype=np.int64)
+
+        windows = len(codes) - k + 1
+        hashes = codes[:windows].copy()
+        with np.errstate(over="ignore"):
+            for i in range(1, k):
+                hashes = hashes * _ROLLING_BASE + codes[i:i + windows]
+
+        # Pencere tek bir metnin içinde kalmalı
+        doc_ids = np.repeat(np.arange(len(texts)), lengths)
+        valid = doc_ids[:windows] == doc_ids[k - 1:]
+        counts = np.bincount(doc_ids[:windows][valid], minlength=len(texts))
+        return hashes[valid], counts
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """(metin, num_perm) uint32 imzalar; n-gram'ı olmayan metinlerin satırı hep ``_EMPTY``."""
+        signatures = np.full((len(texts), self.num_perm), _EMPTY, dtype=np.uint32)
+        start = 0
+        while start < len(texts):
+            # Blok: toplam uzunluğu BLOCK_SHINGLES'ı aşmayan metinler (en az bir metin)
+            end, total = start, 0
+            while end < len(texts) and (end == start or total + len(texts[end]) <= BLOCK_SHINGLES):
+                total += len(texts[end])
+                end += 1
+
+            hashes, counts = self._shingles(texts[start:end])
+            if len(hashes):
+                mixed = _mix64(hashes ^ self.seed)
+                cells = np.repeat(np.arange(end - start, dtype=np.uint64), counts) * np.uint64(self.num_perm)
+                cells += (mixed >> np.uint64(32)) % np.uint64(self.num_perm)
+                # (hücre, değer) tek uint64'te: sıralayınca her hücrenin ilk elemanı en küçük değer
+                packed = np.sort((cells << np.uint64(32)) | (mixed & _LOW32))
+                first = np.r_[True, (packed[1:] >> np.uint64(32)) != (packed[:-1] >> np.uint64(32))]
+                block = signatures[start:end].reshape(-1)
+                block[(packed[first] >> np.uint64(32)).astype(np.int64)] = (packed[first] & _LOW32).astype(np.uint32)
+                signatures[start:end] = block.reshape(end - start, self.num_perm)
+            start = end
+
+        self._densify(signatures)
+        return signatures
+
+    def _densify(self, signatures: np.ndarray) -> None:
+        """Boş kutuları sağdaki (dairesel) ilk dolu kutunun değeriyle doldurur.
+
+        Değere uzaklık eklenir; böylece ödünç alınan değer asıl kutunun değeriyle
+        karışmaz, aynı metinler yine aynı imzayı alır.
+        """
+        rows = np.flatnonzero(((signatures == _EMPTY).any(axis=1)) & ((signatures != _EMPTY).any(axis=1)))
+        if not len(rows):
+            return
+        part = signatures[rows].astype(np.int64)
+        filled = part != _EMPTY
+        result = np.where(filled, part, -1)
+        for distance in range(1, self.num_perm):
+            shifted = np.roll(part, -distance, axis=1)
+            take = (result < 0) & (shifted != _EMPTY)
+            result[take] = (shifted[take] + distance * 0x9E3779B1) % _EMPTY
+            if (result >= 0).all():
+                break
+        signatures[rows] = result.astype(np.uint32)
+
+
+def lsh_candidates(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """Aynı bant kovasına düşen (i, j) çiftleri; her kova ilk üyesine bağlanır (doğrusal)."""
+    n, num_perm = signatures.shape
+    rows_per_band = num_perm // bands
+    has_shingles = (signatures != _EMPTY).any(axis=1)
+    ids = np.flatnonzero(has_shingles)
+
+    pairs = []
+    for band in range(bands):
+        part = np.ascontiguousarray(signatures[ids, band * rows_per_band:(band + 1) * rows_per_band])
+        keys = part.view(np.dtype((np.void, part.dtype.itemsize * rows_per_band))).ravel()
+        _, bucket = np.unique(keys, return_inverse=True)
+        order = np.argsort(bucket, kind="stable")
+        sorted_bucket = bucket[order]
+        starts = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+        leader = order[np.repeat(starts, np.diff(np.r_[starts, len(order)]))]
+        members = leader != order
+        pairs.append(np.stack([ids[leader[members]], ids[order[members]]], axis=1))
+
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def find_clusters(texts: List[str], threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM,
+                  bands: int = DEFAULT_BANDS, shingle: int = DEFAULT_SHINGLE, seed: int = 42) -> np.ndarray:
+    """Her metin için küme numarası; yakın kopyalar aynı numarayı alır.
+
+    Numara kümedeki ilk metnin sırasına göre verilir (0, 1, 2, ...).
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm, bands'e tam bölünmeli")
+
+    signatures = MinHasher(num_perm, shingle, seed).signatures(texts)
+    pairs = lsh_candidates(signatures, bands)
+
+    # Aday çiftleri tahmini Jaccard benzerliğiyle doğrula (bant eşleşmesi yanlış pozitif verebilir)
+    if len(pairs):
+        similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        pairs = pairs[similarity >= threshold]
+
+    n = len(texts)
+    graph = coo_matrix((np.ones(len(pairs), dtype=np.int8), (pairs[:, 0], pairs[:, 1])), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+
+    # Etiketleri ilk görülme sırasına göre yeniden numarala
+    _, first_index, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(first_index), dtype=np.int64)
+    rank[np.argsort(first_index)] = np.arange(len(first_index))
+    return rank[inverse]
+
+
+def mixed_label_groups(groups: np.ndarray, labels: pd.Series) -> np.ndarray:
+    """Birden fazla etiket içeren (ör. Human + AI) kümelerin numaraları."""
+    per_group = pd.Series(labels.to_numpy()).groupby(groups).nunique()
+    return per_group.index[per_group.to_numpy() > 1].to_numpy()
+
+
+def rows_to_keep(groups: np.ndarray, labels: Optional[pd.Series] = None, mixed: str = "keep") -> np.ndarray:
+    """Kopyalar silindikten sonra kalan satırların indeksleri (sıralı).
+
+    Tek etiketli kümelerden ilk satır kalır. Karışık etiketli kümeler
+    ``mixed`` ile ya bütün olarak tutulur ("keep") ya da bütün olarak
+    silinir ("drop"); hangi etiketin kalacağı keyfi seçilmez.
+    """
+    if mixed not in ("keep", "drop"):
+        raise ValueError(f"Bilinmeyen karışık küme seçeneği: {mixed}")
+    _, first_rows = np.unique(groups, return_index=True)
+    keep = np.zeros(len(groups), dtype=bool)
+    keep[first_rows] = True
+    if labels is not None:
+        in_mixed = np.isin(groups, mixed_label_groups(groups, labels))
+        keep[in_mixed] = mixed == "keep"
+    return np.flatnonzero(keep)
+
+
+def cluster_report(groups: np.ndarray, labels: Optional[pd.Series] = None, examples: int = 10) -> Dict:
+    """Küme boyutları, etiket karışık kümeler ve örnek kümeler."""
+    sizes = np.bincount(groups)
+    duplicate_groups = np.flatnonzero(sizes > 1)
+    report = {
+        "rows": int(len(groups)),
+        "clusters": int(len(duplicate_groups)),
+        "rows_in_clusters": int(sizes[duplicate_groups].sum()),
+        "rows_removed_by_drop": int(len(groups) - len(rows_to_keep(groups, labels))),
+        "largest_cluster": int(sizes.max()) if len(sizes) else 0,
+    }
+    if labels is not None:
+        mixed = mixed_label_groups(groups, labels)
+        report["mixed_label_clusters"] = int(len(mixed))
+        report["mixed_label_examples"] = [np.flatnonzero(groups == group).tolist() for group in mixed[:examples]]
+
+    largest = duplicate_groups[np.argsort(-sizes[duplicate_groups], kind="stable")][:examples]
+    report["examples"] = [np.flatnonzero(groups == group).tolist() for group in largest]
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MinHash/LSH ile yakın kopya tespiti")
+    parser.add_argument("--input", default=find_dataset(os.path.join(MODELLER_DIR, "clean_dataset")),
+                        help="Temiz veri seti (.parquet ya da .csv)")
+    parser.add_argument("--output", default=None,
+                        help="Çıktı dosyası (group modunda varsayılan: girdi; drop modunda zorunlu)")
+    parser.add_argument("--text-column", default="cleaned_text")
+    parser.add_argument("--mode", choices=["drop", "group"], default="group",
+                        help="group: dup_group sütunu eklenir, drop: kümenin ilk satırı kalır")
+    parser.add_argument("--mixed", choices=["keep", "drop"], default="keep",
+                        help="drop modunda Human + AI karışık kümeler: bütün olarak tutulur ya da silinir")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Tahmini Jaccard eşiği")
+    parser.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM, help="İmza uzunluğu")
+    parser.add_argument("--bands", type=int, default=DEFAULT_BANDS, help="LSH bant sayısı")
+    parser.add_argument("--shingle", type=int, default=DEFAULT_SHINGLE, help="Karakter n-gram uzunluğu")
+    parser.add_argument("--report", help="Küme raporunun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    # Satır silen mod kaynak veri setinin üzerine yazmaz
+    if args.mode == "drop" and (args.output is None
+                                or os.path.abspath(args.output) == os.path.abspath(args.input)):
+        parser.error("--mode drop için girdiden farklı bir --output verin")
+
+    df = read_frame(args.input)
+    texts = df[args.text_column].fillna("").astype(str).tolist()
+
+    started = time.perf_counter()
+    groups = find_clusters(texts, args.threshold, args.num_perm, args.bands, args.shingle)
+    elapsed = time.perf_counter() - started
+
+    labels = df["label"] if "label" in df.columns else None
+    report = cluster_report(groups, labels)
+    print(f"🔍 {report['rows']} metin {elapsed:.1f} sn'de tarandı")
+    print(f"   {report['clusters']} yakın kopya kümesi, {report['rows_in_clusters']} satır "
+          f"(en büyük küme: {report['largest_cluster']})")
+    if "mixed_label_clusters" in report:
+        print(f"   Human + AI karışık küme: {report['mixed_label_clusters']}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    # Kalan satırlar da dup_group taşır: tutulan karışık kümeler train/test'te bölünmez
+    df[GROUP_COLUMN] = groups
+    if args.mode == "drop":
+        df = df.iloc[rows_to_keep(groups, labels, args.mixed)]
+        print(f"🗑️ {report['rows'] - len(df)} satır silindi")
+
+    output = args.output or args.input
+    write_frame(df, output)
+    print(f"💾 {len(df)} satır yazıldı: {output}")
+
+
+if __name__ == "__main__":
+    main()
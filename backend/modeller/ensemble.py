@@ -0,0 +1,106 @@
+"""Model topluluğu (ensemble) – olasılıkları tek bir NumPy dizisinde birleştirir."""
+
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+AI_LABEL = "AI"
+HUMAN_LABEL = "Human"
+
+
+class SklearnMember:
+    """Tek bir sklearn modelini sarar; AI/Human sütunlarını yüklemede bir kez bulur."""
+
+    def __init__(self, name: str, model) -> None:
+        self.names = [name]
+        self.model = model
+        # Genelde alfabetik sırada: ['AI', 'Human']
+        classes = list(model.classes_)
+        ai_index = classes.index(AI_LABEL) if AI_LABEL in classes else 0
+        human_index = classes.index(HUMAN_LABEL) if HUMAN_LABEL in classes else 1
+        self.columns = [ai_index, human_index]
+
+    def predict_ai_human(self, vectors) -> np.ndarray:
+        """(1, satır, 2) boyutunda [AI, Human] olasılıkları döner."""
+        return self.model.predict_proba(vectors)[:, self.columns][np.newaxis]
+
+
+class EnsembleResult(NamedTuple):
+    """Topluluk tahmini; model bazlı diziler (model, satır) boyutundadır."""
+
+    names: List[str]
+    ai_probability: np.ndarray
+    human_probability: np.ndarray
+    is_ai: np.ndarray
+    confidence: np.ndarray
+    average_ai_probability: np.ndarray
+    average_human_probability: np.ndarray
+    verdict_is_ai: np.ndarray
+    # Model başına predict süresi (saniye); tek üyede hesaplanan modeller süreyi paylaşır
+    seconds: List[float]
+
+
+class Ensemble:
+    """Üyelerin olasılıklarını yığıp ortalama, oy ve güveni dizi işlemleriyle hesaplar."""
+
+    def __init__(self, members: List) -> None:
+        self.members = members
+
+    @classmethod
+    def from_models(cls, models: Dict[str, object], fused=None) -> "Ensemble":
+        """Yüklenemeyen (None) modelleri atlayarak topluluğu kurar.
+
+        ``fused`` verilirse kapsadığı modeller tek üye olarak en başta skorlanır.
+        """
+        members: List = [fused] if fused is not None else []
+        covered = set(fused.names) if fused is not None else set()
+        members.extend(
+            SklearnMember(name, model)
+            for name, model in models.items()
+            if model is not None and name not in covered
+        )
+        return cls(members)
+
+    @property
+    def names(self) -> List[str]:
+        return [name for member in self.members for name in member.names]
+
+    def predict(self, vectors) -> Optional[EnsembleResult]:
+        """Tüm satırları tek seferde skorlar; hiçbir model çalışmazsa None döner."""
+        names: List[str] = []
+        seconds: List[float] = []
+        blocks: List[np.ndarray] = []
+        for member in self.members:
+            try:
+                started = time.perf_counter()
+                blocks.append(member.predict_ai_human(vectors))
+                elapsed = time.perf_counter() - started
+                names.extend(member.names)
+                seconds.extend([elapsed] * len(member.names))
+            except Exception as e:
+                print(f"⚠️ {', '.join(member.names)} tahmin hatası: {str(e)}")
+
+        if not blocks:
+            return None
+
+        # (model, satır, [AI, Human]) yüzde olarak
+        probabilities = np.concatenate(blocks, axis=0) * 100
+        ai_probability = probabilities[..., 0]
+        human_probability = probabilities[..., 1]
+
+        is_ai = ai_probability > human_probability
+        ai_votes = is_ai.sum(axis=0)
+        human_votes = is_ai.shape[0] - ai_votes
+
+        return EnsembleResult(
+            names=names,
+            ai_probability=ai_probability,
+            human_probability=human_probability,
+            is_ai=is_ai,
+            confidence=np.maximum(ai_probability, human_probability),
+            average_ai_probability=ai_probability.mean(axis=0),
+            average_human_probability=human_probability.mean(axis=0),
+            verdict_is_ai=ai_votes > human_votes,
+            seconds=seconds,
+        )
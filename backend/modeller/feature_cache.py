@@ -0,0 +1,87 @@
+"""Eğitim için özellik önbelleği – TF-IDF matrisi çalıştırmalar arasında diskte tutulur.
+
+Anahtar, veri dosyasının içerik hash'i ile vektörleştirici ayarlarının
+hash'idir. CSR matrisin ``data`` / ``indices`` / ``indptr`` dizileri ayrı
+``.npy`` dosyalarına yazılır (``.npz`` zip olduğu için mmap ile açılamaz);
+sonraki çalıştırmalar matrisi mmap ile açar ve vektörleştirmeyi tamamen atlar.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Optional, Tuple
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+
+MANIFEST = "manifest.json"
+
+
+def file_fingerprint(path: str, block_size: int = 1 << 20) -> str:
+    """Dosya içeriğinin SHA-256 hash'i (parça parça okunur)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def feature_cache_key(dataset_path: str, vectorizer) -> str:
+    """Veri içeriği + vektörleştirici ayarlarından önbellek anahtarı üretir."""
+    params = json.dumps(vectorizer.get_params(), sort_keys=True, default=str)
+    digest = hashlib.sha256()
+    digest.update(file_fingerprint(dataset_path).encode("utf-8"))
+    digest.update(type(vectorizer).__name__.encode("utf-8"))
+    digest.update(params.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def load_features(cache_dir: str, key: str) -> Optional[Tuple[sp.csr_matrix, np.ndarray, object]]:
+    """Önbellekte varsa (X, y, vectorizer) döner; X'in dizileri mmap ile açılır."""
+    entry = os.path.join(cache_dir, key)
+    manifest_path = os.path.join(entry, MANIFEST)
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    arrays = {name: np.load(os.path.join(entry, f"{name}.npy"), mmap_mode="r")
+              for name in ("data", "indices", "indptr", "labels")}
+    X = sp.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]),
+                      shape=tuple(manifest["shape"]), copy=False)
+    vectorizer = joblib.load(os.path.join(entry, "vectorizer.pkl"))
+    return X, arrays["labels"], vectorizer
+
+
+def save_features(cache_dir: str, key: str, X, y, vectorizer) -> str:
+    """Matrisi, etiketleri ve vektörleştiriciyi önbelleğe yazar.
+
+    Önce geçici dizine yazılıp sonra yeniden adlandırılır; yarım kalan
+    yazma bozuk bir önbellek kaydı bırakmaz.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry = os.path.join(cache_dir, key)
+    X = sp.csr_matrix(X)
+    X.sort_indices()
+
+    staging = tempfile.mkdtemp(prefix=f".{key}-", dir=cache_dir)
+    try:
+        np.save(os.path.join(staging, "data.npy"), X.data)
+        np.save(os.path.join(staging, "indices.npy"), X.indices)
+        np.save(os.path.join(staging, "indptr.npy"), X.indptr)
+        np.save(os.path.join(staging, "labels.npy"), np.asarray(y, dtype=str))
+        joblib.dump(vectorizer, os.path.join(staging, "vectorizer.pkl"))
+        with open(os.path.join(staging, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump({"shape": list(X.shape), "nnz": int(X.nnz)}, f)
+
+        if os.path.exists(entry):
+            shutil.rmtree(entry)
+        os.replace(staging, entry)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return entry
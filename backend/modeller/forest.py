@@ -0,0 +1,92 @@
+"""Random Forest'ı tek dizi setine düzleştirip sklearn'süz skorlar.
+
+Tüm ağaçların düğümleri (sol/sağ çocuk, özellik, eşik, yaprak olasılığı)
+art arda tek dizilerde tutulur. Tahminde tüm satırlar × tüm ağaçlar aynı
+anda, derinlik başına tek bir NumPy adımıyla ilerletilir; ağaç başına
+sklearn çağrısı ve joblib dağıtımı olmaz. Diziler mmap ile açılabilir,
+worker'lar arasında paylaşılır.
+"""
+
+import numpy as np
+
+# Yoğun (dense) parça başına en fazla bu kadar float32 hücre açılır (~32 MB)
+DENSE_CHUNK_CELLS = 8_000_000
+
+
+class FlatForest:
+    """``RandomForestClassifier`` ile aynı ``predict_proba`` sonucunu veren düz ağaç dizileri."""
+
+    def __init__(self, left: np.ndarray, right: np.ndarray, feature: np.ndarray,
+                 threshold: np.ndarray, leaf_proba: np.ndarray, roots: np.ndarray,
+                 max_depth: int, classes, n_features: int) -> None:
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.leaf_proba = leaf_proba
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = n_features
+
+    @classmethod
+    def from_forest(cls, forest) -> "FlatForest":
+        """Eğitilmiş ``RandomForestClassifier`` ağaçlarını tek dizi setinde birleştirir."""
+        lefts, rights, features, thresholds, probas, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+
+            # Yapraklar kendilerini gösterir: ek adımlar sonucu değiştirmez
+            lefts.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+
+            # DecisionTreeClassifier.predict_proba ile aynı normalizasyon
+            value = tree.value[:, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            probas.append(value / normalizer)
+
+            roots.append(offset)
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            np.concatenate(lefts).astype(np.int32),
+            np.concatenate(rights).astype(np.int32),
+            np.concatenate(features).astype(np.int32),
+            np.concatenate(thresholds).astype(np.float64),
+            np.concatenate(probas),
+            np.array(roots, dtype=np.int32),
+            max_depth,
+            forest.classes_,
+            forest.n_features_in_,
+        )
+
+    def _leaves(self, dense: np.ndarray) -> np.ndarray:
+        """(satır, ağaç) boyutunda yaprak düğüm indekslerini döner."""
+        rows = np.arange(dense.shape[0])[:, np.newaxis]
+        nodes = np.broadcast_to(self.roots, (dense.shape[0], len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            # sklearn gibi float32 değer <= float64 eşik
+            go_left = dense[rows, self.feature[nodes]] <= self.threshold[nodes]
+            next_nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+            if np.array_equal(next_nodes, nodes):
+                break
+            nodes = next_nodes
+        return nodes
+
+    def predict_proba(self, vectors) -> np.ndarray:
+        n_rows = vectors.shape[0]
+        chunk = max(1, DENSE_CHUNK_CELLS // max(1, vectors.shape[1]))
+        proba = np.empty((n_rows, len(self.classes_)), dtype=np.float64)
+        for start in range(0, n_rows, chunk):
+            part = vectors[start:start + chunk]
+            dense = part.toarray().astype(np.float32) if hasattr(part, "toarray") else np.asarray(part, np.float32)
+            proba[start:start + chunk] = self.leaf_proba[self._leaves(dense)].mean(axis=1)
+        return proba
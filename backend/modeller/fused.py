@@ -0,0 +1,67 @@
+"""Lineer modelleri (Logistic Regression + Naive Bayes) tek matris çarpımında skorlar.
+
+İki model de TF-IDF özelliklerinde lineerdir: LR'nin katsayı vektörü ve NB'nin
+``feature_log_prob_`` matrisi tek bir yoğun ağırlık matrisinde yan yana durur,
+böylece iki model tek bir sparse-dense çarpımla hesaplanır.
+"""
+
+from typing import List
+
+import numpy as np
+from scipy.special import expit, logsumexp
+
+from ensemble import AI_LABEL, HUMAN_LABEL
+
+
+def _ai_human_columns(classes) -> List[int]:
+    classes = list(classes)
+    ai_index = classes.index(AI_LABEL) if AI_LABEL in classes else 0
+    human_index = classes.index(HUMAN_LABEL) if HUMAN_LABEL in classes else 1
+    return [ai_index, human_index]
+
+
+class FusedLinearModel:
+    """LR ve MultinomialNB'nin ağırlıklarını (özellik, 1 + sınıf) matrisinde tutar.
+
+    Sütun 0 LR'nin karar fonksiyonu, kalan sütunlar NB'nin sınıf bazlı
+    log-olabilirlikleridir. Olasılıklar sklearn'ün ``predict_proba`` çıktısıyla aynıdır.
+    """
+
+    names = ["Logistic Regression", "Naive Bayes"]
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray, lr_classes, nb_classes) -> None:
+        self.weights = weights
+        self.bias = bias
+        self.lr_classes = np.asarray(lr_classes)
+        self.nb_classes = np.asarray(nb_classes)
+        self.lr_columns = _ai_human_columns(self.lr_classes)
+        self.nb_columns = _ai_human_columns(self.nb_classes)
+
+    @classmethod
+    def from_models(cls, logistic, naive_bayes) -> "FusedLinearModel":
+        """Eğitilmiş ikili LogisticRegression ve MultinomialNB'den birleşik modeli kurar."""
+        if logistic.coef_.shape[0] != 1:
+            raise ValueError("Sadece ikili (binary) LogisticRegression birleştirilebilir")
+
+        weights = np.hstack([logistic.coef_.T, naive_bayes.feature_log_prob_.T])
+        bias = np.concatenate([logistic.intercept_, naive_bayes.class_log_prior_])
+        return cls(
+            np.ascontiguousarray(weights, dtype=np.float64),
+            bias.astype(np.float64),
+            logistic.classes_,
+            naive_bayes.classes_,
+        )
+
+    def predict_ai_human(self, vectors) -> np.ndarray:
+        """(2, satır, 2) boyutunda [AI, Human] olasılıkları döner (LR, NB sırasıyla)."""
+        scores = np.asarray(vectors @ self.weights) + self.bias
+
+        # LR: ikili durumda expit(karar) ikinci sınıfın olasılığıdır
+        positive = expit(scores[:, 0])
+        logistic = np.column_stack([1 - positive, positive])
+
+        # NB: ortak log-olabilirlikten softmax
+        joint = scores[:, 1:]
+        naive_bayes = np.exp(joint - logsumexp(joint, axis=1, keepdims=True))
+
+        return np.stack([logistic[:, self.lr_columns], naive_bayes[:, self.nb_columns]])
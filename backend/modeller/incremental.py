@@ -0,0 +1,109 @@
+"""Artımlı yeniden eğitim – yeni eklenen satırlar tüm veri yeniden işlenmeden öğrenilir.
+
+Kullanım (backend/modeller dizininde):
+    python incremental.py --new data/raw/new_rows.parquet
+
+Yeni satırlar etkin sürümün dondurulmuş sözlüğüyle vektörleştirilir,
+Naive Bayes sayımları ``partial_fit`` ile güncellenir ve lineer model
+mevcut ağırlıklardan başlayan (warm-start) lojistik kayıplı SGD ile
+birkaç adım ilerletilir. Sonuç yeni bir sürüm olarak yayınlanır; maliyet
+tüm veriyle değil, eklenen satır sayısıyla orantılıdır. Random Forest
+değişmeden yeni sürüme taşınır.
+"""
+
+import argparse
+import os
+import time
+
+import joblib
+import numpy as np
+from sklearn.linear_model import SGDClassifier
+
+from bundles import BUNDLE_FILES, copy_files, dump_artifact, publish, read_manifest, resolve_model_dir, stage_bundle
+from dataset_io import read_frame
+from fused import FusedLinearModel
+from normalization import normalize_batch
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+CLASSES = ("AI", "Human")
+
+
+def warm_start_sgd(logistic, X, y, alpha: float, eta0: float, seed: int = 42) -> SGDClassifier:
+    """Eğitilmiş LogisticRegression ağırlıklarından başlayan bir SGDClassifier kurar.
+
+    liblinear warm-start desteklemez; SGD ise aynı lojistik kaybı ``partial_fit``
+    ile küçük adımlarla günceller. İlk ``partial_fit`` çağrısı sadece iç durumu
+    (classes_, n_features_in_) kurmak içindir, ağırlıklar hemen geri yazılır.
+    """
+    sgd = SGDClassifier(loss='log_loss', alpha=alpha, learning_rate='constant', eta0=eta0, random_state=seed)
+    sgd.partial_fit(X[:1], y[:1], classes=logistic.classes_)
+    sgd.coef_ = np.array(logistic.coef_, dtype=np.float64)
+    sgd.intercept_ = np.array(logistic.intercept_, dtype=np.float64)
+    return sgd
+
+
+def update_bundle(new_rows_path: str, model_dir: str, text_column: str, epochs: int,
+                  alpha: float, eta0: float) -> None:
+    base_dir = resolve_model_dir(model_dir)
+    parent = read_manifest(base_dir).get("version")
+    print(f"📦 Temel paket: {base_dir}")
+
+    df = read_frame(new_rows_path)
+    if text_column not in df.columns and 'abstract_text' in df.columns:
+        print(f"⚠️ '{text_column}' sütunu yok, 'abstract_text' kullanılıyor")
+        text_column = 'abstract_text'
+    df = df.dropna(subset=[text_column, 'label'])
+    df = df[df['label'].isin(CLASSES)]
+    if df.empty:
+        print("❌ Eklenecek geçerli satır yok")
+        return
+
+    started = time.perf_counter()
+    # Sözlük ve IDF dondurulmuş: sadece yeni satırlar vektörleştirilir.
+    # Ham sütun (abstract_text) geldiyse cleaned_text ile aynı normalizasyon uygulanır.
+    vectorizer = joblib.load(os.path.join(base_dir, 'vectorizer.pkl'))
+    X = vectorizer.transform(normalize_batch(df[text_column].tolist()))
+    y = df['label'].to_numpy()
+
+    naive_bayes = joblib.load(os.path.join(base_dir, 'model_naive_bayes.pkl'))
+    naive_bayes.partial_fit(X, y)
+
+    logistic = joblib.load(os.path.join(base_dir, 'model_logistic.pkl'))
+    if not isinstance(logistic, SGDClassifier):
+        logistic = warm_start_sgd(logistic, X, y, alpha, eta0)
+    for _ in range(epochs):
+        logistic.partial_fit(X, y)
+    print(f"⏱️ {len(y)} yeni satır {time.perf_counter() - started:.2f} sn'de öğrenildi")
+
+    staging = stage_bundle(model_dir)
+    dump_artifact(naive_bayes, os.path.join(staging, 'model_naive_bayes.pkl'))
+    dump_artifact(logistic, os.path.join(staging, 'model_logistic.pkl'))
+    dump_artifact(FusedLinearModel.from_models(logistic, naive_bayes), os.path.join(staging, 'model_fused.pkl'))
+    # Vektörleştirici ve Random Forest değişmedi
+    copy_files(base_dir, staging, BUNDLE_FILES)
+
+    version = publish(model_dir, staging, {
+        "mode": "incremental",
+        "parent": parent,
+        "new_rows": int(len(y)),
+        "source": os.path.abspath(new_rows_path),
+    })
+    print(f"🚀 Yeni sürüm yayınlandı: {version}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Yeni satırlarla modelleri artımlı günceller")
+    parser.add_argument("--new", required=True,
+                        help="Yeni satırları içeren veri seti (.parquet ya da .csv; metin + label)")
+    parser.add_argument("--text-column", default="cleaned_text", help="Metin sütunu")
+    parser.add_argument("--model-dir", default=MODEL_DIR, help="Model dizini (versions/ burada tutulur)")
+    parser.add_argument("--epochs", type=int, default=3, help="Lineer model için yeni veri üzerinde geçiş sayısı")
+    parser.add_argument("--alpha", type=float, default=1e-4, help="SGD L2 düzenlileştirme katsayısı")
+    parser.add_argument("--eta0", type=float, default=0.01, help="SGD sabit öğrenme oranı")
+    args = parser.parse_args()
+
+    update_bundle(args.new, args.model_dir, args.text_column, args.epochs, args.alpha, args.eta0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Basit Prometheus uyumlu metrikler – ek bağımlılık gerektirmez."""
+
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Saniye cinsinden kova sınırları (0.5 ms – 2.5 s)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    return "{" + body + "}"
+
+
+class Histogram:
+    """Etiket değeri başına kova sayaçları, toplam ve adet tutan histogram."""
+
+    def __init__(self, name: str, help_text: str, label_name: Optional[str] = None,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_name = label_name
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # etiket -> [kova sayaçları..., +Inf sayacı], toplam
+        self._counts: Dict[Optional[str], List[int]] = {}
+        self._sums: Dict[Optional[str], float] = {}
+
+    def observe(self, value: float, label: Optional[str] = None) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(label)
+            if counts is None:
+                counts = self._counts[label] = [0] * (len(self.buckets) + 1)
+                self._sums[label] = 0.0
+            counts[index] += 1
+            self._sums[label] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(label, list(counts), self._sums[label]) for label, counts in self._counts.items()]
+
+        for label, counts, total in snapshot:
+            labels = {self.label_name: label} if self.label_name and label is not None else {}
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': repr(bound)})} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class CallbackMetric:
+    """Değeri okuma anında bir fonksiyondan alınan counter/gauge."""
+
+    def __init__(self, name: str, help_text: str, metric_type: str, read: Callable[[], float]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.metric_type = metric_type
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+            f"{self.name} {self.read()}",
+        ]
+
+
+class MetricsRegistry:
+    """Metrikleri toplar ve Prometheus metin formatında yazar."""
+
+    def __init__(self) -> None:
+        self._metrics: List = []
+
+    def histogram(self, name: str, help_text: str, label_name: Optional[str] = None,
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help_text, label_name, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def callback(self, name: str, help_text: str, metric_type: str,
+                 read: Callable[[], float]) -> CallbackMetric:
+        metric = CallbackMetric(name, help_text, metric_type, read)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -1,75 +1,164 @@
-import pandas as pd
-import joblib
+import argparse
 import os
+import time
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 from sklearn.model_selection import train_test_split
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score
 
-print("3 AYRI MODEL EĞİTİMİ BAŞLADI ")
+from bundles import BUNDLE_FILES, copy_files, dump_artifact, publish, stage_bundle
+from dataset_io import find_dataset, read_columns, read_frame
+from feature_cache import feature_cache_key, load_features, save_features
+from featurizer import CompactTfidfVectorizer
+from forest import FlatForest
+from fused import FusedLinearModel
+from splitting import GROUP_COLUMNS, group_ids, grouped_stratified_split, read_groups
+from streaming import DEFAULT_CHUNKSIZE, DEFAULT_N_FEATURES, train_streaming
+from training import N_JOBS, build_models, fit_models
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
-file_path = os.path.join(current_dir, 'clean_dataset.csv')
 
-try:
-    df = pd.read_csv(file_path)
-    df = df.dropna(subset=['cleaned_text', 'label'])
-except Exception as e:
-    print(f" HATA: {e}")
-    exit()
+MODEL_FILES = {
+    "Logistic Regression": "model_logistic.pkl",
+    "Naive Bayes": "model_naive_bayes.pkl",
+    "Random Forest": "model_random_forest.pkl",
+}
 
-# Harf Analizi (Stylometry) 
-print("⏳Vektör haritası çıkarılıyor (3-5 harflik bloklar)...")
-vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 5), max_features=30000, min_df=5)
 
-X = vectorizer.fit_transform(df['cleaned_text'])
-y = df['label']
+def main():
+    parser = argparse.ArgumentParser(description="3 ayrı modeli eğitir ve API dosyalarını kaydeder")
+    parser.add_argument("--jobs", type=int, default=N_JOBS, help="Random Forest çekirdek sayısı (-1: hepsi)")
+    parser.add_argument("--sequential", action="store_true", help="Modelleri sırayla eğit (paralel değil)")
+    parser.add_argument("--feature-cache-dir", default=os.path.join(current_dir, '.feature_cache'),
+                        help="TF-IDF matrisinin saklandığı önbellek dizini")
+    parser.add_argument("--no-feature-cache", action="store_true", help="Özellik önbelleğini kullanma")
+    parser.add_argument("--stream", action="store_true",
+                        help="Akış modu: CSV parça parça okunur, bellek veri boyutundan bağımsız kalır")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Akış modunda parça başına satır")
+    parser.add_argument("--n-features", type=int, default=DEFAULT_N_FEATURES, help="Akış modunda hash boyutu")
+    parser.add_argument("--epochs", type=int, default=1, help="Akış modunda SGD geçiş sayısı")
+    parser.add_argument("--output-dir", default=os.path.join(current_dir, 'streaming_models'),
+                        help="Akış modunda model dosyalarının yazılacağı dizin")
+    args = parser.parse_args()
 
-joblib.dump(vectorizer, os.path.join(current_dir, 'vectorizer.pkl'))
+    # data_cleaning.py clean_dataset.parquet yazar; eski clean_dataset.csv de okunur
+    file_path = find_dataset(os.path.join(current_dir, 'clean_dataset'))
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.15, random_state=42, stratify=y)
+    if args.stream:
+        print("AKIŞ MODUNDA EĞİTİM BAŞLADI (SGD + Naive Bayes)")
+        train_streaming(file_path, args.output_dir, chunksize=args.chunksize,
+                        n_features=args.n_features, epochs=args.epochs)
+        return
 
+    print("3 AYRI MODEL EĞİTİMİ BAŞLADI ")
+
+    # Harf Analizi (Stylometry) 
+    vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 5), max_features=30000, min_df=5)
+
+    # Veri ve vektörleştirici ayarları değişmediyse matris önbellekten (mmap) okunur
+    cache_key = None
+    cached = None
+    groups = None
+    if not args.no_feature_cache and os.path.exists(file_path):
+        cache_key = feature_cache_key(file_path, vectorizer)
+        cached = load_features(args.feature_cache_dir, cache_key)
+
+    if cached is not None:
+        X, y, vectorizer = cached
+        print(f"⚡ Özellik önbelleği kullanıldı ({cache_key}): {X.shape[0]} satır, vektörleştirme atlandı")
+        groups = read_groups(file_path)
+    else:
+        try:
+            # Sadece eğitimde kullanılan sütunlar okunur (Parquet'te diğerleri diskten hiç okunmaz)
+            header = read_columns(file_path)
+            columns = ['cleaned_text', 'label'] + [column for column in GROUP_COLUMNS if column in header]
+            df = read_frame(file_path, columns)
+            df = df.dropna(subset=['cleaned_text', 'label'])
+        except Exception as e:
+            print(f" HATA: {e}")
+            return
+
+        print("⏳Vektör haritası çıkarılıyor (3-5 harflik bloklar)...")
+        X = vectorizer.fit_transform(df['cleaned_text'])
+        y = df['label'].to_numpy(dtype=object)
+        if any(column in df.columns for column in GROUP_COLUMNS):
+            groups = group_ids(df)
+
+        # Budanan n-gram kümesi (stop_words_) sadece inceleme içindir, pickle'ı şişirir
+        if hasattr(vectorizer, 'stop_words_'):
+            delattr(vectorizer, 'stop_words_')
+
+        if cache_key is not None:
+            save_features(args.feature_cache_dir, cache_key, X, y, vectorizer)
+            print(f"💾 Özellik önbelleğine yazıldı: {cache_key}")
+
+    # Tüm model dosyaları sıkıştırılmadan kaydedilir: API bunları mmap ile açar
+    # ve idf / katsayı dizileri worker'lar arasında paylaşılan sayfalar olur.
+    # dump_artifact yeni dosya yazıp yerine koyar; açık mmap'ler ve yayınlanmış
+    # sürümler eski dosyayı görmeye devam eder
+    dump_artifact(vectorizer, os.path.join(current_dir, 'vectorizer.pkl'))
+
+    # API için sözlüksüz, aynı indeksleri üreten kompakt vektörleştirici
+    dump_artifact(CompactTfidfVectorizer.from_vectorizer(vectorizer), os.path.join(current_dir, 'vectorizer_compact.pkl'))
+
+    if groups is not None:
+        # Orijinal abstract ve yeniden yazımı (pair_id) / yakın kopyaları (dup_group) aynı tarafta kalır
+        train_idx, test_idx = grouped_stratified_split(groups, y, test_size=0.15, seed=42)
+        X_train, X_test, y_train, y_test = X[train_idx], X[test_idx], y[train_idx], y[test_idx]
+        print(f"🔗 Gruplu ayrım: {int(groups.max()) + 1} grup, {len(test_idx)} test satırı")
+    else:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.15, random_state=42, stratify=y)
+
+    print("\nModeller eğitiliyor \n")
+
+    # Bağımsız modeller aynı anda, Random Forest tüm çekirdeklerle eğitilir
+    started = time.perf_counter()
+    models = fit_models(build_models(n_jobs=args.jobs), X_train, y_train, parallel=not args.sequential)
+    print(f"⏱️ Toplam eğitim süresi: {time.perf_counter() - started:.1f} sn\n")
+
+    model_names = []
+    accuracies = []
+
+    for name, model in models.items():
+        y_pred = model.predict(X_test)
+        acc = accuracy_score(y_test, y_pred) * 100
+
+        model_names.append(name)
+        accuracies.append(acc)
+
+        # Ayrı dosyalara kaydetme
+        dosya_adi = MODEL_FILES[name]
+        dump_artifact(model, os.path.join(current_dir, dosya_adi))
+        print(f"💾 {dosya_adi} kaydedildi. Başarı: %{acc:.2f}")
+
+    # LR + NB ağırlıklarını tek matriste birleştir (API tek çarpımla skorlar)
+    fused = FusedLinearModel.from_models(models["Logistic Regression"], models["Naive Bayes"])
+    dump_artifact(fused, os.path.join(current_dir, 'model_fused.pkl'))
+    print("💾 model_fused.pkl kaydedildi.")
+
+    # Random Forest'ı düz dizilere derle (API ağaç başına sklearn çağrısı yapmaz)
+    flat_forest = FlatForest.from_forest(models["Random Forest"])
+    dump_artifact(flat_forest, os.path.join(current_dir, 'model_random_forest_flat.pkl'))
+    print(f"💾 model_random_forest_flat.pkl kaydedildi. ({len(flat_forest.left)} düğüm, derinlik {flat_forest.max_depth})")
+
+    # Tam eğitimi de sürüm olarak yayınla: API etkin sürümü (versions/CURRENT) okur
+    staging = stage_bundle(current_dir)
+    copy_files(current_dir, staging, BUNDLE_FILES)
+    version = publish(current_dir, staging, {"mode": "full", "rows": int(X.shape[0])})
+    print(f"🚀 Sürüm yayınlandı: {version}")
+
+    # Grafik
+    plt.figure(figsize=(10, 6))
+    plt.bar(model_names, accuracies, color=['#3498db', '#2ecc71', '#e74c3c'])
+    plt.title('3 Ayrı Modelin Başarısı')
+    plt.ylabel('Başarı (%)')
+    plt.ylim(0, 100)
+    plt.savefig(os.path.join(current_dir, 'model_accuracy.png'))
+    plt.close()
+    print(f"📊 Grafik kaydedildi: model_accuracy.png")
 
-models = {
-    "Logistic Regression": LogisticRegression(max_iter=1000, solver='liblinear', C=1.0),
-    "Naive Bayes": MultinomialNB(alpha=0.1),
-    "Random Forest": RandomForestClassifier(n_estimators=300, random_state=42)
-}
 
-print("\nModeller eğitiliyor \n")
-
-model_names = []
-accuracies = []
-
-for name, model in models.items():
-    print(f" {name} eğitiliyor...")
-    model.fit(X_train, y_train)
-    
-    y_pred = model.predict(X_test)
-    acc = accuracy_score(y_test, y_pred) * 100
-    
-    model_names.append(name)
-    accuracies.append(acc)
-    
-    # Ayrı dosyalara kaydetme
-    if name == "Logistic Regression": dosya_adi = "model_logistic.pkl"
-    elif name == "Naive Bayes": dosya_adi = "model_naive_bayes.pkl"
-    else: dosya_adi = "model_random_forest.pkl"
-        
-    joblib.dump(model, os.path.join(current_dir, dosya_adi))
-    print(f"💾 {dosya_adi} kaydedildi. Başarı: %{acc:.2f}")
-
-# Grafik
-plt.figure(figsize=(10, 6))
-plt.bar(model_names, accuracies, color=['#3498db', '#2ecc71', '#e74c3c'])
-plt.title('3 Ayrı Modelin Başarısı')
-plt.ylabel('Başarı (%)')
-plt.ylim(0, 100)
-plt.savefig(os.path.join(current_dir, 'model_accuracy.png'))
-plt.close()
-print(f"📊 Grafik kaydedildi: model_accuracy.png")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""Eğitim ve API'nin ortak metin normalizasyonu.
+
+Eğitim verisindeki ``cleaned_text`` sütunu bu fonksiyonla üretilir; API de
+tahminden önce aynı fonksiyonu uygular. Böylece model eğitimde ve serviste
+aynı girdiyi görür (ör. URL'ler iki tarafta da silinir). Normalize metin
+tahmin önbelleğinin anahtarı olarak da kullanılır.
+"""
+
+import re
+from typing import Iterable, List
+
+_URL = re.compile(r"http\S+")
+
+
+def normalize(text) -> str:
+    """Küçük harf, URL'siz, tek boşluklu metin (notebook'taki ``general_cleaning``).
+
+    ``str.split`` ile ``re``'nin ``\\s`` sınıfı aynı Unicode boşluklarını
+    tanır; ``" ".join(split())`` notebook'taki ``\\n`` ve ``\\s+`` yerine
+    koymalarıyla aynı sonucu tek geçişte verir. URL regex'i sadece metinde
+    "http" geçiyorsa çalışır.
+    """
+    if not isinstance(text, str):
+        return ""
+    text = text.lower()
+    if "http" in text:
+        text = _URL.sub("", text)
+    return " ".join(text.split())
+
+
+def normalize_batch(texts: Iterable) -> List[str]:
+    """Liste için ``normalize``; metin olmayan elemanlar boş string olur."""
+    return [normalize(text) for text in texts]
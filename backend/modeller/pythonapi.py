@@ -1,43 +1,302 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+import hmac
 import joblib
 import os
+import threading
+import time
 import numpy as np
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.pipeline import FeatureUnion
+import config
+from bundles import ModelBundle, bundle_fingerprint, current_version, read_manifest, resolve_model_dir
+from cache import cache_key, create_cache
+from ensemble import Ensemble
+from metrics import MetricsRegistry
+from normalization import normalize_batch
+from segmenter import split_segments
 
 
 app = Flask(__name__)
 CORS(app)
 
-MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
-
-def load_model(filename):
-    path = os.path.join(MODEL_DIR, filename)
+def load_model(model_dir, filename):
+    """Model dosyasını açar; NumPy dizileri mmap ile diskten paylaşımlı okunur."""
+    path = os.path.join(model_dir, filename)
     try:
-        return joblib.load(path)
+        return joblib.load(path, mmap_mode=config.MMAP_MODE)
     except Exception as e:
         print(f"⚠️ UYARI: {filename} yüklenemedi! - {str(e)}")
         return None
 
 
-vectorizer = load_model("vectorizer.pkl")
-models = {
-    "Logistic Regression": load_model("model_logistic.pkl"),
-    "Naive Bayes": load_model("model_naive_bayes.pkl"),
-    "Random Forest": load_model("model_random_forest.pkl") 
-}
+def load_forest(model_dir):
+    """Ayara göre düz (hızlı) ya da sklearn ormanını yükler; düz dosya yoksa sklearn'e düşer."""
+    if config.FOREST_ENGINE == "flat":
+        forest = load_model(model_dir, "model_random_forest_flat.pkl")
+        if forest is not None:
+            return forest
+    return load_model(model_dir, "model_random_forest.pkl")
 
-# Debug: Modellerin yüklenme durumunu kontrol et
-print(f"🔍 Vectorizer yüklendi: {vectorizer is not None}")
-for name, model in models.items():
-    print(f"🔍 {name} yüklendi: {model is not None}")
 
-@app.route('/predict', methods=['POST'])
-def predict():
+def load_bundle(model_dir):
+    """Bir dizindeki vektörleştirici ve modelleri tek ``ModelBundle`` olarak yükler."""
+    # Kompakt vektörleştirici aynı özellikleri üretir; yoksa sklearn nesnesine düşülür
+    vectorizer = load_model(model_dir, "vectorizer_compact.pkl") if config.USE_COMPACT_VECTORIZER else None
+    if vectorizer is None:
+        vectorizer = load_model(model_dir, "vectorizer.pkl")
+
+    # LR + NB birleşik modelden tek çarpımla skorlanır; yoksa ayrı .pkl'lere düşülür
+    fused_model = load_model(model_dir, "model_fused.pkl") if config.USE_FUSED else None
+    models = {
+        "Logistic Regression": None if fused_model else load_model(model_dir, "model_logistic.pkl"),
+        "Naive Bayes": None if fused_model else load_model(model_dir, "model_naive_bayes.pkl"),
+        "Random Forest": load_forest(model_dir) if config.USE_RANDOM_FOREST else None
+    }
+
+    # Class indeksleri yüklemede bir kez çözülür
+    ensemble = Ensemble.from_models(models, fused=fused_model)
+
+    # Debug: Modellerin yüklenme durumunu kontrol et
+    print(f"🔍 Model dizini: {model_dir}")
+    print(f"🔍 Vectorizer yüklendi: {type(vectorizer).__name__ if vectorizer is not None else None}")
+    print(f"🔍 Birleşik lineer model: {fused_model is not None}")
+    print(f"🔍 Random Forest: {type(models['Random Forest']).__name__ if models['Random Forest'] is not None else None}")
+    print(f"🔍 Aktif modeller: {ensemble.names}")
+
+    # Sürümsüz (düz dizin) pakette önbellek ad alanı dosyaların özetidir;
+    # aynı dizin yeniden yüklenince eski tahminler yeni modele dönmez
+    version = read_manifest(model_dir).get("version")
+    namespace = version or f"flat-{bundle_fingerprint(model_dir)}"
+    return ModelBundle(version, model_dir, vectorizer, ensemble, namespace)
+
+
+# Sürümlü paket varsa etkin sürüm (versions/CURRENT), yoksa düz model dizini.
+# İstekler başta bu referansı bir kez okur; yeniden yüklemede tek atamayla değişir.
+# Tembel modda boş bir paketle başlanır, asıl paket arka planda yüklenir.
+models_loaded = threading.Event()
+if config.LAZY_LOAD:
+    bundle = ModelBundle(None, None, None, Ensemble([]))
+else:
+    bundle = load_bundle(resolve_model_dir(config.MODEL_DIR))
+    models_loaded.set()
+
+# Isınma tahmini: yeni paket bu metni skorlayamazsa devreye alınmaz
+WARMUP_TEXT = "This warm-up abstract checks that the model bundle can score text before it serves traffic."
+
+reload_lock = threading.Lock()
+# failedModelDir: yüklenemeyen / ısınmayan dizin; CURRENT başka yere dönene kadar tekrar denenmez
+reload_state = {"reloading": False, "lastError": None, "failedModelDir": None, "reloads": 0}
+
+
+def warm_up(candidate):
+    """Paketi bir kez çalıştırır: mmap sayfaları okunur, ilk istekte gecikme sıçraması olmaz."""
+    if not candidate.vectorizer:
+        raise RuntimeError("vektörleştirici yüklenemedi")
+    result = candidate.ensemble.predict(candidate.vectorizer.transform([WARMUP_TEXT]))
+    if result is None:
+        raise RuntimeError("hiçbir model tahmin üretemedi")
+
+
+def reload_bundle(force=False):
+    """Etkin sürümü yükler, ısıtır ve ancak başarılıysa eski paketin yerine koyar.
+
+    Yükleme sırasında istekler eski paketle cevaplanmaya devam eder. Her
+    worker süreci kendi paketini tutar; çok worker'lı kurulumda tüm
+    worker'ların geçmesi için HUMANORAI_WATCH_INTERVAL kullanılmalıdır.
+    """
+    with reload_lock:
+        return _reload_locked(force)
+
+
+def _reload_locked(force):
+    """``reload_bundle`` gövdesi; çağıran ``reload_lock``'u tutmalıdır."""
+    global bundle
+    model_dir = resolve_model_dir(config.MODEL_DIR)
+    if not force and model_dir in (bundle.model_dir, reload_state["failedModelDir"]):
+        return False
+
+    reload_state["reloading"] = True
+    try:
+        candidate = load_bundle(model_dir)
+        warm_up(candidate)
+    except Exception as e:
+        reload_state["lastError"] = str(e)
+        reload_state["failedModelDir"] = model_dir
+        print(f"⚠️ Yeni model paketi devreye alınmadı ({model_dir}): {str(e)}")
+        return False
+    finally:
+        reload_state["reloading"] = False
+
+    bundle = candidate
+    reload_state["lastError"] = None
+    reload_state["failedModelDir"] = None
+    reload_state["reloads"] += 1
+    print(f"🔄 Model paketi değişti: {candidate.version or candidate.model_dir}")
+    return True
+
+
+def _reload_in_background(force):
+    """``reload_lock`` zaten alınmışken (bkz. ``reload_endpoint``) yüklemeyi yapar ve kilidi bırakır."""
+    try:
+        _reload_locked(force)
+    finally:
+        reload_lock.release()
+
+
+def watch_versions(interval):
+    """versions/CURRENT değiştikçe yeni sürümü arka planda devreye alır."""
+    while True:
+        time.sleep(interval)
+        try:
+            # Yüklenemeyen sürüm reload_bundle içinde atlanır (bkz. failedModelDir)
+            if current_version(config.MODEL_DIR) != bundle.version:
+                reload_bundle()
+        except Exception as e:
+            print(f"⚠️ Sürüm izleme hatası: {str(e)}")
+
+
+def start_watcher():
+    if config.WATCH_INTERVAL > 0:
+        threading.Thread(target=watch_versions, args=(config.WATCH_INTERVAL,),
+                         name="bundle-watcher", daemon=True).start()
+
 
-    safe_response = {
+start_watcher()
+# gunicorn preload ile fork edilen worker'larda thread'ler kopyalanmaz: yeniden başlat
+os.register_at_fork(after_in_child=start_watcher)
+
+loader_lock = threading.Lock()
+loader_pid = None
+
+
+def load_initial_bundle():
+    try:
+        reload_bundle()
+    finally:
+        models_loaded.set()
+
+
+def load_in_background():
+    """Tembel modda paketi süreç başına bir kez arka planda yüklemeye başlar."""
+    global loader_pid
+    with loader_lock:
+        if models_loaded.is_set() or loader_pid == os.getpid():
+            return
+        loader_pid = os.getpid()
+    threading.Thread(target=load_initial_bundle, name="bundle-loader", daemon=True).start()
+
+
+def readiness():
+    """(hazır mı, cevap gövdesi); modeller yüklenip skor üretebiliyorsa hazırdır."""
+    current = bundle
+    ready = bool(current.vectorizer) and bool(current.ensemble.members)
+    return ready, {
+        "ready": ready,
+        "loading": not models_loaded.is_set(),
+        "version": current.version,
+        "models": current.ensemble.names,
+    }
+
+
+def version_info():
+    """/version cevabı (Flask ve async sunucu ortak)."""
+    current = bundle
+    return {
+        "version": current.version,
+        "modelDir": current.model_dir,
+        "models": current.ensemble.names,
+        "reloading": reload_state["reloading"],
+        "lastReloadError": reload_state["lastError"],
+        "failedModelDir": reload_state["failedModelDir"],
+    }
+
+
+def start_reload(token, force):
+    """/reload isteğini işler; (cevap gövdesi, durum kodu) döner (Flask ve async sunucu ortak).
+
+    Aynı anda tek yükleme çalışır: sürmekte olan varsa 409 döner, istek
+    kuyruğa alınmaz. Etkin dizin değişmediyse thread açılmadan 200 döner.
+    """
+    authorized = bool(config.RELOAD_TOKEN) and hmac.compare_digest(token.encode("utf-8"),
+                                                                   config.RELOAD_TOKEN.encode("utf-8"))
+    if config.RELOAD_TOKEN and not authorized:
+        return {"message": "Geçersiz yeniden yükleme anahtarı"}, 401
+    if force and not authorized:
+        return {"message": "force=1 için HUMANORAI_RELOAD_TOKEN tanımlanmalı"}, 403
+
+    if not reload_lock.acquire(blocking=False):
+        return {"status": "busy", "version": bundle.version}, 409
+    if not force and resolve_model_dir(config.MODEL_DIR) in (bundle.model_dir, reload_state["failedModelDir"]):
+        reload_lock.release()
+        return {"status": "unchanged", "version": bundle.version, "lastReloadError": reload_state["lastError"]}, 200
+
+    try:
+        threading.Thread(target=_reload_in_background, args=(force,), name="bundle-reload", daemon=True).start()
+    except Exception:
+        reload_lock.release()
+        raise
+    return {"status": "reloading", "version": bundle.version}, 202
+
+
+def batch_request_error(data):
+    """Geçersiz /predict/batch gövdesi için 400 cevabı; geçerliyse None."""
+    if not isinstance(data, dict):
+        return {"message": "Gövde {\"texts\": [...]} biçiminde JSON olmalı", "results": []}
+    if not isinstance(data.get('texts'), list):
+        return {"message": "'texts' bir liste olmalı", "results": []}
+    if len(data['texts']) > MAX_BATCH_SIZE:
+        return {"message": f"En fazla {MAX_BATCH_SIZE} metin gönderilebilir", "results": []}
+    return None
+
+
+def segments_request_error(data):
+    """Geçersiz /predict/segments gövdesi için 400 cevabı; geçerliyse None."""
+    if not isinstance(data, dict):
+        return {"message": "Gövde {\"text\": ...} biçiminde JSON olmalı", "segments": []}
+    if not isinstance(data.get('text', ''), str):
+        return {"message": "'text' bir metin olmalı", "segments": []}
+    if data.get('mode', 'sentence') not in ("sentence", "window"):
+        return {"message": "'mode' sentence veya window olmalı", "segments": []}
+    return None
+
+
+if config.LAZY_LOAD:
+    # Master süreç yüklemez (fork'ta yarım kalan thread olmasın); her worker fork'tan
+    # hemen sonra kendi yüklemesini başlatır. Fork'suz sunucularda ilk istek başlatır.
+    os.register_at_fork(after_in_child=load_in_background)
+
+
+MAX_BATCH_SIZE = 1000
+# Parçalı skorlamada tek transform'a giren parça sayısı (yoğun RF bloğu sınırlı kalır)
+SEGMENT_BATCH_SIZE = 256
+
+# Gecikme metrikleri (/metrics); her worker süreci kendi sayaçlarını tutar
+metrics = MetricsRegistry()
+normalize_seconds = metrics.histogram(
+    "humanorai_normalize_seconds", "Metin normalizasyonu süresi (istek başına)")
+vectorizer_seconds = metrics.histogram(
+    "humanorai_vectorizer_seconds", "TF-IDF transform süresi (istek başına)")
+model_seconds = metrics.histogram(
+    "humanorai_model_seconds", "Model predict_proba süresi (istek başına)", label_name="model")
+request_seconds = metrics.histogram(
+    "humanorai_request_seconds", "Uçtan uca skorlama süresi", label_name="endpoint")
+
+# Aynı metin tekrar gelirse transform ve modeller atlanır
+prediction_cache = create_cache(config.CACHE_BACKEND, config.CACHE_MAX_ENTRIES,
+                                config.CACHE_TTL_SECONDS, config.CACHE_PATH)
+metrics.callback("humanorai_cache_hits_total", "Önbellekten dönen tahminler", "counter",
+                 lambda: prediction_cache.stats()["hits"])
+metrics.callback("humanorai_cache_misses_total", "Önbellekte bulunamayan tahminler", "counter",
+                 lambda: prediction_cache.stats()["misses"])
+metrics.callback("humanorai_cache_entries", "Önbellekteki kayıt sayısı", "gauge",
+                 lambda: prediction_cache.stats()["entries"])
+metrics.callback("humanorai_bundle_reloads_total", "Devreye alınan yeni model paketleri", "counter",
+                 lambda: reload_state["reloads"])
+
+
+def empty_response():
+    """Tahmin yapılamadığında dönen güvenli cevap."""
+    return {
         "result": "Bilinmiyor",
         "finalVerdict": "Bilinmiyor",
         "averageAiProbability": 0,
@@ -45,92 +304,294 @@ def predict():
         "predictions": []
     }
 
+
+def score_texts(texts):
+    """Metin listesini tek seferde skorlar.
+
+    Tüm metinler tek bir ``transform`` çağrısıyla tek sparse matrise çevrilir
+    ve her model bu matris üzerinde bir kez ``predict_proba`` çalıştırır.
+    Her eleman için ``/predict`` ile aynı şekilde bir cevap döner. Süreler
+    monotonik saatle ölçülür ve milisaniye cinsinden döner; toplu isteklerde
+    tüm elemanlar aynı ölçümü paylaşır. Önbellekte bulunan metinler hiç
+    skorlanmaz ve cevaplarında ``"cached": true`` bulunur. Metinler önce
+    eğitim verisiyle aynı şekilde normalize edilir; önbellek anahtarı da
+    normalize metindir.
+    """
+    responses = [empty_response() for _ in texts]
+
+    # İstek boyunca tek paket kullanılır; yeniden yükleme yarıda sonucu karıştırmaz
+    models_loaded.wait(config.LOAD_WAIT_SECONDS)
+    current = bundle
+    if not current.vectorizer:
+        return responses
+
+    started = time.perf_counter()
+    normalized = normalize_batch(texts)
+    normalize_seconds.observe(time.perf_counter() - started)
+
+    # Geçersiz / çok kısa metinler güvenli cevapla kalır; aynı metinler tek kez skorlanır.
+    # Önbellek kapalıysa anahtar hesaplanmaz, metnin kendisi anahtar olur
+    use_cache = prediction_cache.enabled
+    pending = {}
+    for i, text in enumerate(normalized):
+        if len(text) < 2:
+            continue
+        if not use_cache:
+            pending.setdefault(text, []).append(i)
+            continue
+        # Anahtar pakete bağlı: yeni modeller eski paketin tahminlerini görmez
+        key = cache_key(text, current.cache_namespace)
+        cached = prediction_cache.get(key)
+        if cached is not None:
+            responses[i] = dict(cached, cached=True)
+        else:
+            pending.setdefault(key, []).append(i)
+
+    if not pending:
+        return responses
+
+    keys = list(pending)
+    computed = score_unique_texts(current, [normalized[pending[key][0]] for key in keys])
+    for key, response in zip(keys, computed):
+        # Hiçbir model çalışmadıysa sonuç önbelleğe yazılmaz
+        if response is None:
+            continue
+        if use_cache:
+            prediction_cache.set(key, response)
+        for row in pending[key]:
+            responses[row] = response
+
+    return responses
+
+
+def score_texts_isolated(texts):
+    """``score_texts`` ile aynı; toplu skorlama hata verirse metinler tek tek skorlanır.
+
+    Böylece sorunlu bir eleman tüm isteği düşürmez, sadece kendisi güvenli
+    cevapla döner.
+    """
+    try:
+        return score_texts(texts)
+    except Exception as e:
+        print(f"⚠️ Toplu skorlama başarısız, metinler tek tek skorlanıyor: {str(e)}")
+
+    results = []
+    for text in texts:
+        try:
+            results.append(score_texts([text])[0])
+        except Exception as e:
+            print(f" SUNUCU HATASI: {str(e)}")
+            results.append(empty_response())
+    return results
+
+
+def score_unique_texts(current, texts):
+    """Önbellekte olmayan metinleri ``current`` paketiyle skorlar; modeller çalışmazsa eleman None olur."""
+    responses = [empty_response() for _ in texts]
+
+    # vektöre çevir (tek transform)
+    started = time.perf_counter()
+    vectors = current.vectorizer.transform(texts)
+    vectorizer_elapsed = time.perf_counter() - started
+    vectorizer_seconds.observe(vectorizer_elapsed)
+
+    # vektörü boş olan satırları ayıkla
+    non_empty = np.diff(vectors.indptr) > 0
+    rows = np.flatnonzero(non_empty).tolist()
+    if not rows:
+        return responses
+    vectors = vectors[non_empty]
+
+    result = current.ensemble.predict(vectors)
+    if result is None:
+        for row in rows:
+            responses[row] = None
+        return responses
+
+    for name, elapsed in zip(result.names, result.seconds):
+        model_seconds.observe(elapsed, name)
+    processing_ms = [round(elapsed * 1000, 3) for elapsed in result.seconds]
+    vectorizer_ms = round(vectorizer_elapsed * 1000, 3)
+
+    # JSON için dizileri bir kez Python listelerine çevir
+    ai_probability = result.ai_probability.tolist()
+    human_probability = result.human_probability.tolist()
+    confidence = result.confidence.tolist()
+    is_ai = result.is_ai.tolist()
+    average_ai = result.average_ai_probability.tolist()
+    average_human = result.average_human_probability.tolist()
+    verdict_is_ai = result.verdict_is_ai.tolist()
+
+    for j, row in enumerate(rows):
+        # Oylama sonucunu belirle
+        final_verdict = "AI" if verdict_is_ai[j] else "HUMAN"
+        responses[row] = {
+            "result": final_verdict,
+            "finalVerdict": final_verdict,
+            "averageAiProbability": average_ai[j],
+            "averageHumanProbability": average_human[j],
+            "vectorizerTime": vectorizer_ms,
+            "predictions": [
+                {
+                    "modelName": name,
+                    "confidence": confidence[m][j],
+                    "result": "AI" if is_ai[m][j] else "Human",
+                    "aiProbability": ai_probability[m][j],
+                    "humanProbability": human_probability[m][j],
+                    "processingTime": processing_ms[m]
+                }
+                for m, name in enumerate(result.names)
+            ]
+        }
+
+    return responses
+
+
+def score_segments(text, mode="sentence"):
+    """Uzun metni parçalara bölüp parçaları toplu skorlar.
+
+    Metin ``config.MAX_CHARS`` karakterde kesilir. Parçalar
+    ``SEGMENT_BATCH_SIZE``'lık gruplar halinde skorlanır ve toplam skor
+    gruplar işlendikçe uzunluk ağırlıklı olarak biriktirilir. ``aiShare``
+    metnin AI olarak işaretlenen parçalardaki oranıdır; karışık yazarlığı
+    tek bir ortalamanın gizlemesini önler.
+    """
+    models_loaded.wait(config.LOAD_WAIT_SECONDS)
+    current = bundle
+    truncated = len(text) > config.MAX_CHARS
+    text = text[:config.MAX_CHARS]
+    bounds = split_segments(text, mode, config.SEGMENT_MIN_CHARS, config.SEGMENT_MAX_CHARS)
+
+    segments = []
+    weight_total = weighted_ai = weighted_human = ai_weight = 0.0
+    for offset in range(0, len(bounds), SEGMENT_BATCH_SIZE):
+        group = bounds[offset:offset + SEGMENT_BATCH_SIZE]
+        segment_texts = normalize_batch([text[start:end] for start, end in group])
+        responses = score_unique_texts(current, segment_texts) if current.vectorizer else []
+        for (start, end), response in zip(group, responses):
+            if not response or not response["predictions"]:
+                continue
+            weight = end - start
+            weight_total += weight
+            weighted_ai += weight * response["averageAiProbability"]
+            weighted_human += weight * response["averageHumanProbability"]
+            if response["finalVerdict"] == "AI":
+                ai_weight += weight
+            segments.append({
+                "start": start,
+                "end": end,
+                "result": response["finalVerdict"],
+                "aiProbability": response["averageAiProbability"],
+                "humanProbability": response["averageHumanProbability"],
+                "predictions": response["predictions"],
+            })
+
+    if not weight_total:
+        return dict(empty_response(), segments=[], truncated=truncated, processedChars=len(text))
+
+    ai_share = ai_weight / weight_total
+    final_verdict = "AI" if ai_share > 0.5 else "HUMAN"
+    return {
+        "result": final_verdict,
+        "finalVerdict": final_verdict,
+        "averageAiProbability": weighted_ai / weight_total,
+        "averageHumanProbability": weighted_human / weight_total,
+        "aiShare": ai_share,
+        "segments": segments,
+        "truncated": truncated,
+        "processedChars": len(text),
+    }
+
+
+@app.before_request
+def start_lazy_loading():
+    if config.LAZY_LOAD:
+        load_in_background()
+
+
+@app.route('/ready', methods=['GET'])
+def ready_endpoint():
+    """Yük dengeleyici / orkestratör için hazır olma kontrolü: modeller yüklenene kadar 503."""
+    ready, body = readiness()
+    return jsonify(body), 200 if ready else 503
+
+
+@app.route('/predict', methods=['POST'])
+def predict():
+    started = time.perf_counter()
     try:
         data = request.get_json()
         text = data.get('text', '')
+        response = score_texts([text])[0]
+        request_seconds.observe(time.perf_counter() - started, "/predict")
+        return jsonify(response), 200
 
-       
-        if not text or len(text) < 2 or not vectorizer:
-            return jsonify(safe_response), 200
-
-        # vektöre çevir
-        vectors = vectorizer.transform([text])
-        
-        # vektör boşsa 
-        if vectors.nnz == 0:
-            return jsonify(safe_response), 200
-
-        results = []
-        total_ai_prob = 0
-        total_human_prob = 0
-        valid_models = 0
-        
-        ai_votes = 0
-        human_votes = 0
-
-        for name, model in models.items():
-            if model:
-                try:
-                    probabilities = model.predict_proba(vectors)[0]
-                    
-                    # Model'in class sırasını kontrol et
-                    # model.classes_[0] = ilk class, model.classes_[1] = ikinci class
-                    # Genelde alfabetik sırada: ['AI', 'Human']
-                    ai_index = list(model.classes_).index('AI') if 'AI' in model.classes_ else 0
-                    human_index = list(model.classes_).index('Human') if 'Human' in model.classes_ else 1
-                    
-                    prob_ai = probabilities[ai_index] * 100
-                    prob_human = probabilities[human_index] * 100
-                    
-                    # Debug: İlk tahminde class sırasını yazdır
-                    if valid_models == 0:
-                        print(f"🔍 {name} - Model classes: {model.classes_}")
-                        print(f"🔍 {name} - AI index: {ai_index}, Human index: {human_index}")
-                        print(f"🔍 {name} - Probabilities: {probabilities}")
-                        print(f"🔍 {name} - AI prob: {prob_ai:.2f}%, Human prob: {prob_human:.2f}%")
-                    
-                    prediction_label = "AI" if prob_ai > prob_human else "Human"
-                    confidence = max(prob_ai, prob_human)
-
-                    if prediction_label == "AI": ai_votes += 1
-                    else: human_votes += 1
-                    
-                    results.append({
-                        "modelName": name,
-                        "confidence": float(confidence),
-                        "result": prediction_label,
-                        "aiProbability": float(prob_ai),
-                        "humanProbability": float(prob_human),
-                        "processingTime": int(np.random.randint(20, 150))
-                    })
-                    
-                    total_ai_prob += prob_ai
-                    total_human_prob += prob_human
-                    valid_models += 1
-                except:
-                    pass
-
-        if valid_models == 0:
-            return jsonify(safe_response), 200
-
-        avg_ai = total_ai_prob / valid_models
-        avg_human = total_human_prob / valid_models
-        
-        # Oylama sonucunu belirle
-        final_verdict = "AI" if ai_votes > human_votes else "HUMAN"
+    except Exception as e:
+        print(f" SUNUCU HATASI: {str(e)}")
+        return jsonify(empty_response()), 200
 
-        return jsonify({
-            "result": final_verdict,
-            "finalVerdict": final_verdict,
-            "averageAiProbability": avg_ai,
-            "averageHumanProbability": avg_human,
-            "predictions": results
-        })
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """Birden fazla metni tek istekte skorlar: {"texts": [...]} -> {"results": [...]}"""
+    started = time.perf_counter()
+    try:
+        # Gövde yoksa ya da JSON değilse istemci hatası (500 değil)
+        data = request.get_json(silent=True)
+        error = batch_request_error(data)
+        if error is not None:
+            return jsonify(error), 400
+
+        results = score_texts_isolated(data['texts'])
+        request_seconds.observe(time.perf_counter() - started, "/predict/batch")
+        return jsonify({"results": results}), 200
+
+    except Exception as e:
+        print(f" SUNUCU HATASI: {str(e)}")
+        return jsonify({"results": []}), 500
+
+
+@app.route('/predict/segments', methods=['POST'])
+def predict_segments():
+    """Uzun metni parça parça skorlar: {"text": ..., "mode": "sentence"|"window"}"""
+    started = time.perf_counter()
+    try:
+        # Gövde yoksa ya da JSON değilse istemci hatası (500 değil)
+        data = request.get_json(silent=True)
+        error = segments_request_error(data)
+        if error is not None:
+            return jsonify(error), 400
+
+        response = score_segments(data.get('text', ''), data.get('mode', 'sentence'))
+        request_seconds.observe(time.perf_counter() - started, "/predict/segments")
+        return jsonify(response), 200
 
     except Exception as e:
         print(f" SUNUCU HATASI: {str(e)}")
-        return jsonify(safe_response), 200 
+        return jsonify(dict(empty_response(), segments=[])), 500
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Gecikme histogramlarını Prometheus metin formatında döner."""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route('/reload', methods=['POST'])
+def reload_endpoint():
+    """Etkin sürümü arka planda yükler; ısınma başarılı olunca geçiş yapılır."""
+    body, status = start_reload(request.headers.get('X-Reload-Token', ''), request.args.get('force') == '1')
+    return jsonify(body), status
+
+
+@app.route('/version', methods=['GET'])
+def version_endpoint():
+    """Bu worker'ın kullandığı model sürümü ve son yeniden yükleme durumu."""
+    return jsonify(version_info()), 200
+
 
 if __name__ == '__main__':
     print(" API Başlatılıyor (Hata Giderildi)...")
+    if config.LAZY_LOAD:
+        load_in_background()
     app.run(port=5001, debug=True)
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""Uzun metinleri skorlanabilir parçalara böler.
+
+Her parça ``(start, end)`` karakter aralığı olarak döner; metnin kendisi
+kopyalanmadan API cevabında parçanın yeri gösterilebilir.
+"""
+
+import re
+from typing import List, Tuple
+
+# Cümle sonu: . ! ? (ve ardından gelen tırnak/parantez) + boşluk
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+")
+
+Segment = Tuple[int, int]
+
+
+def window_segments(text: str, window_chars: int, offset: int = 0) -> List[Segment]:
+    """Metni en fazla ``window_chars`` karakterlik pencerelere, mümkünse boşlukta keserek böler."""
+    segments: List[Segment] = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + window_chars, length)
+        if end < length:
+            # kelimenin ortasından kesme; pencerede boşluk yoksa sert kes
+            space = text.rfind(" ", start + 1, end)
+            if space > start:
+                end = space
+        if text[start:end].strip():
+            segments.append((offset + start, offset + end))
+        start = end
+    return segments
+
+
+def sentence_segments(text: str, min_chars: int, max_chars: int) -> List[Segment]:
+    """Cümlelere böler; kısa cümleleri ``min_chars`` dolana kadar birleştirir.
+
+    Tek cümlelik kısa parçalar çok az n-gram içerir ve gürültülü skorlanır.
+    Hiçbir parça ``max_chars``'ı aşmaz: eklenecek cümle sığmıyorsa birikmiş
+    parça önce kapatılır, ``max_chars``'tan uzun cümleler pencerelere bölünür.
+    """
+    bounds = [0] + [match.end() for match in _SENTENCE_END.finditer(text)] + [len(text)]
+    segments: List[Segment] = []
+    current_start = None
+    for start, end in zip(bounds, bounds[1:]):
+        if not text[start:end].strip():
+            continue
+        if end - start > max_chars:
+            if current_start is not None:
+                segments.append((current_start, start))
+                current_start = None
+            segments.extend(window_segments(text[start:end], max_chars, offset=start))
+            continue
+        if current_start is not None and end - current_start > max_chars:
+            # cümle birikmiş parçaya sığmıyor: parça kısa da olsa kapatılır
+            segments.append((current_start, start))
+            current_start = None
+        if current_start is None:
+            current_start = start
+        if end - current_start >= min_chars:
+            segments.append((current_start, end))
+            current_start = None
+
+    if current_start is not None:
+        # kalan kısa kuyruk bir önceki parçaya eklenir (sığıyorsa)
+        if segments and len(text) - segments[-1][0] <= max_chars and segments[-1][1] == current_start:
+            segments[-1] = (segments[-1][0], len(text))
+        else:
+            segments.append((current_start, len(text)))
+    return segments
+
+
+def split_segments(text: str, mode: str = "sentence", min_chars: int = 200,
+                   max_chars: int = 1000) -> List[Segment]:
+    """``mode``: "sentence" (cümle grupları) veya "window" (sabit boy pencereler)."""
+    if mode == "sentence":
+        return sentence_segments(text, min_chars, max_chars)
+    if mode == "window":
+        return window_segments(text, max_chars)
+    raise ValueError(f"Bilinmeyen bölme modu: {mode}")
@@ -0,0 +1,81 @@
+"""Üretim sunucusu – modeller fork öncesi bir kez yüklenir, worker'lar belleği paylaşır.
+
+Kullanım:
+    python serve.py
+
+Adres ve worker sayısı HUMANORAI_BIND, HUMANORAI_WORKERS, HUMANORAI_THREADS
+ortam değişkenlerinden okunur. Linux/macOS'ta gunicorn (pre-fork), gunicorn
+olmayan sistemlerde (Windows) waitress ile tek süreç + thread havuzu kullanılır.
+"""
+
+import gc
+import sys
+
+import config
+
+
+def run_gunicorn(app) -> None:
+    """Uygulama master süreçte yüklenmiş halde gunicorn worker'larına fork edilir."""
+    from gunicorn.app.base import BaseApplication
+
+    class ProductionApplication(BaseApplication):
+        def __init__(self, application, options) -> None:
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    options = {
+        "bind": config.BIND,
+        "workers": config.WORKERS,
+        "threads": config.THREADS,
+        "worker_class": "gthread",
+        "timeout": config.WORKER_TIMEOUT,
+        "preload_app": True,
+    }
+    print(f"🚀 gunicorn: {config.BIND} | {config.WORKERS} worker x {config.THREADS} thread")
+    ProductionApplication(app, options).run()
+
+
+def run_waitress(app) -> None:
+    from waitress import serve
+
+    from pythonapi import load_in_background
+
+    # Tek süreç, fork yok: tembel modda yükleme burada başlar
+    if config.LAZY_LOAD:
+        load_in_background()
+    print(f"🚀 waitress: {config.BIND} | {config.THREADS} thread (tek süreç)")
+    serve(app, listen=config.BIND, threads=config.THREADS)
+
+
+def main() -> None:
+    # Vectorizer ve modeller burada, fork'tan önce bir kez yüklenir
+    from pythonapi import app
+
+    # Yüklenen nesneleri GC taramasından çıkar; worker'larda copy-on-write
+    # sayfaları GC yüzünden kopyalanmaz
+    gc.freeze()
+
+    try:
+        run_gunicorn(app)
+        return
+    except ImportError:
+        pass
+
+    try:
+        run_waitress(app)
+    except ImportError:
+        print("❌ Üretim sunucusu için gunicorn (Linux/macOS) veya waitress (Windows) kurulmalı:")
+        print("   pip install gunicorn   |   pip install waitress")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
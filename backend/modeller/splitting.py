@@ -0,0 +1,128 @@
+"""Grupları bölmeyen, sınıf oranlarını koruyan (stratified) train/test ayrımı.
+
+gemini_scraper her human abstract'ı yeniden yazar. ``train_test_split``
+orijinali train'e, yeniden yazılmış halini test'e koyabilir; model içeriği
+tanıyarak doğru bilir ve raporlanan başarı üretimdekinden yüksek çıkar.
+Burada aynı ``pair_id``'yi (human makalenin URL'si) ya da aynı
+``dup_group``'u (dedup.py) paylaşan satırlar tek grup sayılır ve grup bir
+bütün olarak ya train'e ya test'e gider. Gruplama hash tabanlı
+``factorize`` + bağlı bileşenlerle, ayrım gruplar üzerinde tek geçişlik
+açgözlü (greedy) bir döngüyle yapılır; süre satır sayısıyla doğrusaldır.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from data_cleaning import CLEAN_COLUMN, PAIR_COLUMN
+from dataset_io import read_columns, read_frame
+from dedup import GROUP_COLUMN
+
+GROUP_COLUMNS = (PAIR_COLUMN, GROUP_COLUMN)
+# Akış modunda hash modu (test oranı bu çözünürlükle uygulanır)
+_HASH_BUCKETS = 1_000_000
+
+
+def _key_codes(values: pd.Series) -> np.ndarray:
+    """Anahtar değerlerini 0..k-1 kodlarına çevirir; boş / eksik değerler -1."""
+    codes, uniques = pd.factorize(values)
+    empty = np.flatnonzero(pd.Index(uniques).astype(str) == "")
+    if len(empty):
+        codes[np.isin(codes, empty)] = -1
+    return codes
+
+
+def group_ids(frame: pd.DataFrame) -> np.ndarray:
+    """Her satıra grup numarası; ``pair_id`` veya ``dup_group`` ile bağlı satırlar aynı grupta.
+
+    Satırlar ve anahtar değerleri bir grafın düğümleridir; her satır kendi
+    anahtarlarına bağlanır. Böylece A–B aynı çift, B–C aynı yakın kopya
+    kümesindeyse üçü de tek grup olur. Anahtarı boş satırlar (pair_id'siz
+    eski veriler) tek başına grup olur.
+    """
+    n = len(frame)
+    rows, nodes = [], []
+    offset = n
+    for column in GROUP_COLUMNS:
+        if column not in frame:
+            continue
+        codes = _key_codes(frame[column])
+        present = np.flatnonzero(codes >= 0)
+        rows.append(present)
+        nodes.append(codes[present] + offset)
+        offset += int(codes.max()) + 1 if len(codes) else 0
+
+    if not rows:
+        return np.arange(n)
+    rows = np.concatenate(rows)
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, np.concatenate(nodes))), shape=(offset, offset))
+    _, labels = connected_components(graph, directed=False)
+    return pd.factorize(labels[:n])[0]
+
+
+def read_groups(dataset_path: str) -> Optional[np.ndarray]:
+    """Veri setindeki grup sütunlarından ``group_ids``; grup sütunu yoksa None.
+
+    Satırlar model.py ile aynı şekilde (metin / etiket boşsa) elenir, sonuç
+    önbellekten gelen X ile hizalıdır. Sadece gereken sütunlar okunur.
+    """
+    header = read_columns(dataset_path)
+    columns = [column for column in GROUP_COLUMNS if column in header]
+    if not columns:
+        return None
+    frame = read_frame(dataset_path, [CLEAN_COLUMN, "label", *columns], dtype={PAIR_COLUMN: str})
+    frame = frame.dropna(subset=[CLEAN_COLUMN, "label"])
+    return group_ids(frame)
+
+
+def grouped_stratified_split(groups: np.ndarray, y, test_size: float = 0.15,
+                             seed: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """Grupları bölmeden (train, test) satır indeksleri döner.
+
+    Gruplar rastgele sıralanıp sırayla gezilir. İçerdiği her sınıfta test'e
+    alınmış satır sayısı henüz o sınıfın hedefinin (``test_size`` × sınıf
+    sayısı) altındaysa grup test'e alınır, değilse train'de kalır. Toplamlar
+    sadece test'e alınan gruplarla güncellenir; reddedilen gruplar hedefi
+    doldurmuş sayılmaz. Her sınıfta hedef en fazla bir grup kadar aşılır.
+    """
+    groups = np.asarray(groups)
+    class_codes, classes = pd.factorize(np.asarray(y))
+    n_groups = int(groups.max()) + 1 if len(groups) else 0
+    n_classes = len(classes)
+
+    counts = np.bincount(groups * n_classes + class_codes, minlength=n_groups * n_classes)
+    counts = counts.reshape(n_groups, n_classes)
+    target = (test_size * counts.sum(axis=0)).tolist()
+
+    order = np.random.RandomState(seed).permutation(n_groups)
+    taken = [0] * n_classes
+    is_test_group = np.zeros(n_groups, dtype=bool)
+    remaining = sum(1 for goal in target if goal > 0)
+    # Sınıf sayısı küçük: satırları Python listesi olarak gezmek NumPy dilimlemekten hızlı
+    for group, group_counts in zip(order.tolist(), counts[order].tolist()):
+        if not remaining:
+            break
+        if any(count and taken[c] >= target[c] for c, count in enumerate(group_counts)):
+            continue
+        is_test_group[group] = True
+        for c, count in enumerate(group_counts):
+            if count and taken[c] < target[c] <= taken[c] + count:
+                remaining -= 1
+            taken[c] += count
+
+    is_test = is_test_group[groups]
+    return np.flatnonzero(~is_test), np.flatnonzero(is_test)
+
+
+def hashed_test_mask(keys: pd.Series, test_fraction: float, seed: int = 42) -> np.ndarray:
+    """Anahtarın hash'inden test maskesi (akış modu için durumsuz grup ayrımı).
+
+    Aynı anahtar hangi parçada görülürse görülsün aynı tarafa düşer; boş
+    anahtarlar için maske False döner, çağıran taraf rastgele maske kullanır.
+    """
+    present = (_key_codes(keys) >= 0)
+    hashes = pd.util.hash_pandas_object(keys.astype(str), index=False, hash_key=f"{seed:016d}").to_numpy()
+    return present & ((hashes % _HASH_BUCKETS) < test_fraction * _HASH_BUCKETS)
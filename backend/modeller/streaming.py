@@ -0,0 +1,103 @@
+"""Bellekten büyük veri setleri için akış (out-of-core) eğitim modu.
+
+Veri seti (Parquet ya da CSV) parça parça okunur, her parça durumsuz
+``HashingVectorizer`` ile vektörleştirilir ve ``partial_fit`` destekleyen
+lineer modeller (lojistik kayıplı SGD, MultinomialNB) güncellenir. Bellekte aynı anda
+sadece bir parça bulunur; tepe bellek veri seti boyutundan bağımsızdır.
+"""
+
+import os
+import time
+from typing import Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.naive_bayes import MultinomialNB
+
+from bundles import dump_artifact
+from dataset_io import iter_frames, read_columns
+from fused import FusedLinearModel
+from splitting import PAIR_COLUMN, hashed_test_mask
+
+CLASSES = np.array(["AI", "Human"])
+DEFAULT_CHUNKSIZE = 20000
+DEFAULT_N_FEATURES = 2 ** 18
+
+
+def build_hashing_vectorizer(n_features: int = DEFAULT_N_FEATURES) -> HashingVectorizer:
+    """TF-IDF ile aynı char_wb 3-5 gram'lar; sözlük ve IDF tutulmaz (durumsuz)."""
+    # MultinomialNB negatif değer kabul etmez: alternate_sign=False
+    return HashingVectorizer(analyzer='char_wb', ngram_range=(3, 5), n_features=n_features,
+                             alternate_sign=False, norm='l2')
+
+
+def iter_chunks(dataset_path: str, chunksize: int, test_fraction: float,
+                seed: int) -> Iterator[Tuple[pd.Series, pd.Series, np.ndarray]]:
+    """(metin, etiket, test maskesi) parçaları üretir.
+
+    Test maskesi aynı seed ile her geçişte aynı üretilir; böylece eğitim ve
+    değerlendirme geçişleri aynı satırları ayırır. ``pair_id``'li satırlarda
+    maske anahtarın hash'inden gelir (``splitting.hashed_test_mask``).
+    """
+    rng = np.random.default_rng(seed)
+    # pair_id varsa test tarafını anahtarın hash'i seçer: orijinal ve yeniden yazımı aynı tarafta kalır
+    grouped = PAIR_COLUMN in read_columns(dataset_path)
+    columns = ['cleaned_text', 'label', PAIR_COLUMN] if grouped else ['cleaned_text', 'label']
+    for chunk in iter_frames(dataset_path, chunksize, columns, dtype={PAIR_COLUMN: str}):
+        is_test = rng.random(len(chunk)) < test_fraction
+        if grouped:
+            keys = chunk[PAIR_COLUMN]
+            is_test = np.where(keys.notna().to_numpy(), hashed_test_mask(keys, test_fraction, seed), is_test)
+        keep = chunk['cleaned_text'].notna().to_numpy() & chunk['label'].isin(CLASSES).to_numpy()
+        yield chunk['cleaned_text'][keep], chunk['label'][keep], is_test[keep]
+
+
+def train_streaming(dataset_path: str, output_dir: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                    n_features: int = DEFAULT_N_FEATURES, test_fraction: float = 0.15,
+                    epochs: int = 1, seed: int = 42) -> None:
+    """Akış modunda eğitir ve API'nin okuyabileceği dosyaları ``output_dir``'e yazar."""
+    vectorizer = build_hashing_vectorizer(n_features)
+    logistic = SGDClassifier(loss='log_loss', alpha=1e-5, random_state=seed)
+    naive_bayes = MultinomialNB(alpha=0.1)
+
+    started = time.perf_counter()
+    for epoch in range(epochs):
+        seen = 0
+        for texts, labels, is_test in iter_chunks(dataset_path, chunksize, test_fraction, seed):
+            train = ~is_test
+            if not train.any():
+                continue
+            X = vectorizer.transform(texts[train])
+            y = labels[train]
+            logistic.partial_fit(X, y, classes=CLASSES)
+            # NB sayımları tek geçişte toplanır; tekrar geçişler sayıları katlar
+            if epoch == 0:
+                naive_bayes.partial_fit(X, y, classes=CLASSES)
+            seen += int(train.sum())
+        print(f" Epoch {epoch + 1}/{epochs}: {seen} satır ({time.perf_counter() - started:.1f} sn)")
+
+    # Değerlendirme geçişi: sadece test satırları, yine parça parça
+    correct = {"Logistic Regression": 0, "Naive Bayes": 0}
+    total = 0
+    for texts, labels, is_test in iter_chunks(dataset_path, chunksize, test_fraction, seed):
+        if not is_test.any():
+            continue
+        X = vectorizer.transform(texts[is_test])
+        y = labels[is_test].to_numpy()
+        correct["Logistic Regression"] += int((logistic.predict(X) == y).sum())
+        correct["Naive Bayes"] += int((naive_bayes.predict(X) == y).sum())
+        total += len(y)
+
+    os.makedirs(output_dir, exist_ok=True)
+    # pythonapi ile aynı dosya adları: HUMANORAI_MODEL_DIR bu dizini gösterebilir
+    dump_artifact(vectorizer, os.path.join(output_dir, 'vectorizer.pkl'))
+    dump_artifact(logistic, os.path.join(output_dir, 'model_logistic.pkl'))
+    dump_artifact(naive_bayes, os.path.join(output_dir, 'model_naive_bayes.pkl'))
+    dump_artifact(FusedLinearModel.from_models(logistic, naive_bayes), os.path.join(output_dir, 'model_fused.pkl'))
+
+    for name, count in correct.items():
+        accuracy = count / total * 100 if total else 0.0
+        print(f"💾 {name} (akış) kaydedildi. Başarı: %{accuracy:.2f} ({total} test satırı)")
+    print(f"📁 Çıktı dizini: {output_dir}")
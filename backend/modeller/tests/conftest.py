@@ -0,0 +1,34 @@
+"""pytest ayarları: modüller backend/modeller altında düz durur, testler oradan içe aktarır.
+
+Çalıştırma (backend/modeller dizininde):
+    python -m pytest -q
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_AI_WORDS = "furthermore novel framework leverage robust comprehensive paradigm significantly enhance".split()
+_HUMAN_WORDS = "we measured galaxy sample spectra data telescope observed stars cluster night".split()
+
+
+@pytest.fixture(scope="session")
+def tfidf_data():
+    """Küçük sentetik AI / Human veri seti: (vektörleştirici, X, y) - model.py ile aynı char_wb ayarları."""
+    rng = np.random.default_rng(0)
+    texts, labels = [], []
+    for i in range(300):
+        label = "AI" if i % 2 else "Human"
+        words = _AI_WORDS if label == "AI" else _HUMAN_WORDS
+        # Sınıflar karışsın: kelimelerin bir kısmı diğer sınıftan
+        mixed = rng.choice(words + _AI_WORDS[:3] + _HUMAN_WORDS[:3], size=rng.integers(8, 30))
+        texts.append(" ".join(mixed))
+        labels.append(label)
+    vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(3, 5), sublinear_tf=True, min_df=2)
+    X = vectorizer.fit_transform(texts)
+    return vectorizer, X, np.array(labels)
@@ -0,0 +1,36 @@
+"""İstemci girdisi hataları 500 değil 400 dönmeli."""
+
+import pytest
+
+import pythonapi
+
+
+@pytest.fixture
+def client():
+    return pythonapi.app.test_client()
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"data": "{bozuk json", "content_type": "application/json"},
+    {"data": "texts=a", "content_type": "application/x-www-form-urlencoded"},
+    {"json": ["bir", "liste"]},
+    {"json": {"texts": "liste değil"}},
+])
+def test_batch_rejects_bad_bodies(client, kwargs):
+    response = client.post("/predict/batch", **kwargs)
+    assert response.status_code == 400
+    assert response.get_json()["results"] == []
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"data": "{bozuk json", "content_type": "application/json"},
+    {"json": "sadece metin"},
+    {"json": {"text": 42}},
+    {"json": {"text": "metin", "mode": "paragraph"}},
+])
+def test_segments_rejects_bad_bodies(client, kwargs):
+    response = client.post("/predict/segments", **kwargs)
+    assert response.status_code == 400
+    assert response.get_json()["segments"] == []
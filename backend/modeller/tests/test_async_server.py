@@ -0,0 +1,68 @@
+"""MicroBatcher: toplu hata sadece hatalı metnin isteğini düşürmeli."""
+
+import asyncio
+
+import pytest
+
+from async_server import MicroBatcher, create_app
+
+
+def score(texts):
+    if "bozuk" in texts:
+        raise ValueError("skorlanamadı")
+    return [text.upper() for text in texts]
+
+
+async def submit_all(texts):
+    batcher = MicroBatcher(score, max_batch_size=len(texts), max_wait_ms=50, latency_budget_ms=1000)
+    task = asyncio.create_task(batcher.run())
+    try:
+        return await asyncio.gather(*(batcher.submit(text) for text in texts), return_exceptions=True)
+    finally:
+        task.cancel()
+        batcher.executor.shutdown(wait=False)
+
+
+def test_batch_results_are_routed_to_requests():
+    assert asyncio.run(submit_all(["a", "b", "c"])) == ["A", "B", "C"]
+
+
+def test_failing_item_does_not_fail_its_batch():
+    results = asyncio.run(submit_all(["a", "bozuk", "c"]))
+    assert results[0] == "A" and results[2] == "C"
+    assert isinstance(results[1], ValueError)
+
+
+async def call_routes(requests):
+    """create_app'i gerçek bir test sunucusunda çalıştırır; (durum, gövde) listesi döner."""
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async with TestClient(TestServer(create_app())) as client:
+        results = []
+        for method, path, kwargs in requests:
+            response = await client.request(method, path, **kwargs)
+            results.append((response.status, await response.json()))
+        return results
+
+
+def test_async_server_has_reload_version_and_segments(monkeypatch):
+    pytest.importorskip("aiohttp")
+    import config
+    import pythonapi
+
+    monkeypatch.setattr(config, "RELOAD_TOKEN", "")
+
+    (version_status, version), (reload_status, _), (segments_status, segments), (bad_status, _), \
+        (batch_status, batch) = asyncio.run(call_routes([
+            ("GET", "/version", {}),
+            ("POST", "/reload", {}),
+            ("POST", "/predict/segments", {"json": {"text": "Kısa bir metin. İkinci cümle burada."}}),
+            ("POST", "/predict/segments", {"data": "{bozuk"}),
+            ("POST", "/predict/batch", {"data": ""}),
+        ]))
+    assert version_status == 200 and version == pythonapi.version_info()
+    # Etkin sürüm değişmedi: thread açılmadan 200
+    assert reload_status == 200
+    assert segments_status == 200 and "segments" in segments
+    assert bad_status == 400
+    assert batch_status == 400 and batch["results"] == []
@@ -0,0 +1,95 @@
+"""Sürüm yayınlama: yayınlanmış dosyalar değişmez, CURRENT geri alınabilir."""
+
+import os
+
+import joblib
+import numpy as np
+
+from bundles import (BUNDLE_FILES, bundle_fingerprint, copy_files, current_version, dump_artifact, publish,
+                     read_manifest, resolve_model_dir, stage_bundle)
+
+
+def _publish_flat(model_dir, value, **manifest):
+    for filename in BUNDLE_FILES[:2]:
+        dump_artifact(np.full(4, value), os.path.join(model_dir, filename))
+    staging = stage_bundle(model_dir)
+    copy_files(model_dir, staging, BUNDLE_FILES)
+    return publish(model_dir, staging, manifest)
+
+
+def test_published_files_are_copies_not_links(tmp_path):
+    version = _publish_flat(str(tmp_path), 1.0)
+    for filename in BUNDLE_FILES[:2]:
+        assert os.stat(os.path.join(tmp_path, "versions", version, filename)).st_nlink == 1
+
+
+def test_retraining_does_not_change_published_version(tmp_path):
+    model_dir = str(tmp_path)
+    first = _publish_flat(model_dir, 1.0)
+    second = _publish_flat(model_dir, 2.0)
+
+    assert current_version(model_dir) == second
+    old = joblib.load(os.path.join(model_dir, "versions", first, BUNDLE_FILES[0]))
+    new = joblib.load(os.path.join(resolve_model_dir(model_dir), BUNDLE_FILES[0]))
+    np.testing.assert_array_equal(old, np.full(4, 1.0))
+    np.testing.assert_array_equal(new, np.full(4, 2.0))
+
+
+def test_publish_writes_manifest_and_leaves_no_staging(tmp_path):
+    model_dir = str(tmp_path)
+    version = _publish_flat(model_dir, 1.0, mode="full", rows=4)
+
+    manifest = read_manifest(resolve_model_dir(model_dir))
+    assert manifest["version"] == version
+    assert manifest["mode"] == "full" and manifest["rows"] == 4
+    leftovers = [name for name in os.listdir(os.path.join(model_dir, "versions")) if name.startswith(".")]
+    assert leftovers == []
+
+
+def test_rollback_by_rewriting_current(tmp_path):
+    model_dir = str(tmp_path)
+    first = _publish_flat(model_dir, 1.0)
+    _publish_flat(model_dir, 2.0)
+
+    with open(os.path.join(model_dir, "versions", "CURRENT"), "w", encoding="utf-8") as f:
+        f.write(first)
+    restored = joblib.load(os.path.join(resolve_model_dir(model_dir), BUNDLE_FILES[0]))
+    np.testing.assert_array_equal(restored, np.full(4, 1.0))
+
+
+def test_dump_artifact_keeps_no_temp_file_on_failure(tmp_path):
+    class Unpicklable:
+        def __reduce__(self):
+            raise RuntimeError("pickle hatası")
+
+    path = os.path.join(tmp_path, "model.pkl")
+    dump_artifact(np.zeros(2), path)
+    try:
+        dump_artifact(Unpicklable(), path)
+    except RuntimeError:
+        pass
+    assert os.listdir(tmp_path) == ["model.pkl"]
+    np.testing.assert_array_equal(joblib.load(path), np.zeros(2))
+
+
+def test_open_mmap_survives_rewrite(tmp_path):
+    # API dosyaları mmap_mode="r" ile açar; yeniden eğitim açık haritayı değiştirmemeli
+    path = os.path.join(tmp_path, "model.pkl")
+    dump_artifact(np.arange(100_000, dtype=np.float64), path)
+    mapped = joblib.load(path, mmap_mode="r")
+    assert isinstance(mapped, np.memmap)
+
+    dump_artifact(np.zeros(10, dtype=np.float64), path)
+    np.testing.assert_array_equal(mapped, np.arange(100_000, dtype=np.float64))
+    assert joblib.load(path).shape == (10,)
+
+
+def test_fingerprint_changes_when_flat_files_are_rewritten(tmp_path):
+    model_dir = str(tmp_path)
+    dump_artifact(np.zeros(4), os.path.join(model_dir, "model_fused.pkl"))
+    before = bundle_fingerprint(model_dir)
+    assert bundle_fingerprint(model_dir) == before
+
+    # Aynı boyutta yeni içerik: os.replace yeni inode verir
+    dump_artifact(np.ones(4), os.path.join(model_dir, "model_fused.pkl"))
+    assert bundle_fingerprint(model_dir) != before
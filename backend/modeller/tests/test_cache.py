@@ -0,0 +1,91 @@
+"""Önbellek anahtarı ve arka uçlar (memory / sqlite) aynı davranmalı."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cache import CacheBackend, LRUCache, SQLiteCache, cache_key, create_cache
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def make(max_entries=10, ttl_seconds=0):
+        return create_cache(request.param, max_entries, ttl_seconds, str(tmp_path / "cache.sqlite3"))
+    return make
+
+
+def test_cache_key_namespaces_and_surrogates():
+    assert cache_key("metin", "v1") != cache_key("metin", "v2")
+    assert cache_key("metin") == cache_key("metin", "")
+    # Eşi olmayan surrogate hata vermemeli ve farklı metinden ayrılmalı
+    assert cache_key("a\ud800b") != cache_key("a\ud801b")
+
+
+def test_roundtrip_and_stats(make_cache):
+    cache = make_cache()
+    assert cache.enabled
+    assert cache.get("k") is None
+    cache.set("k", {"result": "AI", "predictions": [{"aiProbability": 99.5}]})
+    assert cache.get("k") == {"result": "AI", "predictions": [{"aiProbability": 99.5}]}
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_disabled_cache_stores_nothing(make_cache):
+    cache = make_cache(max_entries=0)
+    assert not cache.enabled
+    cache.set("k", {"result": "AI"})
+    assert cache.get("k") is None
+
+
+def test_expired_entries_are_not_returned(make_cache, monkeypatch):
+    cache = make_cache(ttl_seconds=10)
+    cache.set("k", {"result": "AI"})
+    clock = "monotonic" if isinstance(cache, LRUCache) else "time"
+    now = getattr(time, clock)()
+    monkeypatch.setattr(f"cache.time.{clock}", lambda: now + 11)
+    assert cache.get("k") is None
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2, ttl_seconds=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_sqlite_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    SQLiteCache(path, 10, 0).set("k", {"result": "Human"})
+    assert SQLiteCache(path, 10, 0).get("k") == {"result": "Human"}
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_cache("redis", 10, 0, "")
+
+
+def test_backend_must_implement_interface():
+    class Incomplete(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_sqlite_counters_are_thread_safe(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "threads.sqlite3"), 1000, 0)
+    cache.set("var", {"result": "AI"})
+
+    def lookups(_):
+        for i in range(200):
+            cache.get("var" if i % 2 else f"yok-{i}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lookups, range(8)))
+    stats = cache.stats()
+    assert stats["hits"] == stats["misses"] == 800
@@ -0,0 +1,120 @@
+"""Veri seti okuma / yazma: CSV ve Parquet aynı sonucu verir, eklemeler parça dosyası olur."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from dataset_io import (append_records, compact, find_dataset, iter_frames, read_columns, read_frame, read_records,
+                        write_frame, write_records)
+
+FIELDNAMES = ["abstract_text", "source_url", "license_info", "label", "pair_id"]
+
+
+def _records(start, count, label="Human"):
+    return [{"abstract_text": f"abstract {i} ğüşıöç", "source_url": f"https://arxiv.org/abs/{i}",
+             "license_info": "CC BY 4.0", "label": label, "pair_id": f"https://arxiv.org/abs/{i}"}
+            for i in range(start, start + count)]
+
+
+def _parts(path):
+    return sorted(name for name in os.listdir(path) if name.endswith(".parquet"))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_records_round_trip(tmp_path, suffix):
+    path = str(tmp_path / f"data{suffix}")
+    records = _records(0, 5)
+    write_records(path, records)
+
+    assert read_records(path) == records
+    assert read_columns(path) == FIELDNAMES
+    frame = read_frame(path)
+    assert list(frame.columns) == FIELDNAMES
+    assert frame["abstract_text"].tolist() == [record["abstract_text"] for record in records]
+
+
+def test_parquet_frame_keeps_types_and_empty_values(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    frame = pd.DataFrame({"abstract_text": ["a", None], "label": ["AI", "Human"], "dup_group": [3, 3]})
+    write_frame(frame, path)
+
+    back = read_frame(path)
+    assert isinstance(back["label"].dtype, pd.CategoricalDtype)
+    assert back["dup_group"].tolist() == [3, 3]
+    assert pd.isna(back["abstract_text"][1])
+    # Scraper'lar boş değeri CSV'deki gibi "" olarak görür
+    assert read_records(path)[1]["abstract_text"] == ""
+    assert not os.path.exists(path + ".tmp")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_column_subset_reads(tmp_path, suffix):
+    path = str(tmp_path / f"data{suffix}")
+    write_records(path, _records(0, 7))
+
+    assert list(read_frame(path, columns=["label", "source_url"]).columns) == ["label", "source_url"]
+    chunks = list(iter_frames(path, chunksize=3, columns=["abstract_text"]))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert all(list(chunk.columns) == ["abstract_text"] for chunk in chunks)
+    # Dosyada olmayan istenen sütun boş gelir
+    rows = read_records(path, ["label", "missing"])
+    assert rows[0] == {"label": "Human", "missing": ""}
+
+
+def test_parquet_append_writes_parts_and_compact_merges(tmp_path):
+    path = str(tmp_path / "raw" / "data.parquet")
+    append_records(path, _records(0, 2), FIELDNAMES)
+    append_records(path, _records(2, 3), FIELDNAMES)
+
+    assert os.path.isdir(path)
+    assert len(_parts(path)) == 2
+    assert [row["source_url"] for row in read_records(path)] == [f"https://arxiv.org/abs/{i}" for i in range(5)]
+
+    compact(path)
+    assert os.path.isfile(path)
+    assert read_records(path) == _records(0, 5)
+    assert not os.path.exists(path + ".tmp")
+    # Tek dosya ve CSV'de bir şey yapmaz
+    compact(path)
+    assert read_records(path) == _records(0, 5)
+
+
+def test_append_to_compacted_file_keeps_existing_rows_first(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_records(path, _records(0, 2))
+    append_records(path, _records(2, 1, label="AI"), FIELDNAMES)
+
+    assert os.path.isdir(path)
+    assert len(_parts(path)) == 2
+    compact(path)
+    assert [row["label"] for row in read_records(path)] == ["Human", "Human", "AI"]
+
+
+def test_parts_with_added_column_are_read_together(tmp_path):
+    # pair_id'den önce yazılmış parçalar da okunur; eksik sütun boş gelir
+    path = str(tmp_path / "data.parquet")
+    old_fields = FIELDNAMES[:-1]
+    append_records(path, [{name: record[name] for name in old_fields} for record in _records(0, 1)], old_fields)
+    append_records(path, _records(1, 1), FIELDNAMES)
+
+    assert [row["pair_id"] for row in read_records(path, FIELDNAMES)] == ["", "https://arxiv.org/abs/1"]
+
+
+def test_csv_append_upgrades_old_header(tmp_path):
+    path = str(tmp_path / "data.csv")
+    old_fields = FIELDNAMES[:-1]
+    write_records(path, [{name: record[name] for name in old_fields} for record in _records(0, 1)])
+    append_records(path, _records(1, 1), FIELDNAMES)
+
+    assert read_columns(path) == FIELDNAMES
+    assert [row["pair_id"] for row in read_records(path)] == ["", "https://arxiv.org/abs/1"]
+    compact(path)
+    assert len(read_records(path)) == 2
+
+
+def test_find_dataset_prefers_parquet(tmp_path):
+    stem = str(tmp_path / "data")
+    assert find_dataset(stem) == stem + ".csv"
+    write_records(stem + ".parquet", _records(0, 1))
+    assert find_dataset(stem) == stem + ".parquet"
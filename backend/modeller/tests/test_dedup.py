@@ -0,0 +1,61 @@
+"""Yakın kopya kümeleri, karışık etiketli kümeler ve kaynak veri setinin korunması."""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import dedup
+from dedup import cluster_report, find_clusters, rows_to_keep
+
+ABSTRACT = ("We propose a graph neural network for predicting molecular properties and show that "
+            "message passing with attention improves accuracy on three benchmark datasets.")
+
+
+def test_near_duplicates_share_a_cluster():
+    texts = [ABSTRACT, ABSTRACT.replace("three", "four"), "A completely different text about galaxies and stars.",
+             ABSTRACT]
+    groups = find_clusters(texts)
+    assert groups[0] == groups[1] == groups[3]
+    assert groups[2] != groups[0]
+
+
+def test_surrogates_and_empty_texts_do_not_crash():
+    groups = find_clusters(["lone \ud800 surrogate in a text", "lone \ud800 surrogate in a text", "", "ab"])
+    assert groups[0] == groups[1]
+    assert len(set(groups[1:].tolist())) == 3
+
+
+def test_mixed_label_clusters_are_kept_or_dropped_whole():
+    groups = np.array([0, 0, 1, 1, 1, 2])
+    labels = pd.Series(["Human", "Human", "Human", "AI", "AI", "AI"])
+
+    np.testing.assert_array_equal(rows_to_keep(groups, labels, "keep"), [0, 2, 3, 4, 5])
+    np.testing.assert_array_equal(rows_to_keep(groups, labels, "drop"), [0, 5])
+    np.testing.assert_array_equal(rows_to_keep(groups), [0, 2, 5])
+
+    report = cluster_report(groups, labels)
+    assert report["mixed_label_clusters"] == 1
+    assert report["mixed_label_examples"] == [[2, 3, 4]]
+    assert report["rows_removed_by_drop"] == 1
+
+
+def test_drop_mode_refuses_to_overwrite_input(tmp_path, monkeypatch):
+    path = str(tmp_path / "clean.csv")
+    pd.DataFrame({"cleaned_text": [ABSTRACT, ABSTRACT], "label": ["Human", "Human"]}).to_csv(path, index=False)
+    monkeypatch.setattr(sys, "argv", ["dedup.py", "--input", path, "--mode", "drop"])
+    with pytest.raises(SystemExit):
+        dedup.main()
+    assert len(pd.read_csv(path)) == 2
+
+
+def test_default_mode_only_adds_group_column(tmp_path, monkeypatch):
+    path = str(tmp_path / "clean.csv")
+    pd.DataFrame({"cleaned_text": [ABSTRACT, ABSTRACT, "other text entirely"],
+                  "label": ["Human", "AI", "Human"]}).to_csv(path, index=False)
+    monkeypatch.setattr(sys, "argv", ["dedup.py", "--input", path])
+    dedup.main()
+    frame = pd.read_csv(path)
+    assert len(frame) == 3
+    assert frame[dedup.GROUP_COLUMN].tolist() == [0, 0, 1]
@@ -0,0 +1,67 @@
+"""CompactTfidfVectorizer, eğitilmiş TfidfVectorizer ile birebir aynı matrisi üretmeli."""
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from featurizer import CompactTfidfVectorizer
+
+TRAIN = [
+    "Deep neural networks improve text classification accuracy.",
+    "We study galaxy formation using numerical simulations of dark matter.",
+    "In this paper, we propose a novel approach to graph learning.",
+    "Türkçe karakterler: çğıöşü ve kısa kelimeler a b c.",
+]
+
+DOCUMENTS = [
+    "Deep learning improves classification.",
+    "",
+    "   \t\n ",
+    "a I x",                          # min_n'den kısa kelimeler
+    "Ünknown €uro ∑ 😀 characters",   # sözlükte olmayan karakterler
+    "lone \ud800 surrogate",          # eşi olmayan surrogate
+    "MiXeD   CASE\twith\nspaces",
+    "galaxy galaxy galaxy",
+]
+
+
+@pytest.fixture(params=[(3, 5), (4, 6)], ids=["3-5", "4-6"])
+def fitted(request):
+    return TfidfVectorizer(analyzer="char_wb", ngram_range=request.param, sublinear_tf=True).fit(TRAIN)
+
+
+def _assert_identical(expected, actual):
+    expected, actual = expected.tocsr(), actual.tocsr()
+    expected.sort_indices()
+    actual.sort_indices()
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(actual.indptr, expected.indptr)
+    np.testing.assert_array_equal(actual.indices, expected.indices)
+    # Bit düzeyinde eşit: tolerans yok
+    np.testing.assert_array_equal(actual.data, expected.data)
+
+
+def test_fast_path_matches_sklearn(fitted):
+    compact = CompactTfidfVectorizer.from_vectorizer(fitted)
+    assert compact.term_keys is not None
+    _assert_identical(fitted.transform(DOCUMENTS), compact.transform(DOCUMENTS))
+
+
+def test_string_path_matches_sklearn(fitted):
+    compact = CompactTfidfVectorizer.from_vectorizer(fitted)
+    compact.term_keys = None
+    _assert_identical(fitted.transform(DOCUMENTS), compact.transform(DOCUMENTS))
+
+
+def test_surrogate_gets_same_features_as_sklearn(fitted):
+    fitted = TfidfVectorizer(analyzer="char_wb", ngram_range=fitted.ngram_range).fit(TRAIN + ["\ud800 x\ud800y"])
+    compact = CompactTfidfVectorizer.from_vectorizer(fitted)
+    expected = fitted.transform(["\ud800", "x\ud800y z"])
+    assert expected[0].nnz > 0
+    _assert_identical(expected, compact.transform(["\ud800", "x\ud800y z"]))
+
+
+def test_only_empty_documents():
+    fitted = TfidfVectorizer(analyzer="char_wb", ngram_range=(3, 5)).fit(TRAIN)
+    compact = CompactTfidfVectorizer.from_vectorizer(fitted)
+    _assert_identical(fitted.transform(["", " "]), compact.transform(["", " "]))
@@ -0,0 +1,37 @@
+"""FlatForest, RandomForestClassifier ile aynı predict_proba sonucunu vermeli."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import forest
+from forest import FlatForest
+
+
+@pytest.fixture(scope="module")
+def fitted_forest(tfidf_data):
+    _, X, y = tfidf_data
+    # Sınırsız derinlik: farklı derinlikte yapraklar da sınanır
+    return RandomForestClassifier(n_estimators=25, random_state=0, n_jobs=1).fit(X, y)
+
+
+def test_matches_sklearn_predict_proba(tfidf_data, fitted_forest):
+    vectorizer, X, _ = tfidf_data
+    flat = FlatForest.from_forest(fitted_forest)
+
+    np.testing.assert_array_equal(flat.classes_, fitted_forest.classes_)
+    np.testing.assert_allclose(flat.predict_proba(X), fitted_forest.predict_proba(X), rtol=0, atol=1e-12)
+
+    # Eğitimde görülmemiş metinler ve boş satır
+    unseen = vectorizer.transform(["tamamen farklı bir metin", "", "novel galaxy framework"])
+    np.testing.assert_allclose(flat.predict_proba(unseen), fitted_forest.predict_proba(unseen), rtol=0, atol=1e-12)
+
+
+def test_dense_chunks_do_not_change_result(tfidf_data, fitted_forest, monkeypatch):
+    _, X, _ = tfidf_data
+    flat = FlatForest.from_forest(fitted_forest)
+    expected = flat.predict_proba(X)
+
+    # Parça başına birkaç satır: parçalı yol da aynı sonucu vermeli
+    monkeypatch.setattr(forest, "DENSE_CHUNK_CELLS", 7 * X.shape[1])
+    np.testing.assert_array_equal(flat.predict_proba(X), expected)
@@ -0,0 +1,36 @@
+"""FusedLinearModel, ayrı LR ve NB modelleriyle aynı olasılıkları vermeli."""
+
+import numpy as np
+
+from ensemble import Ensemble
+from fused import FusedLinearModel
+from training import build_models
+
+
+def fitted_linear_models(X, y):
+    models = build_models(n_jobs=1)
+    return models["Logistic Regression"].fit(X, y), models["Naive Bayes"].fit(X, y)
+
+
+def test_matches_sklearn_predict_proba(tfidf_data):
+    _, X, y = tfidf_data
+    logistic, naive_bayes = fitted_linear_models(X, y)
+    fused = FusedLinearModel.from_models(logistic, naive_bayes)
+
+    lr, nb = fused.predict_ai_human(X)
+    # Sınıflar alfabetik: [AI, Human]
+    np.testing.assert_allclose(lr, logistic.predict_proba(X), rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(nb, naive_bayes.predict_proba(X), rtol=1e-12, atol=1e-15)
+
+
+def test_ensemble_result_is_unchanged_by_fusion(tfidf_data):
+    _, X, y = tfidf_data
+    logistic, naive_bayes = fitted_linear_models(X, y)
+    models = {"Logistic Regression": logistic, "Naive Bayes": naive_bayes}
+
+    separate = Ensemble.from_models(models).predict(X)
+    fused = Ensemble.from_models(models, fused=FusedLinearModel.from_models(logistic, naive_bayes)).predict(X)
+
+    assert fused.names == separate.names
+    np.testing.assert_allclose(fused.ai_probability, separate.ai_probability, rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(fused.verdict_is_ai, separate.verdict_is_ai)
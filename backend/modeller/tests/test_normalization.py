@@ -0,0 +1,44 @@
+"""normalize, notebook'taki regex tabanlı general_cleaning ile aynı metni üretmeli."""
+
+import random
+import re
+
+import pytest
+
+from normalization import normalize, normalize_batch
+
+
+def general_cleaning(text):
+    """notebooks/data_cleaning.ipynb'deki orijinal fonksiyon (referans)."""
+    if not isinstance(text, str):
+        return ""
+    text = text.lower()
+    text = re.sub(r'http\S+', '', text)
+    text = re.sub(r'\n', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+EDGE_CASES = [
+    "", "   ", None, 3.5, "A B C\x1cD\x0bE", "SEE HTTP://X.ORG/Y AND https://a.b",
+    "İSTANBUL  ǅ\n\n\tx", "http", "xhttp://a b", "line\r\nbreak end",
+    "\u00a0nbsp\u2003em\u3000ideo\u2028sep", "\u200bzero width", "lone \ud800 surrogate", "ẞ ΣΑΣ",
+]
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_matches_general_cleaning_on_edge_cases(text):
+    assert normalize(text) == general_cleaning(text)
+
+
+def test_matches_general_cleaning_on_random_text():
+    rng = random.Random(0)
+    # Tüm Unicode boşluk türleri, büyük harfler ve URL parçaları karışık
+    alphabet = [chr(c) for c in range(0x3000) if chr(c).isspace()] + list("aBcİıŞğ.,:/-") + ["http", "HTTP"]
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert normalize(text) == general_cleaning(text), repr(text)
+
+
+def test_batch_turns_non_text_into_empty_string():
+    assert normalize_batch(["  A\nB ", None, 7]) == ["a b", "", ""]
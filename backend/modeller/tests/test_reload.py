@@ -0,0 +1,102 @@
+"""POST /reload: tek yükleme, yetki kontrolü ve yüklenemeyen sürümün atlanması."""
+
+import os
+import threading
+import time
+
+import pytest
+
+import config
+import pythonapi
+from bundles import ModelBundle
+from ensemble import Ensemble
+
+
+def set_current(model_dir, version):
+    os.makedirs(os.path.join(model_dir, "versions", version), exist_ok=True)
+    with open(os.path.join(model_dir, "versions", "CURRENT"), "w", encoding="utf-8") as f:
+        f.write(version)
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    model_dir = str(tmp_path)
+    calls = []
+
+    def fake_load_bundle(path):
+        calls.append(path)
+        if os.path.basename(path) == "broken":
+            raise RuntimeError("bozuk paket")
+        return ModelBundle(os.path.basename(path), path, None, Ensemble([]), os.path.basename(path))
+
+    monkeypatch.setattr(config, "MODEL_DIR", model_dir)
+    monkeypatch.setattr(config, "RELOAD_TOKEN", "")
+    monkeypatch.setattr(pythonapi, "bundle", ModelBundle(None, model_dir, None, Ensemble([])))
+    monkeypatch.setattr(pythonapi, "load_bundle", fake_load_bundle)
+    monkeypatch.setattr(pythonapi, "warm_up", lambda candidate: None)
+    monkeypatch.setattr(pythonapi, "reload_state",
+                        {"reloading": False, "lastError": None, "failedModelDir": None, "reloads": 0})
+    return pythonapi.app.test_client(), model_dir, calls
+
+
+def wait_for_reload():
+    for _ in range(100):
+        if pythonapi.reload_lock.acquire(blocking=False):
+            pythonapi.reload_lock.release()
+            return
+        time.sleep(0.01)
+    raise AssertionError("yeniden yükleme bitmedi")
+
+
+def test_unchanged_model_dir_is_a_no_op(api):
+    client, _, calls = api
+    threads = threading.active_count()
+    response = client.post("/reload")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "unchanged"
+    assert calls == [] and threading.active_count() == threads
+
+
+def test_new_version_is_loaded_in_background(api):
+    client, model_dir, calls = api
+    set_current(model_dir, "v1")
+    response = client.post("/reload")
+    assert response.status_code == 202
+    wait_for_reload()
+    assert pythonapi.bundle.version == "v1"
+    assert len(calls) == 1
+
+
+def test_reload_in_progress_is_not_queued(api):
+    client, model_dir, calls = api
+    set_current(model_dir, "v1")
+    with pythonapi.reload_lock:
+        response = client.post("/reload")
+    assert response.status_code == 409
+    assert calls == []
+
+
+def test_force_and_token(api, monkeypatch):
+    client, _, calls = api
+    assert client.post("/reload?force=1").status_code == 403
+
+    monkeypatch.setattr(config, "RELOAD_TOKEN", "gizli")
+    assert client.post("/reload").status_code == 401
+    assert client.post("/reload", headers={"X-Reload-Token": "yanlış"}).status_code == 401
+    assert client.post("/reload?force=1", headers={"X-Reload-Token": "gizli"}).status_code == 202
+    wait_for_reload()
+    assert len(calls) == 1
+
+
+def test_failed_version_is_skipped_until_current_changes(api):
+    _, model_dir, calls = api
+    set_current(model_dir, "broken")
+    assert pythonapi.reload_bundle() is False
+    assert pythonapi.reload_bundle() is False
+    assert len(calls) == 1
+    assert pythonapi.reload_state["failedModelDir"].endswith("broken")
+
+    set_current(model_dir, "v2")
+    assert pythonapi.reload_bundle() is True
+    assert pythonapi.bundle.version == "v2"
+    assert pythonapi.reload_state["failedModelDir"] is None
@@ -0,0 +1,55 @@
+"""Parçalar metni boşluksuz kaplamalı ve hiçbiri max_chars'ı aşmamalı."""
+
+import random
+
+import pytest
+
+from segmenter import sentence_segments, split_segments, window_segments
+
+
+def random_text(seed, sentences=60):
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(sentences):
+        words = " ".join("x" * rng.randint(1, 12) for _ in range(rng.choice([2, 10, 40, 120, 200])))
+        parts.append(words + rng.choice([".", "!", "?", ".)"]))
+    return " ".join(parts)
+
+
+def assert_valid(text, segments, max_chars):
+    assert all(end - start <= max_chars for start, end in segments)
+    assert all(start < end for start, end in segments)
+    assert all(a[1] <= b[0] for a, b in zip(segments, segments[1:]))
+    # Parçaların dışında kalan kısım sadece boşluk olabilir
+    covered = "".join(text[start:end] for start, end in segments)
+    assert covered.split() == text.split()
+
+
+def test_short_sentence_followed_by_long_one_is_flushed():
+    text = "x" * 150 + ". " + " ".join(["y" * 9] * 88) + "."
+    segments = sentence_segments(text, min_chars=200, max_chars=1000)
+    assert segments[0] == (0, 152)
+    assert_valid(text, segments, 1000)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sentence_segments_respect_max_chars(seed):
+    text = random_text(seed)
+    assert_valid(text, sentence_segments(text, min_chars=200, max_chars=1000), 1000)
+
+
+def test_sentence_longer_than_max_is_windowed():
+    text = "Kısa giriş. " + "z" * 2500 + "."
+    assert_valid(text, sentence_segments(text, min_chars=5, max_chars=1000), 1000)
+
+
+def test_window_segments_break_on_spaces():
+    text = " ".join(["kelime"] * 500)
+    segments = window_segments(text, 100)
+    assert_valid(text, segments, 100)
+    assert all(text[end - 1] != " " and (end == len(text) or text[end] == " ") for _, end in segments)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        split_segments("metin", mode="paragraph")
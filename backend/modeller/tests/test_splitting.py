@@ -0,0 +1,56 @@
+"""Gruplu ayrım: grup iki tarafa bölünmez, sınıf oranları hedefe yakın kalır."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from splitting import group_ids, grouped_stratified_split
+
+
+def paired_frame(n_pairs, seed=0):
+    """Her human abstract'ın %90'ının yeniden yazımı var (aynı pair_id); bazı satırlar yakın kopya."""
+    rng = np.random.default_rng(seed)
+    urls = [f"https://arxiv.org/abs/{i}" for i in range(n_pairs)]
+    human = pd.DataFrame({"pair_id": urls, "label": "Human"})
+    ai = pd.DataFrame({"pair_id": [url for url in urls if rng.random() < 0.9], "label": "AI"})
+    frame = pd.concat([human, ai], ignore_index=True).sample(frac=1, random_state=seed).reset_index(drop=True)
+    frame["dup_group"] = np.arange(len(frame))
+    frame.loc[:9, "dup_group"] = 0
+    return frame
+
+
+@pytest.mark.parametrize("test_size", [0.15, 0.3])
+def test_class_fractions_match_target(test_size):
+    frame = paired_frame(3000)
+    labels = frame["label"].to_numpy()
+    train, test = grouped_stratified_split(group_ids(frame), labels, test_size=test_size)
+
+    assert len(train) + len(test) == len(frame)
+    fractions = frame["label"].iloc[test].value_counts() / frame["label"].value_counts()
+    for label in ("Human", "AI"):
+        # Hedef en fazla bir grup (<= 11 satır) kadar aşılır, altında kalınmaz
+        assert test_size <= fractions[label] < test_size + 0.005
+
+
+def test_no_group_spans_both_splits():
+    frame = paired_frame(2000, seed=1)
+    groups = group_ids(frame)
+    train, test = grouped_stratified_split(groups, frame["label"].to_numpy())
+    assert not set(groups[train]) & set(groups[test])
+    # dup_group ve pair_id ile bağlı ilk 10 satır tek grup
+    assert len(set(groups[:10])) == 1
+
+
+def test_linked_keys_form_one_group():
+    frame = pd.DataFrame({"pair_id": ["a", "a", "b", None, ""], "dup_group": [0, 1, 1, 2, 3]})
+    groups = group_ids(frame)
+    assert groups[0] == groups[1] == groups[2]
+    assert len({groups[0], groups[3], groups[4]}) == 3
+
+
+def test_split_is_deterministic():
+    frame = paired_frame(500)
+    groups, labels = group_ids(frame), frame["label"].to_numpy()
+    first = grouped_stratified_split(groups, labels, seed=7)
+    second = grouped_stratified_split(groups, labels, seed=7)
+    np.testing.assert_array_equal(first[1], second[1])
@@ -0,0 +1,6 @@
+"""Veri toplama script'leri.
+
+Depo kökünden modül olarak çalıştırılır; veri seti okuma / yazma
+``backend/modeller/dataset_io.py``'den içe aktarılır:
+    python -m scraping_scripts.arxiv_scraper --target 3000
+"""
@@ -1,7 +1,6 @@
 """ArXiv scraper – deterministik şekilde 3000 kayıt hedefler."""
 
 import argparse
-import csv
 import os
 import random
 import re
@@ -12,6 +11,8 @@ from typing import Dict, Iterable, List, Optional, Set
 import requests
 from bs4 import BeautifulSoup
 
+from backend.modeller.dataset_io import append_records, compact, read_records
+
 BASE_URL = "https://arxiv.org"
 # Alternatif URL'ler (birisi çalışmazsa diğeri denenir)
 FALLBACK_BASE_URLS = [
@@ -33,6 +34,7 @@ ULTRA_FAST_SKIP_STEP = 5  # Son 50 veri için ultra küçük adım (maksimum hı
 EXTREME_SKIP_STEP = 1  # Son 30 veri için EXTREME küçük adım (BAN RİSKİ - maksimum hız!)
 BATCH_SIZE = 25
 SAVE_INTERVAL = 30  # Her 30 saniyede bir kaydet (kesilme durumunda)
+FIELDNAMES = ["abstract_text", "source_url", "license_info", "label"]
 
 # Çok sayıda gerçekçi User-Agent listesi
 USER_AGENTS = [
@@ -744,36 +746,25 @@ def iter_category(session: requests.Session, category: str, existing: Set[str],
 
 
 def load_existing_ids(path: str) -> Set[str]:
-    """Mevcut CSV dosyasından ID'leri yükler."""
+    """Mevcut veri setinden ID'leri yükler (sadece source_url sütunu okunur)."""
     if not os.path.exists(path):
         return set()
     
     ids = set()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("source_url", "")
-                match = ABS_RE.search(url)
-                if match:
-                    ids.add(match.group(1))
+        for row in read_records(path, ["source_url"]):
+            match = ABS_RE.search(row["source_url"])
+            if match:
+                ids.add(match.group(1))
     except Exception as exc:
         print(f"⚠ Mevcut dosya okuma hatası: {exc}")
     
     return ids
 
 
-def write_csv(path: str, rows: List[Dict[str, str]]) -> None:
-    """Kayıtları CSV dosyasına yazar."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    exists = os.path.exists(path)
-    mode = "a" if exists else "w"
-    
-    with open(path, mode, newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, ["abstract_text", "source_url", "license_info", "label"])
-        if not exists:
-            writer.writeheader()
-        writer.writerows(rows)
+def write_records(path: str, rows: List[Dict[str, str]]) -> None:
+    """Kayıtları veri setinin sonuna ekler (.parquet: yeni parça dosyası, .csv: satır ekleme)."""
+    append_records(path, rows, FIELDNAMES)
 
 
 def record_stream(session: requests.Session, existing: Set[str], target: int):
@@ -855,7 +846,7 @@ def scrape(output: str, target: int) -> None:
             
             # Her BATCH_SIZE kayıtta veya SAVE_INTERVAL saniyede bir kaydet (kesilme durumunda koruma)
             if len(buffer) >= BATCH_SIZE or (time.time() - last_save) > SAVE_INTERVAL:
-                write_csv(output, buffer)
+                write_records(output, buffer)
                 buffer.clear()
                 last_save = time.time()
                 print(f"💾 {current_total}/{target} kayıt kaydedildi.")
@@ -879,8 +870,10 @@ def scrape(output: str, target: int) -> None:
     finally:
         session.close()
         if buffer:
-            write_csv(output, buffer)
+            write_records(output, buffer)
             print(f"💾 Son kayıtlar kaydedildi. Toplam: {current_total}/{target}")
+        # Ekleme parçaları tek Parquet dosyasında birleştirilir
+        compact(output)
 
     print(f"✅ İşlem tamamlandı. Toplam {min(current_total, target)} özet hazır.")
 
@@ -888,7 +881,8 @@ def scrape(output: str, target: int) -> None:
 def main() -> None:
     """Ana fonksiyon."""
     parser = argparse.ArgumentParser(description="ArXiv scraper - 3000 kayıt hedefler")
-    parser.add_argument("--output", default="data/raw/human_abstracts.csv", help="Çıktı CSV dosyası")
+    parser.add_argument("--output", default="data/raw/human_abstracts.parquet",
+                        help="Çıktı veri seti (.parquet ya da .csv)")
     parser.add_argument("--target", type=int, default=3000, help="Hedef kayıt sayısı")
     args = parser.parse_args()
     scrape(args.output, args.target)
@@ -1,23 +1,21 @@
 """Human ve AI verilerini birleştirir ve model eğitimi için hazırlar."""
 
 import argparse
-import csv
 import os
 import random
 from typing import List, Dict
 
-def load_csv(file_path: str) -> List[Dict[str, str]]:
-    """CSV dosyasını yükler."""
+from backend.modeller.dataset_io import read_records, write_records
+
+def load_records(file_path: str) -> List[Dict[str, str]]:
+    """Veri setini (.parquet ya da .csv) yükler."""
     if not os.path.exists(file_path):
         print(f"UYARI: {file_path} dosyasi bulunamadi!")
         return []
     
     records = []
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                records.append(row)
+        records = read_records(file_path)
         print(f"OK: {file_path}: {len(records)} kayit yuklendi")
     except Exception as exc:
         print(f"HATA: {file_path} okuma hatasi: {exc}")
@@ -25,18 +23,11 @@ def load_csv(file_path: str) -> List[Dict[str, str]]:
     return records
 
 
-def write_csv(file_path: str, records: List[Dict[str, str]]) -> None:
-    """Kayıtları CSV dosyasına yazar."""
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    
-    with open(file_path, "w", newline="", encoding="utf-8") as f:
-        if not records:
-            return
-        
-        writer = csv.DictWriter(f, fieldnames=records[0].keys())
-        writer.writeheader()
-        writer.writerows(records)
-    
+def save_records(file_path: str, records: List[Dict[str, str]]) -> None:
+    """Kayıtları veri setine yazar; sütunlar tüm kayıtlardaki sütunların birleşimidir (ör. AI'daki pair_id)."""
+    if not records:
+        return
+    write_records(file_path, records)
     print(f"OK: {file_path}: {len(records)} kayit kaydedildi")
 
 
@@ -52,8 +43,8 @@ def combine_datasets(
     print("Veri birlestirme baslatiliyor...")
     
     # Verileri yükle
-    human_records = load_csv(human_file)
-    ai_records = load_csv(ai_file)
+    human_records = load_records(human_file)
+    ai_records = load_records(ai_file)
     
     if not human_records and not ai_records:
         print("HATA: Hic veri bulunamadi!")
@@ -84,7 +75,7 @@ def combine_datasets(
         random.shuffle(combined_records)
     
     # Kaydet
-    write_csv(output_file, combined_records)
+    save_records(output_file, combined_records)
     
     # Son kontrol
     print("\nBirlestirme tamamlandi!")
@@ -104,18 +95,18 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Human ve AI verilerini birleştirir")
     parser.add_argument(
         "--human", 
-        default="data/raw/human_abstracts.csv",
-        help="Human abstracts CSV dosyası"
+        default="data/raw/human_abstracts.parquet",
+        help="Human abstracts veri seti (.parquet ya da .csv)"
     )
     parser.add_argument(
         "--ai",
-        default="data/raw/ai_abstracts.csv",
-        help="AI abstracts CSV dosyası"
+        default="data/raw/ai_abstracts.parquet",
+        help="AI abstracts veri seti (.parquet ya da .csv)"
     )
     parser.add_argument(
         "--output",
-        default="data/raw/combined_dataset.csv",
-        help="Birleştirilmiş çıktı CSV dosyası"
+        default="data/raw/combined_dataset.parquet",
+        help="Birleştirilmiş çıktı veri seti (.parquet ya da .csv)"
     )
     parser.add_argument(
         "--no-shuffle",
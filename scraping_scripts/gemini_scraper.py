@@ -1,17 +1,19 @@
 """Gemini API kullanarak AI abstract'ları üretir."""
 
 import argparse
-import csv
 import os
 import random
-import re
+import shutil
 import sys
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Set, Tuple
 
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from backend.modeller.dataset_io import append_records, compact, read_records
+from scraping_scripts.rewrites import parse_rewrites
+
 # .env dosyasını yükle
 load_dotenv()
 
@@ -22,6 +24,7 @@ SAVE_INTERVAL = 20  # Her 20 saniyede bir kaydet (kesilme durumunda)
 ABSTRACTS_PER_REQUEST = 10  # Tek bir API isteği ile abstract yeniden yazılacak (timeout'u önlemek için)
 MAX_RETRIES = 3  # Her istek için maksimum deneme sayısı
 REQUEST_TIMEOUT = 120  # API isteği timeout (saniye)
+FIELDNAMES = ["abstract_text", "source_url", "license_info", "label", "pair_id"]
 
 # Abstract üretmek için kullanılacak kategoriler
 RESEARCH_CATEGORIES = [
@@ -46,8 +49,14 @@ def wait(delay_range: tuple[float, float]) -> None:
     time.sleep(random.uniform(*delay_range))
 
 
-def rewrite_abstracts(gen_model, human_abstracts: List[str], count: int = ABSTRACTS_PER_REQUEST, retry_count: int = 0) -> List[str]:
-    """Human abstract'larını AI tarafından yeniden yazdırır (aynı içerik, farklı yazım stili) - retry mekanizması ile."""
+def rewrite_abstracts(gen_model, human_abstracts: List[str], count: int = ABSTRACTS_PER_REQUEST,
+                      retry_count: int = 0) -> List[Tuple[int, str]]:
+    """Human abstract'larını AI tarafından yeniden yazdırır (aynı içerik, farklı yazım stili) - retry mekanizması ile.
+
+    (orijinalin batch içindeki indeksi, yeniden yazılmış metin) çiftleri döner;
+    indeks cevaptaki "Rewritten Abstract N" numarasından okunur; hangi orijinale
+    ait olduğu okunamayan metinler döndürülmez (bkz. ``rewrites.parse_rewrites``).
+    """
     
     # Her abstract için farklı yazım stilleri
     styles = [
@@ -84,49 +93,8 @@ Rewrite each abstract maintaining the same content but with AI-like writing styl
         # API isteği (timeout retry mekanizması ile halledilecek)
         response = gen_model.generate_content(prompt)
         
-        text = response.text.strip()
-        
-        # Abstract'ları parse et
-        abstracts = []
-        
-        # "Rewritten Abstract 1:", "Rewritten Abstract 2:" formatını ara
-        parts = re.split(r'Rewritten\s+Abstract\s+\d+[:\-]?\s*', text, flags=re.IGNORECASE)
-        if len(parts) > 1:
-            parts = [p.strip() for p in parts[1:] if p.strip()]
-        else:
-            parts = re.split(r'Abstract\s+\d+[:\-]?\s*', text, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                parts = [p.strip() for p in parts[1:] if p.strip()]
-            else:
-                parts = re.split(r'\n\s*\d+[\.\)]\s*', text)
-                if len(parts) > 1:
-                    parts = [p.strip() for p in parts[1:] if p.strip()]
-                else:
-                    parts = [p.strip() for p in text.split('\n\n') if p.strip() and len(p.strip()) > 100]
-        
-        for part in parts:
-            if not part:
-                continue
-            abstract = part.replace('"""', '').strip()
-            abstract = abstract.replace("Rewritten Abstract:", "").strip()
-            abstract = abstract.replace("Abstract:", "").strip()
-            abstract = abstract.replace("ABSTRACT:", "").strip()
-            
-            if len(abstract) < 100:
-                continue
-            words = abstract.split()
-            if len(words) > 400:
-                abstract = " ".join(words[:400])
-            abstracts.append(abstract)
-        
-        if not abstracts and len(text) > 100:
-            abstract = text.replace('"""', '').strip()
-            words = abstract.split()
-            if len(words) > 400:
-                abstract = " ".join(words[:400])
-            abstracts.append(abstract)
-        
-        return abstracts
+        # "Rewritten Abstract N:" numarası hangi orijinal olduğunu söyler; eşleşmeyen metin atılır
+        return parse_rewrites(response.text, count)
         
     except Exception as exc:
         error_msg = str(exc)
@@ -141,21 +109,19 @@ Rewrite each abstract maintaining the same content but with AI-like writing styl
             return []
 
 
-def load_human_abstracts(human_csv_path: str) -> List[str]:
-    """Human abstract'larını CSV'den yükler."""
+def load_human_abstracts(human_path: str) -> List[Tuple[str, str]]:
+    """Human abstract'larını (metin, source_url) çiftleri olarak veri setinden yükler."""
     abstracts = []
-    if not os.path.exists(human_csv_path):
-        print(f"⚠ Human abstract dosyası bulunamadı: {human_csv_path}")
+    if not os.path.exists(human_path):
+        print(f"⚠ Human abstract dosyası bulunamadı: {human_path}")
         return abstracts
     
     try:
-        with open(human_csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("label") == "Human":
-                    abstract = row.get("abstract_text", "").strip()
-                    if abstract and len(abstract) > 50:
-                        abstracts.append(abstract)
+        for row in read_records(human_path, ["abstract_text", "source_url", "label"]):
+            if row["label"] == "Human":
+                abstract = row["abstract_text"].strip()
+                if abstract and len(abstract) > 50:
+                    abstracts.append((abstract, row["source_url"].strip()))
         # Sessiz yükleme
         return abstracts
     except Exception as exc:
@@ -164,34 +130,38 @@ def load_human_abstracts(human_csv_path: str) -> List[str]:
 
 
 def load_existing_count(path: str) -> int:
-    """Mevcut CSV dosyasından kayıt sayısını yükler."""
+    """Mevcut veri setinden AI kayıt sayısını yükler (sadece label sütunu okunur)."""
     if not os.path.exists(path):
         return 0
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            count = sum(1 for row in reader if row.get("label") == "AI")
-            return count
+        return sum(1 for row in read_records(path, ["label"]) if row["label"] == "AI")
     except Exception as exc:
         print(f"⚠ Mevcut dosya okuma hatası: {exc}")
         return 0
 
 
-def write_csv(path: str, rows: List[Dict[str, str]]) -> None:
-    """Kayıtları CSV dosyasına yazar."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    exists = os.path.exists(path)
-    mode = "a" if exists else "w"
+def load_existing_pairs(path: str) -> Set[str]:
+    """Mevcut AI kayıtlarının pair_id'leri (yeniden yazılmış human URL'leri)."""
+    if not os.path.exists(path):
+        return set()
     
-    with open(path, mode, newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, ["abstract_text", "source_url", "license_info", "label"])
-        if not exists:
-            writer.writeheader()
-        writer.writerows(rows)
+    try:
+        return {row["pair_id"] for row in read_records(path, ["pair_id"]) if row["pair_id"]}
+    except Exception as exc:
+        print(f"⚠ Mevcut dosya okuma hatası: {exc}")
+        return set()
 
 
-def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/raw/human_abstracts.csv") -> None:
+def write_records(path: str, rows: List[Dict[str, str]]) -> None:
+    """Kayıtları veri setinin sonuna ekler (.parquet: yeni parça dosyası, .csv: satır ekleme).
+
+    pair_id sütunu olmayan eski CSV'ye sütun önce boş olarak eklenir.
+    """
+    append_records(path, rows, FIELDNAMES)
+
+
+def generate_ai_abstracts(output: str, target: int, human_path: str = "data/raw/human_abstracts.parquet") -> None:
     """Gemini API kullanarak AI abstract'ları üretir."""
     api_key = os.getenv("GEMINI_API_KEY")
     
@@ -233,7 +203,7 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
             sys.exit(1)
     
     # Human abstract'larını yükle
-    human_abstracts = load_human_abstracts(human_csv_path)
+    human_abstracts = load_human_abstracts(human_path)
     
     if not human_abstracts:
         print("❌ Human abstract'ları yüklenemedi!")
@@ -242,6 +212,11 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
     existing_count = load_existing_count(output)
     current_total = existing_count
     
+    # Daha önce yeniden yazılmış human abstract'ları atla (kaldığı yerden devam)
+    done_pairs = load_existing_pairs(output)
+    if done_pairs:
+        human_abstracts = [item for item in human_abstracts if item[1] not in done_pairs]
+    
     if current_total >= target:
         print(f"✅ {current_total}/{target} AI kayıt mevcut")
         return
@@ -272,7 +247,8 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
             needed = min(ABSTRACTS_PER_REQUEST, target - current_total, len(human_abstracts_to_process) - human_index)
             
             # İşlenecek human abstract'ları al
-            batch_human_abstracts = human_abstracts_to_process[human_index:human_index + needed]
+            batch_human = human_abstracts_to_process[human_index:human_index + needed]
+            batch_human_abstracts = [abstract for abstract, _ in batch_human]
             
             # İstek başlangıcı log
             print(f"📤 İstek #{request_count + 1}: {needed} abstract işleniyor...", end=" ", flush=True)
@@ -298,18 +274,22 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
             # Başarılı istek log
             parsed_count = len(ai_abstracts)
             print(f"✅ {parsed_count}/{needed} abstract alındı ({elapsed:.1f}s)")
+            if parsed_count < needed:
+                print(f"   ⚠ {needed - parsed_count} abstract orijinaliyle eşleştirilemedi, atlandı")
             
             # Her AI abstract için kayıt oluştur
             added_count = 0
-            for ai_abstract in ai_abstracts:
+            for index, ai_abstract in ai_abstracts:
                 if current_total >= target:
                     break
                     
+                # pair_id: orijinal human makalenin URL'si; train/test ayrımı çifti bölmez
                 record = {
                     "abstract_text": ai_abstract,
                     "source_url": "https://ai-generated-content/research/abstract",
                     "license_info": DEFAULT_LICENSE,
                     "label": "AI",
+                    "pair_id": batch_human[index][1],
                 }
                 
                 buffer.append(record)
@@ -325,7 +305,7 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
             
             # Her BATCH_SIZE kayıtta veya SAVE_INTERVAL saniyede bir kaydet
             if len(buffer) >= BATCH_SIZE or (time.time() - last_save) > SAVE_INTERVAL:
-                write_csv(output, buffer)
+                write_records(output, buffer)
                 buffer.clear()
                 last_save = time.time()
     
@@ -337,7 +317,9 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
         traceback.print_exc()
     finally:
         if buffer:
-            write_csv(output, buffer)
+            write_records(output, buffer)
+        # Ekleme parçaları tek Parquet dosyasında birleştirilir
+        compact(output)
 
     print(f"✅ Tamamlandı: {min(current_total, target)}/{target} ({request_count} istek)")
 
@@ -345,8 +327,9 @@ def generate_ai_abstracts(output: str, target: int, human_csv_path: str = "data/
 def main() -> None:
     """Ana fonksiyon."""
     parser = argparse.ArgumentParser(description="Gemini API ile Human abstract'larını AI tarzında yeniden yazar")
-    parser.add_argument("--output", default="data/raw/ai_abstracts.csv", help="Çıktı CSV dosyası")
-    parser.add_argument("--human-input", default="data/raw/human_abstracts.csv", help="Human abstract CSV dosyası")
+    parser.add_argument("--output", default="data/raw/ai_abstracts.parquet", help="Çıktı veri seti (.parquet ya da .csv)")
+    parser.add_argument("--human-input", default="data/raw/human_abstracts.parquet",
+                        help="Human abstract veri seti (.parquet ya da .csv)")
     parser.add_argument("--target", type=int, default=3000, help="Hedef kayıt sayısı")
     parser.add_argument("--reset", action="store_true", help="Mevcut AI verilerini sil ve baştan başla")
     args = parser.parse_args()
@@ -354,7 +337,10 @@ def main() -> None:
     # Reset seçeneği
     if args.reset and os.path.exists(args.output):
         print(f"🗑️  Mevcut AI verileri siliniyor: {args.output}")
-        os.remove(args.output)
+        if os.path.isdir(args.output):
+            shutil.rmtree(args.output)  # henüz birleştirilmemiş Parquet parçaları
+        else:
+            os.remove(args.output)
         print(f"✅ Dosya silindi, baştan başlanıyor...")
     
     generate_ai_abstracts(args.output, args.target, args.human_input)
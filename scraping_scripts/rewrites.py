@@ -0,0 +1,90 @@
+"""Gemini cevabındaki yeniden yazılmış abstract'ları orijinallerle eşleştirir.
+
+Cevap "Rewritten Abstract N:" gibi numaralı bölümlerden oluşur; numara
+batch'teki orijinali gösterir ve AI satırının ``pair_id``'si ondan yazılır.
+Hangi orijinale ait olduğu bilinmeyen metin döndürülmez: bağlantısız AI
+satırı train/test ayrımında çifti bölebilir.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+MIN_CHARS = 100  # Bundan kısa bölümler başlık / açıklama sayılır
+MAX_WORDS = 400
+
+# Güvenilirlik sırasıyla; ilk eşleşen kullanılır
+LABELLED_PATTERNS = (
+    r'Rewritten\s+Abstract\s+(\d+)[:\-]?\s*',
+    r'Abstract\s+(\d+)[:\-]?\s*',
+)
+# Abstract içindeki numaralı listeleri de böler; sadece bölüm sayısı tutarsa kabul edilir
+BARE_NUMBER_PATTERN = r'\n\s*(\d+)[\.\)]\s*'
+
+
+def split_numbered(text: str, pattern: str) -> List[Tuple[int, str]]:
+    """Numaralı bölümleri (0 tabanlı numara, metin) olarak ayırır; ``pattern`` numarayı yakalamalı."""
+    pieces = re.split(pattern, text, flags=re.IGNORECASE)
+    if len(pieces) <= 1:
+        return []
+    return [(int(number) - 1, part.strip()) for number, part in zip(pieces[1::2], pieces[2::2]) if part.strip()]
+
+
+def clean_rewrite(part: str) -> Optional[str]:
+    """Bölümden başlık kalıntılarını atar ve uzunluğu sınırlar; abstract sayılamayacak kadar kısaysa None."""
+    abstract = part.replace('"""', '').strip()
+    for prefix in ("Rewritten Abstract:", "Abstract:", "ABSTRACT:"):
+        abstract = abstract.replace(prefix, "").strip()
+    if len(abstract) < MIN_CHARS:
+        return None
+    words = abstract.split()
+    if len(words) > MAX_WORDS:
+        abstract = " ".join(words[:MAX_WORDS])
+    return abstract
+
+
+def _cleaned(parts: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+    cleaned = []
+    for index, part in parts:
+        abstract = clean_rewrite(part)
+        if abstract is not None:
+            cleaned.append((index, abstract))
+    return cleaned
+
+
+def _is_complete(parts: List[Tuple[int, str]], count: int) -> bool:
+    """Her orijinal için tam bir bölüm var mı (numaralar 0..count-1, tekrar yok)."""
+    return sorted(index for index, _ in parts) == list(range(count))
+
+
+def parse_rewrites(text: str, count: int) -> List[Tuple[int, str]]:
+    """Cevaptan (orijinalin batch içindeki indeksi, yeniden yazılmış metin) çiftlerini çıkarır.
+
+    Etiketli numaralar ("Rewritten Abstract N", "Abstract N") doğrudan
+    indekstir. Sadece "N." / "N)" ile numaralanmış cevap ancak ilk numaradan
+    önce abstract yoksa ve bölümler 1..count'u birer kez kapsıyorsa kabul
+    edilir; abstract içindeki numaralı liste bölüm sayılmaz. Numarasız
+    cevapta sıra eşleşmesi yalnızca bölüm sayısı ``count``'a eşitse yapılır.
+    Aralık dışındaki ya da birden fazla bölümde geçen numaralar atlanır.
+    """
+    text = text.strip()
+    parts: List[Tuple[int, str]] = []
+    for pattern in LABELLED_PATTERNS:
+        parts = split_numbered(text, pattern)
+        if parts:
+            break
+    else:
+        numbered = _cleaned(split_numbered("\n" + text, BARE_NUMBER_PATTERN))
+        preamble = re.split(BARE_NUMBER_PATTERN, "\n" + text, maxsplit=1)[0]
+        if len(preamble.strip()) < MIN_CHARS and _is_complete(numbered, count):
+            parts = numbered
+        else:
+            paragraphs = [p for p in text.split('\n\n') if len(p.strip()) > MIN_CHARS]
+            if len(paragraphs) == count:
+                parts = list(enumerate(paragraphs))
+            elif count == 1 and text:
+                parts = [(0, text)]
+
+    abstracts = _cleaned(parts)
+    seen = [index for index, _ in abstracts]
+    return [(index, abstract) for index, abstract in abstracts
+            if 0 <= index < count and seen.count(index) == 1]
@@ -0,0 +1,10 @@
+"""pytest ayarları: scraper'lar depo kökünden ``scraping_scripts.<modül>`` olarak içe aktarılır.
+
+Çalıştırma (depo kökünde):
+    python -m pytest -q scraping_scripts/tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -0,0 +1,52 @@
+"""Gemini cevaplarının orijinal abstract'larla eşleştirilmesi."""
+
+from scraping_scripts.rewrites import parse_rewrites, split_numbered
+
+
+def _abstract(i: int) -> str:
+    return f"In this work number {i} we propose a framework that leverages robust representations. " * 3
+
+
+def test_split_numbered_returns_zero_based_indices():
+    text = "Abstract 1: first part\nAbstract 2: second part"
+    assert split_numbered(text, r'Abstract\s+(\d+)[:\-]?\s*') == [(0, "first part"), (1, "second part")]
+    assert split_numbered("no numbers here", r'Abstract\s+(\d+)[:\-]?\s*') == []
+
+
+def test_labelled_reply_uses_numbers_not_order():
+    text = f"Rewritten Abstract 2:\n{_abstract(2)}\n\nRewritten Abstract 1:\n{_abstract(1)}"
+    assert parse_rewrites(text, 2) == [(1, _abstract(2).strip()), (0, _abstract(1).strip())]
+
+
+def test_labelled_reply_drops_out_of_range_and_duplicate_numbers():
+    text = (f"Rewritten Abstract 1: {_abstract(1)}\nRewritten Abstract 1: {_abstract(9)}\n"
+            f"Rewritten Abstract 2: {_abstract(2)}\nRewritten Abstract 7: {_abstract(7)}")
+    assert parse_rewrites(text, 3) == [(1, _abstract(2).strip())]
+
+
+def test_short_parts_are_dropped():
+    text = f"Rewritten Abstract 1: too short\nRewritten Abstract 2: {_abstract(2)}"
+    assert parse_rewrites(text, 2) == [(1, _abstract(2).strip())]
+
+
+def test_bare_numbers_accepted_when_they_cover_the_batch():
+    text = f"1. {_abstract(1)}\n2. {_abstract(2)}"
+    assert parse_rewrites(text, 2) == [(0, _abstract(1).strip()), (1, _abstract(2).strip())]
+
+
+def test_bare_numbers_inside_abstract_do_not_create_pairs():
+    # Abstract içindeki numaralı liste bölüm sanılırsa yanlış pair_id yazılırdı
+    listing = f"{_abstract(1)}\n1) a first contribution that is listed here\n2) a second contribution"
+    text = f"{listing}\n\n{_abstract(2)}\n\n{_abstract(3)}"
+    assert parse_rewrites(text, 2) == []
+
+
+def test_unnumbered_reply_paired_by_position_only_when_count_matches():
+    text = f"{_abstract(1)}\n\n{_abstract(2)}"
+    assert parse_rewrites(text, 2) == [(0, _abstract(1).strip()), (1, _abstract(2).strip())]
+    assert parse_rewrites(text, 3) == []
+
+
+def test_single_unnumbered_reply_pairs_with_single_original():
+    assert parse_rewrites(f'"""{_abstract(1)}"""', 1) == [(0, _abstract(1).strip())]
+    assert parse_rewrites(_abstract(1), 2) == []